@@ -0,0 +1,111 @@
+import os
+import sys
+import time
+import random
+import argparse
+import subprocess
+
+from src.core.fleet import FleetAgent, FleetCollector
+from src.core.system_monitor import SystemSnapshot
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def walk(value, step, low=0.0, high=100.0):
+    return min(max(value + random.uniform(-step, step), low), high)
+
+def run_agents(port, hosts, rate, duration, prefix, gpus):
+    agents = [FleetAgent(("127.0.0.1", port), f"{prefix}-{i:03d}") for i in range(hosts)]
+    states = [[random.uniform(5, 60), random.uniform(20, 70), random.uniform(40, 70), [random.uniform(0, 90) for _ in range(gpus)]] for _ in range(hosts)]
+    gpu_names = [f"Fake GPU {i}" for i in range(gpus)]
+    interval = 1.0 / rate
+    deadline = time.monotonic() + duration
+    next_tick = time.monotonic()
+    while time.monotonic() < deadline:
+        now = time.time()
+        for agent, state in zip(agents, states):
+            state[0] = walk(state[0], 8)
+            state[1] = walk(state[1], 0.5)
+            state[2] = walk(state[2], 1, 30, 95)
+            state[3] = [walk(usage, 10) for usage in state[3]]
+            agent.send(SystemSnapshot(
+                timestamp=now,
+                time_text="",
+                cpu_name="Fake CPU",
+                cpu_usage=state[0],
+                ram_usage=state[1],
+                cpu_temp=state[2],
+                gpu_info=tuple(zip(gpu_names, state[3])),
+                gpu_temps=tuple((name, 50.0) for name in gpu_names) or None
+            ))
+        next_tick += interval
+        time.sleep(max(next_tick - time.monotonic(), 0))
+    sent = sum(agent.sent for agent in agents)
+    sent_bytes = sum(agent.sent_bytes for agent in agents)
+    for agent in agents:
+        agent.close()
+    print(f"{sent} {sent_bytes}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run a fleet collector on localhost against several agent processes.")
+    parser.add_argument("--processes", type=int, default=4, help="number of agent processes")
+    parser.add_argument("--hosts", type=int, default=50, help="simulated hosts per agent process")
+    parser.add_argument("--rate", type=float, default=1.0, help="snapshots per host per second")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--gpus", type=int, default=1)
+    parser.add_argument("--headless-agents", type=int, default=0, help="also run this many real 'main.py --headless --fleet-agent' processes")
+    parser.add_argument("--agent", type=int, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--prefix", default="host", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.agent is not None:
+        run_agents(args.agent, args.hosts, args.rate, args.duration, args.prefix, args.gpus)
+        return 0
+
+    collector = FleetCollector("127.0.0.1", 0)
+    collector.start()
+    port = collector.port
+    children = []
+    for i in range(args.processes):
+        children.append(subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.bench_fleet", "--agent", str(port), "--hosts", str(args.hosts), "--rate", str(args.rate),
+             "--duration", str(args.duration), "--gpus", str(args.gpus), "--prefix", f"proc{i}"],
+            cwd=ROOT, stdout=subprocess.PIPE, text=True
+        ))
+    headless = []
+    for i in range(args.headless_agents):
+        headless.append(subprocess.Popen(
+            [sys.executable, "main.py", "--headless", "--output", "none", "--interval-ms", str(int(1000 / args.rate)),
+             "--fleet-agent", f"127.0.0.1:{port}", "--fleet-name", f"headless-{i:02d}"],
+            cwd=ROOT, stdout=subprocess.DEVNULL
+        ))
+
+    cpu_started = time.process_time()
+    started = time.monotonic()
+    peak_hosts = 0
+    while any(child.poll() is None for child in children) or (not children and time.monotonic() - started < args.duration):
+        time.sleep(0.5)
+        peak_hosts = max(peak_hosts, len(collector.latest()))
+    time.sleep(0.5)
+    elapsed = time.monotonic() - started
+    cpu = time.process_time() - cpu_started
+    for child in headless:
+        child.terminate()
+        child.wait(5)
+    collector.stop()
+
+    sent = sent_bytes = 0
+    for child in children:
+        out, _ = child.communicate()
+        values = out.split()
+        if len(values) == 2:
+            sent += int(values[0])
+            sent_bytes += int(values[1])
+    stats = collector.stats()
+    packets = stats["packets"]
+    print(f"hosts seen {peak_hosts}, packets {packets} ({packets / elapsed:.0f}/s), sent by agents {sent}, lost {stats['lost']}, invalid {stats['invalid']}")
+    print(f"keyframes {stats['keyframes']}, deltas {stats['deltas']}, bytes/packet {stats['bytes'] / max(packets, 1):.1f}")
+    print(f"decode {stats['decode_ns'] / max(packets, 1) / 1000:.2f}us/packet, collector process CPU {cpu / elapsed * 100:.1f}%, publishes {stats['publishes']}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,233 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import tracemalloc
+
+from benchmarks.fakes import CannedPsutil, SpawnCounter, install_fake_lhm, make_lhm_computer
+from tests.helpers import write_fake_nvidia_smi, write_fake_sysfs, write_fake_procfs
+from src.core import system_monitor
+from src.core.system_monitor import SystemMonitor
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "monitor.json")
+
+SCENARIOS = {
+    "psutil": {"lhm": None, "nvidia_gpus": 0, "sysfs": {"amd": 0, "cpu_chip": "coretemp"}},
+    "nvidia_smi": {"lhm": None, "nvidia_gpus": 2, "sysfs": {"amd": 0, "cpu_chip": "coretemp"}},
+    "sysfs": {"lhm": None, "nvidia_gpus": 0, "sysfs": {"amd": 1, "i915": 1, "cpu_chip": "k10temp", "cores": 16}, "procfs": 16, "psutil_latency_us": 80},
+    "lhm_small": {"lhm": {"cpu_cores": 8, "gpus": 1}, "nvidia_gpus": 0, "sysfs": None},
+    "lhm_large": {"lhm": {"cpu_cores": 64, "gpus": 4, "extra_sensors": 40, "storage": 4}, "nvidia_gpus": 0, "sysfs": None}
+}
+
+GETTERS = {
+    "get_cpu_usage": lambda m: m.get_cpu_usage(),
+    "get_ram_usage": lambda m: m.get_ram_usage(),
+    "get_cpu_temperature": lambda m: m.get_cpu_temperature(),
+    "get_gpu_temperature": lambda m: m.get_gpu_temperature(),
+    "get_gpu_info": lambda m: m.get_gpu_info(),
+    "get_current_time": lambda m: m.get_current_time(),
+    "cpu_name": lambda m: m.cpu_name,
+    "sample": lambda m: m.sample(),
+    "sample_metrics_cpu": lambda m: m.sample_metrics(frozenset(("clock", "cpu"))),
+    "sample_metrics_io": lambda m: m.sample_metrics(frozenset(("net", "disk")))
+}
+
+LATENCY_TOLERANCE = 0.5
+LATENCY_SLACK_US = 2.0
+ALLOC_TOLERANCE = 0.25
+ALLOC_SLACK_BYTES = 512
+
+def percentile(values, q):
+    values = sorted(values)
+    position = (len(values) - 1) * q / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+def time_calls(func, iterations, warmup=20):
+    for _ in range(warmup):
+        func()
+    durations = []
+    for _ in range(iterations):
+        started = time.perf_counter_ns()
+        func()
+        durations.append((time.perf_counter_ns() - started) / 1000)
+    return {"median_us": round(percentile(durations, 50), 2), "p95_us": round(percentile(durations, 95), 2)}
+
+def measure_allocations(tick, ticks):
+    tracemalloc.start()
+    try:
+        peaks = 0
+        started = tracemalloc.get_traced_memory()[0]
+        for _ in range(ticks):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            tick()
+            peaks += tracemalloc.get_traced_memory()[1] - before
+        retained = tracemalloc.get_traced_memory()[0] - started
+    finally:
+        tracemalloc.stop()
+    return round(peaks / ticks), round(retained / ticks, 1)
+
+def make_monitor(scenario, fake_bin, sysfs_root):
+    monitor = SystemMonitor(nvidia_smi_interval_ms=100, defer_lhm=True, sysfs_root=sysfs_root)
+    monitor.wait_backend_ready(5.0)
+    monitor._nvml.close()
+    if scenario["lhm"] is not None:
+        computer = make_lhm_computer(**scenario["lhm"])
+        install_fake_lhm(monitor, computer)
+        return monitor, computer
+    with monitor._lock:
+        monitor._lhm_initialized = False
+        monitor._lhm_computer = None
+        monitor._lhm_update_list = []
+        monitor._sensor_index = {}
+        monitor._lhm_gpus = []
+        monitor.clear_cache()
+    if scenario["nvidia_gpus"]:
+        monitor.get_gpu_info()
+        deadline = time.monotonic() + 5.0
+        while len(monitor.get_gpu_details()) < scenario["nvidia_gpus"] and time.monotonic() < deadline:
+            time.sleep(0.05)
+        monitor.clear_cache()
+    return monitor, None
+
+def ui_available():
+    try:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PySide6.QtWidgets import QApplication
+    except ImportError:
+        return False
+    QApplication.instance() or QApplication(sys.argv[:1])
+    return True
+
+def make_window(config_dir):
+    from src.core.config_manager import ConfigManager
+    from src.ui.overlay_window import OverlayWindow
+    config_manager = ConfigManager(config_dir)
+    config_manager.config = dict(config_manager.default_config)
+    config_manager.config.update({"show_cpu_temp": True, "show_gpu_temp": True, "dynamic_colors": True})
+    window = OverlayWindow(config_manager)
+    window.shutdown()
+    window.show()
+    return window
+
+def run_scenario(name, scenario, iterations, ui):
+    fake_bin = tempfile.mkdtemp(prefix="overlay-bench-")
+    if scenario["nvidia_gpus"]:
+        write_fake_nvidia_smi(fake_bin, scenario["nvidia_gpus"])
+    sysfs_root = os.path.join(fake_bin, "root")
+    os.makedirs(sysfs_root)
+    if scenario["sysfs"]:
+        write_fake_sysfs(sysfs_root, **scenario["sysfs"])
+    if scenario.get("procfs"):
+        write_fake_procfs(sysfs_root, scenario["procfs"])
+    saved_path = os.environ.get("PATH", "")
+    saved_psutil = system_monitor.psutil
+    canned = CannedPsutil(latency_us=scenario.get("psutil_latency_us", 0))
+    os.environ["PATH"] = fake_bin
+    system_monitor.psutil = canned
+    monitor = None
+    window = None
+    try:
+        if ui:
+            window = make_window(os.path.join(fake_bin, "config"))
+        monitor, computer = make_monitor(scenario, fake_bin, sysfs_root)
+        result = {"getters": {}}
+        for getter, func in GETTERS.items():
+            result["getters"][getter] = time_calls(lambda: func(monitor), iterations)
+
+        if window is not None:
+            tick = lambda: window.render_snapshot(monitor.sample())
+        else:
+            tick = monitor.sample
+        result["update_stats"] = time_calls(tick, iterations)
+
+        updates_before = computer.updates() if computer else 0
+        calls_before = canned.calls
+        with SpawnCounter() as spawns:
+            for _ in range(iterations):
+                monitor.sample()
+        result["spawns_per_tick"] = round(spawns.spawns / iterations, 3)
+        result["lhm_updates_per_tick"] = round(((computer.updates() if computer else 0) - updates_before) / iterations, 2)
+        result["psutil_calls_per_tick"] = round((canned.calls - calls_before) / iterations, 2)
+        result["alloc_peak_bytes_per_tick"], result["retained_bytes_per_tick"] = measure_allocations(monitor.sample, iterations)
+        result["providers"] = monitor.providers.selected()
+        return result
+    finally:
+        if window is not None:
+            window.close()
+        if monitor is not None:
+            monitor.close()
+        system_monitor.psutil = saved_psutil
+        os.environ["PATH"] = saved_path
+
+def compare(results, baseline):
+    regressions = []
+    for name, result in results["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if base is None:
+            continue
+        timings = [(f"{name}.{getter}", value, base["getters"].get(getter)) for getter, value in result["getters"].items()]
+        timings.append((f"{name}.update_stats", result["update_stats"], base.get("update_stats")))
+        for label, value, old in timings:
+            if not old:
+                continue
+            limit = old["median_us"] * (1 + LATENCY_TOLERANCE) + LATENCY_SLACK_US
+            if value["median_us"] > limit:
+                regressions.append(f"{label}: median {value['median_us']}us > {old['median_us']}us baseline")
+        for key in ("spawns_per_tick", "lhm_updates_per_tick", "psutil_calls_per_tick"):
+            if key in base and result[key] > base[key] + 0.01:
+                regressions.append(f"{name}.{key}: {result[key]} > {base[key]} baseline")
+        key = "alloc_peak_bytes_per_tick"
+        if key in base and result[key] > base[key] * (1 + ALLOC_TOLERANCE) + ALLOC_SLACK_BYTES:
+            regressions.append(f"{name}.{key}: {result[key]} > {base[key]} baseline")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the SystemMonitor hot path against fake backends.")
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS))
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--no-ui", action="store_true", help="time update_stats without rendering the overlay")
+    args = parser.parse_args(argv)
+
+    ui = not args.no_ui and ui_available()
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "ui": ui,
+        "scenarios": {}
+    }
+    for name in args.scenario or SCENARIOS:
+        result = run_scenario(name, SCENARIOS[name], args.iterations, ui)
+        results["scenarios"][name] = result
+        getters = result["getters"]
+        print(f"{name}: sample {getters['sample']['median_us']}us, update_stats {result['update_stats']['median_us']}us, "
+              f"spawns/tick {result['spawns_per_tick']}, alloc/tick {result['alloc_peak_bytes_per_tick']}B")
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("no baseline found, run with --save to create one")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if not regressions:
+        print("no regressions against baseline")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
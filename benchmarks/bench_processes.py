@@ -0,0 +1,52 @@
+import sys
+import time
+import argparse
+import tempfile
+
+import psutil
+
+from tests.helpers import write_fake_proc
+from src.core.process_table import ProcessTable
+
+def time_collect(table, rounds):
+    table.collect()
+    started = time.perf_counter_ns()
+    for _ in range(rounds):
+        table.collect()
+    return (time.perf_counter_ns() - started) / rounds / 1000
+
+def naive_collect(top_n):
+    rows = []
+    for process in psutil.process_iter(["pid", "name", "cpu_percent", "memory_info"]):
+        info = process.info
+        rows.append((info["pid"], info["name"], info["cpu_percent"] or 0.0, info["memory_info"].rss if info["memory_info"] else 0))
+    rows.sort(key=lambda row: row[2], reverse=True)
+    by_cpu = rows[:top_n]
+    rows.sort(key=lambda row: row[3], reverse=True)
+    return by_cpu, rows[:top_n]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the incremental process table against a naive process_iter pass.")
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--processes", type=int, action="append", help="size of the fake /proc tree (repeatable)")
+    args = parser.parse_args(argv)
+
+    print(f"{'source':<28}{'processes':>10}{'us/collect':>14}")
+    if sys.platform.startswith("linux"):
+        for count in args.processes or [500, 5000]:
+            root = write_fake_proc(tempfile.mkdtemp(prefix="overlay-proc-"), count)
+            table = ProcessTable(args.top, proc_root=root)
+            print(f"{'procfs (fake /proc)':<28}{count:>10}{time_collect(table, args.rounds):>14.1f}")
+        table = ProcessTable(args.top)
+        print(f"{'procfs (/proc)':<28}{len(psutil.pids()):>10}{time_collect(table, args.rounds):>14.1f}")
+    table = ProcessTable(args.top, procfs=False)
+    print(f"{'psutil cached Process':<28}{len(psutil.pids()):>10}{time_collect(table, args.rounds):>14.1f}")
+    naive_collect(args.top)
+    started = time.perf_counter_ns()
+    for _ in range(args.rounds):
+        naive_collect(args.top)
+    print(f"{'psutil process_iter':<28}{len(psutil.pids()):>10}{(time.perf_counter_ns() - started) / args.rounds / 1000:>14.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import os
+import sys
+import time
+import tempfile
+import argparse
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+from src.core.config_manager import ConfigManager
+from src.core.system_monitor import SystemSnapshot
+from src.ui.overlay_window import OverlayWindow
+
+def make_snapshots(count, gpus):
+    snapshots = []
+    for i in range(count):
+        snapshots.append(SystemSnapshot(
+            timestamp=float(i),
+            time_text=f"12:{(i // 60) % 60:02d}:{i % 60:02d}",
+            cpu_name="AMD Ryzen 9 7950X",
+            cpu_usage=(i * 7) % 100 + 0.5,
+            ram_usage=40.0 + (i % 10) / 10,
+            cpu_temp=45.0 + (i * 3) % 40,
+            gpu_info=tuple((f"NVIDIA GeForce RTX 40{g}0", float((i * (g + 3)) % 100)) for g in range(gpus)),
+            gpu_temps=tuple((f"NVIDIA GeForce RTX 40{g}0", 50.0 + (i + g) % 30) for g in range(gpus))
+        ))
+    return snapshots
+
+def run_engine(engine, snapshots, options):
+    config_manager = ConfigManager(tempfile.mkdtemp(prefix="overlay-bench-"))
+    config_manager.config = dict(config_manager.default_config)
+    config_manager.config.update(options)
+    config_manager.config["render_engine"] = engine
+    window = OverlayWindow(config_manager)
+    window.shutdown()
+    window.show()
+    for snapshot in snapshots[:10]:
+        window.render_snapshot(snapshot)
+        window.repaint()
+    started = time.perf_counter_ns()
+    for snapshot in snapshots:
+        window.render_snapshot(snapshot)
+        window.repaint()
+    elapsed = time.perf_counter_ns() - started
+    size = window.size()
+    window.close()
+    return elapsed / len(snapshots) / 1000, (size.width(), size.height())
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the label and painter overlay render engines offscreen.")
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--gpus", type=int, default=2)
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    snapshots = make_snapshots(args.frames, args.gpus)
+    scenarios = {
+        "plain": {"show_cpu_temp": True, "show_gpu_temp": True},
+        "dynamic": {"show_cpu_temp": True, "show_gpu_temp": True, "dynamic_colors": True},
+        "color_only_value": {"show_cpu_temp": True, "show_gpu_temp": True, "dynamic_colors": True, "color_only_value": True}
+    }
+    print(f"{'scenario':<18}{'labels us/frame':>18}{'painter us/frame':>18}{'speedup':>10}")
+    for name, options in scenarios.items():
+        labels_us, _ = run_engine("labels", snapshots, options)
+        painter_us, _ = run_engine("painter", snapshots, options)
+        print(f"{name:<18}{labels_us:>18.1f}{painter_us:>18.1f}{labels_us / painter_us:>9.1f}x")
+    app.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+import subprocess
+import time
+import types
+from collections import namedtuple
+
+HardwareType = types.SimpleNamespace(Cpu=1, Memory=2, GpuNvidia=3, GpuAmd=4, GpuIntel=5, Motherboard=6, Storage=7)
+SensorType = types.SimpleNamespace(Load=1, Temperature=2, Clock=3, Power=4, Voltage=5)
+FAKE_HARDWARE = types.SimpleNamespace(HardwareType=HardwareType, SensorType=SensorType)
+
+
+class FakeSensor:
+    def __init__(self, sensor_type, name, value):
+        self.SensorType = sensor_type
+        self.Name = name
+        self.Value = value
+
+
+class FakeHardware:
+    def __init__(self, hardware_type, name, sensors, sub_hardware=()):
+        self.HardwareType = hardware_type
+        self.Name = name
+        self.Sensors = sensors
+        self.SubHardware = list(sub_hardware)
+        self.updates = 0
+
+    def Update(self):
+        self.updates += 1
+        for sensor in self.Sensors:
+            if sensor.Value is not None and sensor.SensorType == SensorType.Load:
+                sensor.Value = (sensor.Value + 7.0) % 100.0
+
+
+class FakeComputer:
+    def __init__(self, hardware):
+        self.Hardware = hardware
+
+    def Close(self):
+        pass
+
+    def updates(self):
+        total = 0
+        for hw in self.Hardware:
+            total += hw.updates + sum(sub.updates for sub in hw.SubHardware)
+        return total
+
+
+def make_lhm_computer(cpu_cores=8, gpus=1, extra_sensors=0, storage=0):
+    cpu_sensors = [FakeSensor(SensorType.Load, "CPU Total", 12.5)]
+    for core in range(cpu_cores):
+        cpu_sensors.append(FakeSensor(SensorType.Load, f"CPU Core #{core + 1}", 10.0 + core))
+        cpu_sensors.append(FakeSensor(SensorType.Temperature, f"CPU Core #{core + 1}", 55.0 + core % 5))
+        cpu_sensors.append(FakeSensor(SensorType.Clock, f"CPU Core #{core + 1}", 4200.0))
+    cpu_sensors.append(FakeSensor(SensorType.Temperature, "CPU Package", 61.0))
+    cpu_sensors += [FakeSensor(SensorType.Voltage, f"Voltage #{i}", 1.2) for i in range(extra_sensors)]
+    hardware = [
+        FakeHardware(HardwareType.Cpu, "AMD Ryzen 9 7950X", cpu_sensors),
+        FakeHardware(HardwareType.Memory, "Generic Memory", [FakeSensor(SensorType.Load, "Memory", 40.0)])
+    ]
+    for i in range(gpus):
+        hardware.append(FakeHardware(HardwareType.GpuNvidia, f"NVIDIA GeForce RTX 40{9 - i}0", [
+            FakeSensor(SensorType.Load, "GPU Core", 30.0 + i),
+            FakeSensor(SensorType.Temperature, "GPU Core", 50.0 + i),
+            FakeSensor(SensorType.Load, "GPU Memory", 20.0),
+            FakeSensor(SensorType.Power, "GPU Package", 120.0)
+        ] + [FakeSensor(SensorType.Clock, f"GPU Clock #{j}", 2500.0) for j in range(extra_sensors)]))
+    for i in range(storage):
+        hardware.append(FakeHardware(HardwareType.Storage, f"NVMe {i}", [FakeSensor(SensorType.Temperature, "Composite", 40.0)]))
+    hardware.append(FakeHardware(HardwareType.Motherboard, "Board", [], [
+        FakeHardware(HardwareType.Motherboard, "SuperIO", [FakeSensor(SensorType.Voltage, f"Vin{i}", 1.0) for i in range(extra_sensors)])
+    ]))
+    return FakeComputer(hardware)
+
+
+def install_fake_lhm(monitor, computer):
+    with monitor._lock:
+        monitor._Hardware = FAKE_HARDWARE
+        monitor._lhm_computer = computer
+        monitor._build_sensor_index()
+        monitor._lhm_initialized = True
+        monitor.clear_cache()
+
+
+VirtualMemory = namedtuple("VirtualMemory", "total available percent used free")
+SwapMemory = namedtuple("SwapMemory", "total used free percent sin sout")
+NetIo = namedtuple("NetIo", "bytes_sent bytes_recv packets_sent packets_recv errin errout dropin dropout")
+DiskIo = namedtuple("DiskIo", "read_count write_count read_bytes write_bytes read_time write_time")
+
+
+class CannedPsutil:
+    def __init__(self, cpu_cores=8, latency_us=0):
+        self._cpu_cores = cpu_cores
+        self._latency_ns = latency_us * 1000
+        self._tick = 0
+        self.calls = 0
+
+    def _call(self):
+        self.calls += 1
+        if self._latency_ns:
+            deadline = time.perf_counter_ns() + self._latency_ns
+            while time.perf_counter_ns() < deadline:
+                pass
+
+    def cpu_percent(self, interval=None, percpu=False):
+        self._call()
+        self._tick += 1
+        if percpu:
+            return [float((self._tick + i) % 100) for i in range(self._cpu_cores)]
+        return float(self._tick * 7 % 100)
+
+    def cpu_count(self, logical=True):
+        return self._cpu_cores
+
+    def virtual_memory(self):
+        self._call()
+        return VirtualMemory(34359738368, 20615843020, 40.0, 13743895348, 20615843020)
+
+    def swap_memory(self):
+        self._call()
+        return SwapMemory(8589930496, 397930496, 8192000000, 4.6, 0, 0)
+
+    def net_io_counters(self, pernic=False):
+        self._call()
+        self._tick += 1
+        return {name: NetIo(self._tick * 4096, self._tick * 65536, self._tick * 8, self._tick * 64, 0, 0, 0, 0) for name in ("lo", "eth0", "wlan0")}
+
+    def disk_io_counters(self, perdisk=False):
+        self._call()
+        self._tick += 1
+        return {name: DiskIo(self._tick * 20, self._tick * 10, self._tick * 81920, self._tick * 40960, 0, 0) for name in ("nvme0n1", "sda")}
+
+    def __getattr__(self, name):
+        raise AttributeError(f"canned psutil does not provide {name}")
+
+
+class SpawnCounter:
+    def __init__(self):
+        self.spawns = 0
+        self._original = None
+
+    def __enter__(self):
+        counter = self
+        original = subprocess.Popen
+        self._original = original
+
+        class CountingPopen(original):
+            def __init__(self, *args, **kwargs):
+                counter.spawns += 1
+                super().__init__(*args, **kwargs)
+
+        subprocess.Popen = CountingPopen
+        return self
+
+    def __exit__(self, *exc):
+        subprocess.Popen = self._original
+        return False
@@ -1,6 +1,14 @@
 import sys
+
+if __name__ == "__main__" and "--headless" in sys.argv[1:]:
+    from src.core.headless import main as headless_main
+    sys.exit(headless_main(sys.argv[1:]))
+
 import shutil
 import types
+import argparse
+import functools
+import subprocess
 import setuptools
 import json
 import os
@@ -20,7 +28,7 @@ def run_as_admin():
         if os.path.exists(pythonw_exe):
             python_exe = pythonw_exe
         working_dir = os.path.dirname(script)
-        args = f'"{script}"'
+        args = subprocess.list2cmdline([script] + sys.argv[1:])
         ret = ctypes.windll.shell32.ShellExecuteW(
             None, "runas", python_exe, args, working_dir, 1
         )
@@ -49,7 +57,11 @@ from src.ui.settings_dialog import SettingsDialog
 from src.core.config_manager import ConfigManager
 from src.core.hotkey_manager import HotkeyManager
 from src.core.update_checker import UpdateChecker
-from src.core.config_manager import APP_VERSION
+from src.core.metrics_exporter import MetricsExporter
+from src.core.monitor_service import MonitorService
+from src.core.tick_profiler import format_duration
+from src.core.session_recorder import SessionRecorder, ReplayMonitor
+from src.core.config_manager import APP_VERSION, APP_NAME
 from src.utils.translations import TRANSLATIONS
 
 def create_tray_icon(app, window, config_manager, hotkey_manager):
@@ -74,12 +86,32 @@ def create_tray_icon(app, window, config_manager, hotkey_manager):
     settings_action.triggered.connect(lambda: open_settings(window, config_manager, hotkey_manager))
     menu.addAction(settings_action)
 
+    timing_menu = menu.addMenu(trans["tick_timing"])
+
+    def refresh_timing_menu():
+        profiler = window.profiler
+        timing_menu.menuAction().setVisible(profiler is not None)
+        timing_menu.clear()
+        if profiler is None:
+            return
+        for stage, us in profiler.summary():
+            action = timing_menu.addAction(f"{trans.get('tick_' + stage, stage)}: {format_duration(us)}")
+            action.setEnabled(False)
+        timing_menu.addSeparator()
+        dump_action = timing_menu.addAction(trans["save_tick_dump"])
+        dump_action.triggered.connect(lambda: profiler.dump(os.path.join(config_manager.config_dir, "tick_profile.json"), window.diagnostics()))
+
+    refresh_timing_menu()
+    menu.aboutToShow.connect(refresh_timing_menu)
+
     exit_action = QAction(trans["exit"], app)
     exit_action.triggered.connect(app.quit)
     menu.addAction(exit_action)
 
     tray_icon.setContextMenu(menu)
 
+    window.ruleNotification.connect(lambda title, message: tray_icon.showMessage(title, message))
+
     tray_icon.activated.connect(lambda reason: open_settings(window, config_manager, hotkey_manager) if reason == QSystemTrayIcon.Trigger else None)
 
     tray_icon.show()
@@ -107,12 +139,36 @@ def open_settings(window, config_manager, hotkey_manager):
         _settings_dialog.raise_()
         _settings_dialog.activateWindow()
 
+def parse_session_args(argv):
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--record")
+    parser.add_argument("--replay")
+    parser.add_argument("--replay-speed", type=float, default=1.0)
+    parser.add_argument("--replay-loop", action="store_true")
+    args, _ = parser.parse_known_args(argv)
+    return args
+
 if __name__ == "__main__":
+    session_args = parse_session_args(sys.argv[1:])
+    QApplication.setApplicationName(APP_NAME)
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
 
+    if session_args.replay:
+        MonitorService.set_monitor_factory(functools.partial(
+            ReplayMonitor, session_args.replay, speed=session_args.replay_speed, loop=session_args.replay_loop
+        ))
+
     config_manager = ConfigManager()
     window = OverlayWindow(config_manager)
+    app.aboutToQuit.connect(window.shutdown)
+
+    interval_ms = config_manager.get("update_interval_ms", 1000)
+    if session_args.record:
+        recorder = SessionRecorder(session_args.record)
+        window.service.subscribe(recorder.record, interval_ms, cpu_temp=True, gpu=True, gpu_temp=True)
+        app.aboutToQuit.connect(lambda: window.service.unsubscribe(recorder.record))
+        app.aboutToQuit.connect(recorder.close)
     window.openSettingsRequested.connect(lambda: open_settings(window, config_manager, hotkey_manager))
     
     hotkey_manager = HotkeyManager()
@@ -125,6 +181,17 @@ if __name__ == "__main__":
 
     tray_icon = create_tray_icon(app, window, config_manager, hotkey_manager)
 
+    exporter = None
+    if config_manager.get("exporter_enabled", False):
+        try:
+            exporter = MetricsExporter(port=config_manager.get("exporter_port", 9464))
+            exporter.start()
+            window.service.subscribe(exporter.publish, interval_ms, cpu_temp=True, gpu=True, gpu_temp=True)
+            app.aboutToQuit.connect(lambda: window.service.unsubscribe(exporter.publish))
+            app.aboutToQuit.connect(exporter.stop)
+        except OSError:
+            exporter = None
+
     if config_manager.get("check_updates", True):
         update_checker = UpdateChecker("IPeralta-GLSL", "Overlay", APP_VERSION)
         update_checker.check_for_updates()
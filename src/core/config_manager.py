@@ -1,12 +1,30 @@
 import json
 import os
-from PySide6.QtCore import QStandardPaths
+import sys
+from src.core.rules import DEFAULT_RULES
 
 APP_VERSION = "1.0.0"
+APP_NAME = "Overlay"
+
+def config_base_dir():
+    if sys.platform == 'win32':
+        return os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    if sys.platform == 'darwin':
+        return os.path.expanduser("~/Library/Preferences")
+    return os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+
+def default_config_dir():
+    return os.path.join(config_base_dir(), APP_NAME)
+
+def legacy_config_dir():
+    name = os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else ""
+    if name.lower().endswith(".exe"):
+        name = name[:-4]
+    return os.path.join(config_base_dir(), name) if name and name != APP_NAME else None
 
 class ConfigManager:
-    def __init__(self):
-        self.config_dir = QStandardPaths.writableLocation(QStandardPaths.AppConfigLocation)
+    def __init__(self, config_dir=None):
+        self.config_dir = config_dir or default_config_dir()
         if not os.path.exists(self.config_dir):
             os.makedirs(self.config_dir)
         self.config_file = os.path.join(self.config_dir, "config.json")
@@ -17,6 +35,18 @@ class ConfigManager:
             "background_color": "#2b2b2b",
             "background_opacity": 0.8,
             "update_interval_ms": 1000,
+            "metric_intervals_ms": {"cpu_temp": 2000, "gpu_temp": 2000, "inventory": 0},
+            "hidden_sampling": "low",
+            "hidden_interval_ms": 5000,
+            "exporter_enabled": False,
+            "exporter_port": 9464,
+            "fleet_enabled": False,
+            "fleet_bind": "127.0.0.1",
+            "fleet_port": 9465,
+            "tick_profiling": False,
+            "show_tick_timing": False,
+            "history_samples": 300,
+            "render_engine": "labels",
             "position_x": 10,
             "position_y": 10,
             "position_preset": "top-left",
@@ -28,15 +58,27 @@ class ConfigManager:
             "show_gpu": True,
             "show_cpu_temp": False,
             "show_gpu_temp": False,
+            "show_net": False,
+            "show_disk": False,
+            "io_smoothing_ms": 2000,
+            "net_interfaces": [],
+            "disk_devices": [],
+            "show_processes": False,
+            "process_count": 5,
+            "process_interval_ms": 2000,
             "show_cpu_name": False,
             "show_gpu_name": False,
             "show_cpu_manufacturer": False,
             "show_gpu_manufacturer": False,
             "dynamic_colors": False,
             "color_only_value": False,
+            "show_sparklines": False,
+            "sparkline_width": 60,
+            "sparkline_samples": 60,
             "color_low": "#4CAF50",
             "color_medium": "#FFC107",
             "color_high": "#F44336",
+            "rules": [dict(rule) for rule in DEFAULT_RULES],
             "hotkey_toggle": "ctrl+shift+o",
             "hotkey_enabled": True,
             "autostart": False,
@@ -45,9 +87,13 @@ class ConfigManager:
         self.config = self.load_config()
 
     def load_config(self):
-        if os.path.exists(self.config_file):
+        config_file = self.config_file
+        legacy = legacy_config_dir()
+        if not os.path.exists(config_file) and legacy and self.config_dir == default_config_dir():
+            config_file = os.path.join(legacy, "config.json")
+        if os.path.exists(config_file):
             try:
-                with open(self.config_file, 'r') as f:
+                with open(config_file, 'r') as f:
                     return {**self.default_config, **json.load(f)}
             except Exception:
                 pass
@@ -0,0 +1,332 @@
+import json
+import math
+import os
+import select
+import socket
+import struct
+import threading
+import time
+from collections import namedtuple
+from src.core.session_recorder import snapshot_gpu_names, snapshot_values, values_snapshot
+
+MAGIC = b"OVLF"
+VERSION = 1
+KIND_KEY = 1
+KIND_DELTA = 2
+FRAME = struct.Struct("<4sBBIId")
+KEY_HEADER = struct.Struct("<HB")
+DELTA_MASK = struct.Struct("<Q")
+MAX_COLUMNS = 64
+MAX_GPUS = (MAX_COLUMNS - 3) // 2
+MAX_DATAGRAM = 65507
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 9465
+KEYFRAME_INTERVAL = 10
+HOST_TIMEOUT = 5.0
+PUBLISH_INTERVAL = 1.0
+POLL_INTERVAL = 0.25
+MISSING = -32768
+SCALE = 10.0
+
+FleetHost = namedtuple("FleetHost", ["name", "address", "snapshot", "age", "lost"])
+
+def quantize(value):
+    if value is None or math.isnan(value):
+        return MISSING
+    return max(min(int(round(value * SCALE)), 32767), -32767)
+
+def dequantize(value):
+    return None if value == MISSING else value / SCALE
+
+def parse_address(text, default_port=DEFAULT_PORT):
+    host, _, port = text.rpartition(":")
+    if not host:
+        return text, default_port
+    return host.strip("[]"), int(port)
+
+
+class FleetEncoder:
+    def __init__(self, name=None, keyframe_interval=KEYFRAME_INTERVAL):
+        self.name = name or socket.gethostname()
+        self._keyframe_interval = max(int(keyframe_interval), 1)
+        self._session = int.from_bytes(os.urandom(4), "little")
+        self._seq = 0
+        self._layout = None
+        self._values = None
+        self._since_key = 0
+
+    def encode(self, snapshot):
+        gpu_names = tuple(snapshot_gpu_names(snapshot)[:MAX_GPUS])
+        layout = (snapshot.cpu_name, gpu_names)
+        values = [quantize(value) for value in snapshot_values(snapshot, gpu_names)]
+        self._seq = (self._seq + 1) & 0xFFFFFFFF
+        if layout != self._layout or self._since_key >= self._keyframe_interval:
+            self._layout = layout
+            self._values = values
+            self._since_key = 1
+            header = json.dumps({"host": self.name, "cpu_name": snapshot.cpu_name, "gpus": gpu_names}).encode("utf-8")
+            return b"".join((
+                FRAME.pack(MAGIC, VERSION, KIND_KEY, self._session, self._seq, snapshot.timestamp),
+                KEY_HEADER.pack(len(header), len(values)),
+                header,
+                struct.pack(f"<{len(values)}h", *values)
+            ))
+        mask = 0
+        changed = []
+        previous = self._values
+        for i, value in enumerate(values):
+            if value != previous[i]:
+                mask |= 1 << i
+                changed.append(value)
+        self._values = values
+        self._since_key += 1
+        return b"".join((
+            FRAME.pack(MAGIC, VERSION, KIND_DELTA, self._session, self._seq, snapshot.timestamp),
+            DELTA_MASK.pack(mask),
+            struct.pack(f"<{len(changed)}h", *changed)
+        ))
+
+
+class FleetAgent:
+    def __init__(self, address, name=None, keyframe_interval=KEYFRAME_INTERVAL):
+        self._address = address
+        self._encoder = FleetEncoder(name, keyframe_interval)
+        self._socket = socket.socket(socket.AF_INET6 if ":" in address[0] else socket.AF_INET, socket.SOCK_DGRAM)
+        self._lock = threading.Lock()
+        self.sent = 0
+        self.sent_bytes = 0
+        self.errors = 0
+
+    @property
+    def name(self):
+        return self._encoder.name
+
+    def send(self, snapshot):
+        with self._lock:
+            if self._socket is None:
+                return
+            frame = self._encoder.encode(snapshot)
+            try:
+                self._socket.sendto(frame, self._address)
+            except OSError:
+                self.errors += 1
+                return
+            self.sent += 1
+            self.sent_bytes += len(frame)
+
+    def close(self):
+        with self._lock:
+            if self._socket is not None:
+                self._socket.close()
+                self._socket = None
+
+
+class _HostState:
+    __slots__ = ("name", "address", "cpu_name", "gpu_names", "values", "timestamp", "seen", "seq", "lost")
+
+    def __init__(self, name, address, cpu_name, gpu_names, values, timestamp, seen, seq):
+        self.name = name
+        self.address = address
+        self.cpu_name = cpu_name
+        self.gpu_names = gpu_names
+        self.values = values
+        self.timestamp = timestamp
+        self.seen = seen
+        self.seq = seq
+        self.lost = 0
+
+    def snapshot(self):
+        return values_snapshot(self.timestamp, self.cpu_name, self.gpu_names, [dequantize(value) for value in self.values])
+
+
+class FleetCollector:
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, callback=None, timeout=HOST_TIMEOUT, publish_interval=PUBLISH_INTERVAL, clock=time.monotonic):
+        self._host = host
+        self._port = port
+        self._callback = callback
+        self._timeout = timeout
+        self._publish_interval = publish_interval
+        self._clock = clock
+        self._socket = None
+        self._thread = None
+        self._running = False
+        self._buffer = bytearray(MAX_DATAGRAM)
+        self._view = memoryview(self._buffer)
+        self._hosts = {}
+        self._names = {}
+        self._dirty = False
+        self._latest = ()
+        self._stats = {"packets": 0, "bytes": 0, "keyframes": 0, "deltas": 0, "lost": 0, "unknown": 0, "invalid": 0, "expired": 0, "publishes": 0, "decode_ns": 0}
+
+    @property
+    def port(self):
+        return self._socket.getsockname()[1] if self._socket else self._port
+
+    def is_running(self):
+        return self._running
+
+    def latest(self):
+        return self._latest
+
+    def stats(self):
+        stats = dict(self._stats)
+        stats["hosts"] = len(self._hosts)
+        return stats
+
+    def start(self):
+        if self._running:
+            return
+        family = socket.AF_INET6 if ":" in self._host else socket.AF_INET
+        self._socket = socket.socket(family, socket.SOCK_DGRAM)
+        try:
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+        except OSError:
+            pass
+        self._socket.bind((self._host, self._port))
+        self._socket.setblocking(False)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="FleetCollector", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=2.0):
+        self._running = False
+        thread = self._thread
+        self._thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def _run(self):
+        next_publish = self._clock() + self._publish_interval
+        while self._running:
+            try:
+                readable, _, _ = select.select([self._socket], [], [], max(min(next_publish - self._clock(), POLL_INTERVAL), 0))
+            except (OSError, ValueError):
+                break
+            if readable:
+                self._drain()
+            now = self._clock()
+            if now >= next_publish:
+                next_publish = now + self._publish_interval
+                self.publish(now)
+
+    def _drain(self):
+        sock = self._socket
+        view = self._view
+        stats = self._stats
+        started = time.perf_counter_ns()
+        now = self._clock()
+        while True:
+            try:
+                size, address = sock.recvfrom_into(self._buffer)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                break
+            stats["packets"] += 1
+            stats["bytes"] += size
+            self.feed(view[:size], address, now)
+        stats["decode_ns"] += time.perf_counter_ns() - started
+
+    def feed(self, data, address, now=None):
+        now = self._clock() if now is None else now
+        stats = self._stats
+        try:
+            magic, version, kind, session, seq, timestamp = FRAME.unpack_from(data, 0)
+        except struct.error:
+            stats["invalid"] += 1
+            return
+        if magic != MAGIC or version != VERSION:
+            stats["invalid"] += 1
+            return
+        try:
+            if kind == KIND_KEY:
+                self._apply_key(data, address, session, seq, timestamp, now)
+            elif kind == KIND_DELTA:
+                self._apply_delta(data, session, seq, timestamp, now)
+            else:
+                stats["invalid"] += 1
+        except (struct.error, ValueError, KeyError, IndexError):
+            stats["invalid"] += 1
+
+    def _apply_key(self, data, address, session, seq, timestamp, now):
+        offset = FRAME.size
+        header_size, count = KEY_HEADER.unpack_from(data, offset)
+        offset += KEY_HEADER.size
+        header = json.loads(bytes(data[offset:offset + header_size]).decode("utf-8"))
+        offset += header_size
+        values = list(struct.unpack_from(f"<{count}h", data, offset))
+        state = self._hosts.get(session)
+        if state is not None:
+            self._count_lost(state, seq)
+            state.cpu_name = header.get("cpu_name", "CPU")
+            state.gpu_names = tuple(header.get("gpus", ()))
+            state.values = values
+        else:
+            name = str(header.get("host") or address[0])
+            previous = self._names.get(name)
+            if previous is not None:
+                self._hosts.pop(previous, None)
+            state = _HostState(name, address[0], header.get("cpu_name", "CPU"), tuple(header.get("gpus", ())), values, timestamp, now, seq)
+            self._hosts[session] = state
+            self._names[name] = session
+        state.timestamp = timestamp
+        state.seen = now
+        self._stats["keyframes"] += 1
+        self._dirty = True
+
+    def _apply_delta(self, data, session, seq, timestamp, now):
+        state = self._hosts.get(session)
+        if state is None:
+            self._stats["unknown"] += 1
+            return
+        mask, = DELTA_MASK.unpack_from(data, FRAME.size)
+        if mask.bit_length() > len(state.values):
+            self._stats["invalid"] += 1
+            return
+        changed = struct.unpack_from(f"<{bin(mask).count('1')}h", data, FRAME.size + DELTA_MASK.size)
+        self._count_lost(state, seq)
+        if mask:
+            values = state.values
+            i = 0
+            for value in changed:
+                while not mask & (1 << i):
+                    i += 1
+                values[i] = value
+                i += 1
+            self._dirty = True
+        state.timestamp = timestamp
+        state.seen = now
+        self._stats["deltas"] += 1
+
+    def _count_lost(self, state, seq):
+        gap = (seq - state.seq - 1) & 0xFFFFFFFF
+        if gap and gap < 0x80000000:
+            state.lost += gap
+            self._stats["lost"] += gap
+        state.seq = seq
+
+    def publish(self, now=None):
+        now = self._clock() if now is None else now
+        expired = [session for session, state in self._hosts.items() if now - state.seen > self._timeout]
+        for session in expired:
+            state = self._hosts.pop(session)
+            if self._names.get(state.name) == session:
+                del self._names[state.name]
+        if expired:
+            self._stats["expired"] += len(expired)
+            self._dirty = True
+        if not self._dirty:
+            return self._latest
+        self._dirty = False
+        self._latest = tuple(sorted(
+            (FleetHost(state.name, state.address, state.snapshot(), now - state.seen, state.lost) for state in self._hosts.values()),
+            key=lambda host: host.name
+        ))
+        self._stats["publishes"] += 1
+        callback = self._callback
+        if callback is not None:
+            callback(self._latest)
+        return self._latest
@@ -0,0 +1,269 @@
+import argparse
+import csv
+import io
+import json
+import os
+import signal
+import sys
+import threading
+from src.core.config_manager import ConfigManager
+from src.core.system_monitor import SystemMonitor, gpu_devices
+from src.core.sampler import Sampler, parse_metric_intervals
+from src.core.metrics_exporter import MetricsExporter
+from src.core.session_recorder import SessionRecorder, ReplayMonitor
+from src.core.fleet import FleetAgent, parse_address
+from src.core.rules import RulesEngine
+
+FORMATS = ("jsonl", "csv")
+
+def snapshot_record(snapshot, devices=None):
+    record = {
+        "timestamp": round(snapshot.timestamp, 3),
+        "time": snapshot.time_text,
+        "cpu_name": snapshot.cpu_name,
+        "cpu_usage": snapshot.cpu_usage,
+        "ram_usage": snapshot.ram_usage,
+        "cpu_temp": snapshot.cpu_temp
+    }
+    for i, (name, usage, temp) in enumerate(gpu_devices(snapshot) if devices is None else devices):
+        record[f"gpu{i}_name"] = name
+        record[f"gpu{i}_usage"] = usage
+        record[f"gpu{i}_temp"] = temp
+    for nic in snapshot.net_io or ():
+        record[f"net_{nic.name}_rx_bps"] = round(nic.rx_bytes, 1)
+        record[f"net_{nic.name}_tx_bps"] = round(nic.tx_bytes, 1)
+    for disk in snapshot.disk_io or ():
+        record[f"disk_{disk.name}_read_bps"] = round(disk.read_bytes, 1)
+        record[f"disk_{disk.name}_write_bps"] = round(disk.write_bytes, 1)
+        record[f"disk_{disk.name}_iops"] = round(disk.reads + disk.writes, 1)
+    return record
+
+def csv_columns(gpu_count=0, interfaces=(), disks=()):
+    columns = ["timestamp", "time", "cpu_name", "cpu_usage", "ram_usage", "cpu_temp"]
+    for i in range(gpu_count):
+        columns += [f"gpu{i}_name", f"gpu{i}_usage", f"gpu{i}_temp"]
+    for name in interfaces:
+        columns += [f"net_{name}_rx_bps", f"net_{name}_tx_bps"]
+    for name in disks:
+        columns += [f"disk_{name}_read_bps", f"disk_{name}_write_bps", f"disk_{name}_iops"]
+    return columns
+
+
+class RotatingFile:
+    def __init__(self, path, max_bytes=0, backups=3):
+        self._path = path
+        self._max_bytes = max_bytes
+        self._backups = backups
+        self.on_rotate = None
+        self._file = None
+        self._size = 0
+        self._open()
+
+    def _open(self):
+        directory = os.path.dirname(self._path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self._file = open(self._path, "a", encoding="utf-8", newline="")
+        self._size = self._file.tell()
+
+    def _rotate(self):
+        self._file.close()
+        if self._backups > 0:
+            for i in range(self._backups - 1, 0, -1):
+                source = f"{self._path}.{i}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self._path}.{i + 1}")
+            os.replace(self._path, f"{self._path}.1")
+        else:
+            os.remove(self._path)
+        self._open()
+        if self.on_rotate:
+            self.on_rotate()
+
+    @property
+    def size(self):
+        return self._size
+
+    def write(self, text):
+        self._file.write(text)
+        self._size += len(text)
+        if self._max_bytes and self._size >= self._max_bytes:
+            self._rotate()
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+class JsonLinesWriter:
+    def __init__(self, stream, interfaces=(), disks=()):
+        self._stream = stream
+
+    def reset(self):
+        pass
+
+    def write(self, snapshot):
+        self._stream.write(json.dumps(snapshot_record(snapshot), ensure_ascii=False) + "\n")
+        self._stream.flush()
+
+
+class CsvWriter:
+    def __init__(self, stream, interfaces=(), disks=()):
+        self._stream = stream
+        self._interfaces = interfaces
+        self._disks = disks
+        self._gpu_count = None
+        self._columns = None
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+
+    def _line(self, row):
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._writer.writerow(row)
+        return self._buffer.getvalue()
+
+    def reset(self):
+        self._gpu_count = None
+
+    def write(self, snapshot):
+        devices = gpu_devices(snapshot)
+        record = snapshot_record(snapshot, devices)
+        text = ""
+        if len(devices) != self._gpu_count:
+            self._gpu_count = len(devices)
+            self._columns = csv_columns(self._gpu_count, self._interfaces, self._disks)
+            text = self._line(self._columns)
+        self._stream.write(text + self._line(["" if record.get(column) is None else record[column] for column in self._columns]))
+        self._stream.flush()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="main.py --headless", description="Stream system metrics without a display server.")
+    parser.add_argument("--headless", action="store_true")
+    parser.add_argument("--format", choices=FORMATS, default="jsonl")
+    parser.add_argument("--output", default="-", help="output file, '-' for stdout, 'none' to discard")
+    parser.add_argument("--max-bytes", type=int, default=0, help="rotate the output file once it reaches this size")
+    parser.add_argument("--backups", type=int, default=3, help="number of rotated files to keep")
+    parser.add_argument("--interval-ms", type=int, default=None)
+    parser.add_argument("--count", type=int, default=0, help="stop after this many samples")
+    parser.add_argument("--config-dir", default=None)
+    parser.add_argument("--no-gpu", action="store_true")
+    parser.add_argument("--no-temps", action="store_true")
+    parser.add_argument("--net", action="store_true", help="add per-NIC throughput")
+    parser.add_argument("--disk", action="store_true", help="add per-disk throughput and IOPS")
+    parser.add_argument("--exporter-port", type=int, default=None, help="serve OpenMetrics on 127.0.0.1:PORT/metrics")
+    parser.add_argument("--record", default=None, help="also record samples to a binary session file")
+    parser.add_argument("--replay", default=None, help="read samples from a session file instead of the sensors")
+    parser.add_argument("--replay-speed", type=float, default=1.0)
+    parser.add_argument("--replay-loop", action="store_true")
+    parser.add_argument("--fleet-agent", default=None, metavar="HOST:PORT", help="also push samples to a fleet collector over UDP")
+    parser.add_argument("--fleet-name", default=None, help="host name reported to the fleet collector")
+    parser.add_argument("--stats", action="store_true", help="print sampler statistics and startup timings to stderr on exit")
+    return parser
+
+def output_devices(args, monitor):
+    if args.format != "csv" or args.output == "none" or not (args.net or args.disk):
+        return (), ()
+    interfaces, disks = monitor.throughput_devices()
+    return (interfaces if args.net else ()), (disks if args.disk else ())
+
+def open_output(args, interfaces=(), disks=()):
+    writer_class = CsvWriter if args.format == "csv" else JsonLinesWriter
+    if args.output == "none":
+        return None, None
+    if args.output == "-":
+        return writer_class(sys.stdout, interfaces, disks), None
+    stream = RotatingFile(args.output, args.max_bytes, args.backups)
+    writer = writer_class(stream, interfaces, disks)
+    stream.on_rotate = writer.reset
+    return writer, stream
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    config_manager = ConfigManager(args.config_dir)
+    config = config_manager.config
+    interval_ms = args.interval_ms or config.get("update_interval_ms", 1000)
+
+    if args.replay:
+        monitor = ReplayMonitor(args.replay, speed=args.replay_speed, loop=args.replay_loop)
+    else:
+        monitor = SystemMonitor(nvidia_smi_interval_ms=interval_ms, defer_lhm=True)
+    recorder = SessionRecorder(args.record) if args.record else None
+    monitor.configure_throughput(config.get("io_smoothing_ms", 2000), config.get("net_interfaces", []), config.get("disk_devices", []))
+    writer, stream = open_output(args, *output_devices(args, monitor))
+    agent = FleetAgent(parse_address(args.fleet_agent), args.fleet_name) if args.fleet_agent else None
+    rules = RulesEngine(config.get("rules"), log_path=os.path.join(config_manager.config_dir, "rules.log"))
+    sampler = Sampler(
+        monitor,
+        interval_ms,
+        parse_metric_intervals(config.get("metric_intervals_ms")),
+        cpu_temp=not args.no_temps,
+        gpu=not args.no_gpu,
+        gpu_temp=not (args.no_gpu or args.no_temps),
+        net=args.net,
+        disk=args.disk
+    )
+    monitor.on_backend_ready = sampler.request_sample
+
+    done = threading.Event()
+    written = [0]
+    lock = threading.Lock()
+
+    def on_sample(snapshot):
+        with lock:
+            if done.is_set():
+                return
+            if writer:
+                try:
+                    writer.write(snapshot)
+                except (BrokenPipeError, ValueError):
+                    done.set()
+                    return
+            if recorder:
+                recorder.record(snapshot)
+            if agent:
+                agent.send(snapshot)
+            rules.evaluate(snapshot)
+            written[0] += 1
+            if args.count and written[0] >= args.count:
+                done.set()
+            elif args.replay and monitor.finished():
+                done.set()
+
+    signal.signal(signal.SIGINT, lambda *_: done.set())
+    if hasattr(signal, "SIGTERM"):
+        signal.signal(signal.SIGTERM, lambda *_: done.set())
+
+    exporter = None
+    port = args.exporter_port
+    if port is None and config.get("exporter_enabled", False):
+        port = config.get("exporter_port", 9464)
+    if port is not None:
+        exporter = MetricsExporter(sampler.latest, port=port)
+        exporter.start()
+
+    sampler.add_callback(on_sample)
+    sampler.start()
+    try:
+        while not done.wait(0.5):
+            pass
+    finally:
+        if exporter:
+            exporter.stop()
+        sampler.stop()
+        monitor.close()
+        if recorder:
+            recorder.close()
+        if agent:
+            agent.close()
+        with lock:
+            if stream:
+                stream.close()
+        if args.stats:
+            sys.stderr.write(json.dumps({"sampler": sampler.stats(), "startup": monitor.startup_timings()}) + "\n")
+    return 0
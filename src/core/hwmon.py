@@ -0,0 +1,178 @@
+import os
+import re
+import time
+from src.core.sysfs import sys_path, read_text, list_dir, cached_file
+from src.core.linux_gpu import gpu_name
+
+CPU_CHIPS = ("coretemp", "k10temp", "zenpower", "cpu_thermal", "acpitz")
+GPU_CHIPS = ("radeon", "nouveau")
+NON_CPU_CHIPS = GPU_CHIPS + ("amdgpu",)
+THERMAL_ZONE_TYPES = {"x86_pkg_temp": "coretemp", "cpu-thermal": "cpu_thermal", "cpu_thermal": "cpu_thermal", "acpitz": "acpitz"}
+PACKAGE_LABELS = ("Package", "Tctl", "Tdie")
+CORE_LABELS = ("Core", "Tccd")
+TEMP_INPUT = re.compile(r"^temp(\d+)_input$")
+RESCAN_INTERVAL = 10.0
+
+
+class HwmonSensor:
+    def __init__(self, chip, label, handle):
+        self.chip = chip
+        self.label = label
+        self._handle = handle
+
+    @property
+    def path(self):
+        return self._handle.path
+
+    def read(self):
+        return self._handle.read_float(1000.0)
+
+    def close(self):
+        self._handle.close()
+
+
+class HwmonBackend:
+    def __init__(self, root="/", rescan_interval=RESCAN_INTERVAL, clock=time.monotonic):
+        self._root = root
+        self._rescan_interval = rescan_interval
+        self._clock = clock
+        self._devices = None
+        self._checked_at = 0.0
+        self._package = None
+        self._cores = []
+        self._gpus = []
+        self._discovered = False
+        self.discoveries = 0
+
+    def _hwmon_dir(self):
+        return sys_path(self._root, "sys/class/hwmon")
+
+    def _chips(self):
+        chips = {}
+        for device in self._devices:
+            base = os.path.join(self._hwmon_dir(), device)
+            name = read_text(os.path.join(base, "name"))
+            if not name:
+                continue
+            inputs = []
+            for entry in list_dir(base):
+                match = TEMP_INPUT.match(entry)
+                if match:
+                    label = read_text(os.path.join(base, f"temp{match.group(1)}_label")) or f"temp{match.group(1)}"
+                    inputs.append((int(match.group(1)), label, os.path.join(base, entry)))
+            if inputs:
+                chips.setdefault(name, []).extend((label, path) for _, label, path in sorted(inputs))
+        return chips
+
+    def _thermal_zones(self):
+        chips = {}
+        base = sys_path(self._root, "sys/class/thermal")
+        for zone in list_dir(base):
+            if not zone.startswith("thermal_zone"):
+                continue
+            chip = THERMAL_ZONE_TYPES.get(read_text(os.path.join(base, zone, "type"), ""))
+            if chip is not None:
+                chips.setdefault(chip, []).append((zone, os.path.join(base, zone, "temp")))
+        return chips
+
+    def _open(self, chip, label, path):
+        handle = cached_file(path)
+        if handle is None:
+            return None
+        sensor = HwmonSensor(chip, label, handle)
+        if sensor.read() is None:
+            sensor.close()
+            return None
+        return sensor
+
+    def discover(self):
+        self.close()
+        self._devices = list_dir(self._hwmon_dir())
+        self._checked_at = self._clock()
+        chips = self._chips()
+        cpu_chip = next((name for name in CPU_CHIPS if name in chips), None)
+        if cpu_chip is None:
+            chips.update({name: inputs for name, inputs in self._thermal_zones().items() if name not in chips})
+            cpu_chip = next((name for name in CPU_CHIPS if name in chips), None)
+        if cpu_chip is None:
+            cpu_chip = next((name for name in chips if name not in NON_CPU_CHIPS), None)
+        if cpu_chip is not None:
+            inputs = chips[cpu_chip]
+            package = [item for item in inputs if item[0].startswith(PACKAGE_LABELS)] or inputs[:1]
+            for label, path in package:
+                self._package = self._open(cpu_chip, label, path)
+                if self._package is not None:
+                    break
+            for label, path in inputs:
+                if label.startswith(CORE_LABELS):
+                    sensor = self._open(cpu_chip, label, path)
+                    if sensor is not None:
+                        self._cores.append(sensor)
+        for name in GPU_CHIPS:
+            if name in chips:
+                _, path = chips[name][0]
+                sensor = self._open(name, gpu_name(os.path.join(os.path.dirname(path), "device"), name), path)
+                if sensor is not None:
+                    self._gpus.append(sensor)
+        self._discovered = True
+        self.discoveries += 1
+
+    def _ensure(self):
+        if not self._discovered:
+            self.discover()
+        elif self._clock() - self._checked_at >= self._rescan_interval:
+            self._checked_at = self._clock()
+            if list_dir(self._hwmon_dir()) != self._devices:
+                self.discover()
+
+    def _read(self, sensor):
+        value = sensor.read()
+        if value is None:
+            self.invalidate()
+        return value
+
+    def _sensors(self):
+        return ([self._package] if self._package is not None else []) + self._cores + self._gpus
+
+    def sensors(self):
+        self._ensure()
+        return self._sensors()
+
+    def cpu_temperature(self):
+        self._ensure()
+        if self._package is None:
+            return None
+        return self._read(self._package)
+
+    def core_temperatures(self):
+        self._ensure()
+        temps = []
+        for sensor in self._cores:
+            value = self._read(sensor)
+            if value is None:
+                return None
+            temps.append((sensor.label, value))
+        return temps
+
+    def gpu_temperatures(self):
+        self._ensure()
+        if not self._gpus:
+            return None
+        temps = []
+        for sensor in self._gpus:
+            value = self._read(sensor)
+            if value is None:
+                return None
+            temps.append((sensor.label, value))
+        return temps
+
+    def invalidate(self):
+        self._discovered = False
+
+    def close(self):
+        for sensor in self._sensors():
+            sensor.close()
+        self._package = None
+        self._cores = []
+        self._gpus = []
+        self._discovered = False
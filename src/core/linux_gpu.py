@@ -0,0 +1,110 @@
+import os
+import re
+from src.core.sysfs import sys_path, read_text, list_dir, cached_file
+
+CARD_PATTERN = re.compile(r"^card\d+$")
+VENDOR_NAMES = {"0x1002": "AMD Radeon", "0x8086": "Intel Graphics", "0x10de": "NVIDIA"}
+DRIVER_TYPES = {"amdgpu": "amd", "i915": "intel", "xe": "intel"}
+XE_FREQ_DIRS = ("tile0/gt0/freq0", "tile0/gt0/freq", "gt/gt0/freq0")
+
+def gpu_name(device, driver):
+    name = read_text(os.path.join(device, "product_name"))
+    if name:
+        return name
+    vendor = read_text(os.path.join(device, "vendor"), "")
+    product = read_text(os.path.join(device, "device"), "")
+    base = VENDOR_NAMES.get(vendor, driver)
+    return f"{base} ({product[2:] if product.startswith('0x') else product})" if product else base
+
+
+class SysfsGpu:
+    def __init__(self, card, driver, name, files):
+        self.card = card
+        self.driver = driver
+        self.type = DRIVER_TYPES[driver]
+        self.name = name
+        self._files = files
+
+    def read(self, index):
+        files = self._files
+        return {
+            "index": index,
+            "name": self.name,
+            "type": self.type,
+            "usage": files["busy"].read_float() if files.get("busy") is not None else None,
+            "temperature": files["temp"].read_float(1000.0) if files.get("temp") is not None else None,
+            "memory_used": files["vram_used"].read_float(1048576.0) if files.get("vram_used") is not None else None,
+            "memory_total": files["vram_total"].read_float(1048576.0) if files.get("vram_total") is not None else None,
+            "clock_core": files["clock"].read_float() if files.get("clock") is not None else None
+        }
+
+    def close(self):
+        for handle in self._files.values():
+            if handle is not None:
+                handle.close()
+
+
+class SysfsGpuBackend:
+    def __init__(self, root="/"):
+        self._root = root
+        self._gpus = None
+
+    def _hwmon_temp(self, device):
+        for hwmon in list_dir(os.path.join(device, "hwmon")):
+            base = os.path.join(device, "hwmon", hwmon)
+            inputs = [name for name in list_dir(base) if name.startswith("temp") and name.endswith("_input")]
+            for name in inputs:
+                label = read_text(os.path.join(base, name.replace("_input", "_label")), "")
+                if label in ("edge", "pkg", ""):
+                    return cached_file(os.path.join(base, name))
+            if inputs:
+                return cached_file(os.path.join(base, inputs[0]))
+        return None
+
+    def _intel_files(self, card_path, device, driver):
+        if driver == "i915":
+            return {"clock": cached_file(os.path.join(card_path, "gt_act_freq_mhz"))}
+        for freq_dir in XE_FREQ_DIRS:
+            base = os.path.join(device, freq_dir)
+            if os.path.isdir(base):
+                return {"clock": cached_file(os.path.join(base, "act_freq"))}
+        return {}
+
+    def discover(self):
+        gpus = []
+        drm = sys_path(self._root, "sys/class/drm")
+        for card in list_dir(drm):
+            if not CARD_PATTERN.match(card):
+                continue
+            card_path = os.path.join(drm, card)
+            device = os.path.join(card_path, "device")
+            driver = os.path.basename(os.path.realpath(os.path.join(device, "driver")))
+            if driver not in DRIVER_TYPES:
+                continue
+            if driver == "amdgpu":
+                files = {
+                    "busy": cached_file(os.path.join(device, "gpu_busy_percent")),
+                    "vram_used": cached_file(os.path.join(device, "mem_info_vram_used")),
+                    "vram_total": cached_file(os.path.join(device, "mem_info_vram_total")),
+                    "clock": None
+                }
+            else:
+                files = self._intel_files(card_path, device, driver)
+            files["temp"] = self._hwmon_temp(device)
+            gpus.append(SysfsGpu(card, driver, gpu_name(device, driver), files))
+        self.close()
+        self._gpus = gpus
+        return gpus
+
+    def gpus(self):
+        if self._gpus is None:
+            self.discover()
+        return self._gpus
+
+    def read(self):
+        return [gpu.read(i) for i, gpu in enumerate(self.gpus())]
+
+    def close(self):
+        for gpu in self._gpus or ():
+            gpu.close()
+        self._gpus = None
@@ -0,0 +1,173 @@
+from array import array
+from collections import deque
+import threading
+
+MIN_CAPACITY = 10
+MAX_CAPACITY = 36000
+RESUM_INTERVAL = 4096
+
+class RingBuffer:
+    def __init__(self, capacity):
+        self._capacity = max(int(capacity), 1)
+        self._data = array("d", bytes(8 * self._capacity))
+        self._next = 0
+        self._count = 0
+        self._seq = 0
+        self._sum = 0.0
+        self._min_queue = deque()
+        self._max_queue = deque()
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    def __len__(self):
+        return self._count
+
+    def append(self, value):
+        value = float(value)
+        if self._count == self._capacity:
+            self._sum -= self._data[self._next]
+        else:
+            self._count += 1
+        self._data[self._next] = value
+        self._sum += value
+        self._next = (self._next + 1) % self._capacity
+        self._seq += 1
+        if self._seq % RESUM_INTERVAL == 0:
+            self._sum = sum(self._data[:self._count])
+
+        oldest = self._seq - self._capacity
+        while self._min_queue and self._min_queue[-1][1] >= value:
+            self._min_queue.pop()
+        self._min_queue.append((self._seq, value))
+        while self._min_queue[0][0] <= oldest:
+            self._min_queue.popleft()
+        while self._max_queue and self._max_queue[-1][1] <= value:
+            self._max_queue.pop()
+        self._max_queue.append((self._seq, value))
+        while self._max_queue[0][0] <= oldest:
+            self._max_queue.popleft()
+
+    def last(self):
+        if not self._count:
+            return None
+        return self._data[self._next - 1]
+
+    def values(self, window=None):
+        count = self._count if window is None else min(int(window), self._count)
+        if count <= 0:
+            return array("d")
+        end = self._next
+        start = end - count
+        if start >= 0:
+            return self._data[start:end]
+        return self._data[start + self._capacity:] + self._data[:end]
+
+    def min(self, window=None):
+        if not self._count:
+            return None
+        if window is None or window >= self._count:
+            return self._min_queue[0][1]
+        return min(self.values(window))
+
+    def max(self, window=None):
+        if not self._count:
+            return None
+        if window is None or window >= self._count:
+            return self._max_queue[0][1]
+        return max(self.values(window))
+
+    def mean(self, window=None):
+        if not self._count:
+            return None
+        if window is None or window >= self._count:
+            return self._sum / self._count
+        values = self.values(window)
+        return sum(values) / len(values)
+
+    def percentile(self, q, window=None):
+        values = sorted(self.values(window))
+        if not values:
+            return None
+        position = (len(values) - 1) * min(max(q, 0.0), 100.0) / 100.0
+        lower = int(position)
+        upper = min(lower + 1, len(values) - 1)
+        return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+class MetricHistory:
+    def __init__(self, capacity=300):
+        self._capacity = self._clamp(capacity)
+        self._buffers = {}
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    def _clamp(self, capacity):
+        return min(max(int(capacity), MIN_CAPACITY), MAX_CAPACITY)
+
+    def set_capacity(self, capacity):
+        capacity = self._clamp(capacity)
+        with self._lock:
+            if capacity == self._capacity:
+                return
+            self._capacity = capacity
+            for metric, old in list(self._buffers.items()):
+                buffer = RingBuffer(capacity)
+                for value in old.values(capacity):
+                    buffer.append(value)
+                self._buffers[metric] = buffer
+
+    def _append(self, metric, value):
+        if value is None:
+            return
+        buffer = self._buffers.get(metric)
+        if buffer is None:
+            buffer = self._buffers[metric] = RingBuffer(self._capacity)
+        buffer.append(value)
+
+    def append(self, metric, value):
+        with self._lock:
+            self._append(metric, value)
+
+    def record(self, snapshot):
+        with self._lock:
+            self._append("cpu", snapshot.cpu_usage)
+            self._append("ram", snapshot.ram_usage)
+            self._append("cpu_temp", snapshot.cpu_temp)
+            for i, (_, usage) in enumerate(snapshot.gpu_info or ()):
+                self._append(f"gpu{i}", usage)
+            for i, (_, temp) in enumerate(snapshot.gpu_temps or ()):
+                self._append(f"gpu_temp{i}", temp)
+
+    def metrics(self):
+        return list(self._buffers)
+
+    def buffer(self, metric):
+        return self._buffers.get(metric)
+
+    def values(self, metric, window=None):
+        with self._lock:
+            buffer = self._buffers.get(metric)
+            return buffer.values(window) if buffer is not None else array("d")
+
+    def clear(self):
+        with self._lock:
+            self._buffers = {}
+
+    def stats(self, metric, window=None, percentile=95):
+        with self._lock:
+            buffer = self._buffers.get(metric)
+            if buffer is None or not len(buffer):
+                return None
+            return {
+                "last": buffer.last(),
+                "min": buffer.min(window),
+                "max": buffer.max(window),
+                "mean": buffer.mean(window),
+                f"p{percentile}": buffer.percentile(percentile, window),
+                "samples": min(len(buffer), window) if window else len(buffer)
+            }
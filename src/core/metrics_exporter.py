@@ -0,0 +1,138 @@
+import math
+import threading
+import time
+from src.core.system_monitor import gpu_devices
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 9464
+PREFIX = "overlay"
+
+def escape_label(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+def format_value(value):
+    return repr(float(value))
+
+def family(lines, name, metric_type, help_text, samples):
+    samples = [(labels, value) for labels, value in samples if value is not None and not math.isnan(value)]
+    if not samples:
+        return
+    lines.append(f"# TYPE {PREFIX}_{name} {metric_type}")
+    lines.append(f"# HELP {PREFIX}_{name} {help_text}")
+    for labels, value in samples:
+        lines.append(f"{PREFIX}_{name}{labels} {format_value(value)}")
+
+def render_snapshot(snapshot):
+    lines = []
+    family(lines, "cpu_info", "gauge", "CPU model name.", [(f'{{name="{escape_label(snapshot.cpu_name)}"}}', 1)])
+    family(lines, "cpu_usage_percent", "gauge", "CPU load in percent.", [("", snapshot.cpu_usage)])
+    family(lines, "ram_usage_percent", "gauge", "RAM usage in percent.", [("", snapshot.ram_usage)])
+    family(lines, "cpu_temperature_celsius", "gauge", "CPU package temperature.", [("", snapshot.cpu_temp)])
+
+    gpus = [(f'{{gpu="{i}",name="{escape_label(name)}"}}', usage, temp) for i, (name, usage, temp) in enumerate(gpu_devices(snapshot))]
+    family(lines, "gpu_usage_percent", "gauge", "GPU core load in percent.", [(labels, usage) for labels, usage, _ in gpus])
+    family(lines, "gpu_temperature_celsius", "gauge", "GPU core temperature.", [(labels, temp) for labels, _, temp in gpus])
+    family(lines, "snapshot_timestamp_seconds", "gauge", "Unix time the snapshot was sampled.", [("", snapshot.timestamp)])
+    return "\n".join(lines) + "\n"
+
+
+class MetricsExporter:
+    def __init__(self, latest=None, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self._latest = latest
+        self._published = None
+        self._host = host
+        self._port = port
+        self._server = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self._cached_snapshot = None
+        self._cached_body = ""
+        self._scrapes = 0
+        self._render_sum = 0.0
+        self._last_render = 0.0
+
+    @property
+    def port(self):
+        return self._server.server_address[1] if self._server else self._port
+
+    @property
+    def url(self):
+        return f"http://{self._host}:{self.port}/metrics"
+
+    def is_running(self):
+        return self._server is not None
+
+    def start(self):
+        if self._server is not None:
+            return
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self._host, self._port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="MetricsExporter", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        server = self._server
+        if server is None:
+            return
+        self._server = None
+        server.shutdown()
+        server.server_close()
+        if self._thread:
+            self._thread.join(2.0)
+        self._thread = None
+
+    def publish(self, snapshot):
+        self._published = snapshot
+
+    def _snapshot_body(self):
+        snapshot = self._latest() if self._latest is not None else self._published
+        if snapshot is None:
+            return None, ""
+        with self._lock:
+            if snapshot is not self._cached_snapshot:
+                self._cached_body = render_snapshot(snapshot)
+                self._cached_snapshot = snapshot
+            return snapshot, self._cached_body
+
+    def render(self):
+        started = time.perf_counter()
+        snapshot, body = self._snapshot_body()
+        lines = []
+        if snapshot is not None:
+            family(lines, "snapshot_age_seconds", "gauge", "Seconds since the served snapshot was sampled.", [("", max(time.time() - snapshot.timestamp, 0.0))])
+        with self._lock:
+            scrapes = self._scrapes
+            render_sum = self._render_sum
+            last_render = self._last_render
+        lines.append(f"# TYPE {PREFIX}_scrape_render_seconds summary")
+        lines.append(f"# HELP {PREFIX}_scrape_render_seconds Time spent rendering previous scrapes.")
+        lines.append(f"{PREFIX}_scrape_render_seconds_count {scrapes}")
+        lines.append(f"{PREFIX}_scrape_render_seconds_sum {format_value(render_sum)}")
+        family(lines, "scrape_last_render_seconds", "gauge", "Render time of the previous scrape.", [("", last_render)])
+        lines.append("# EOF")
+        text = body + "\n".join(lines) + "\n"
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._scrapes += 1
+            self._render_sum += elapsed
+            self._last_render = elapsed
+        return text
@@ -0,0 +1,168 @@
+import threading
+from src.core.system_monitor import SystemMonitor, METRICS
+from src.core.sampler import Sampler, THROTTLE_PAUSE, THROTTLE_LOW
+
+DEFAULT_INTERVAL_MS = 1000
+
+class MonitorService:
+    _instance = None
+    _instance_lock = threading.Lock()
+    _default_factory = None
+
+    @classmethod
+    def instance(cls):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(cls._default_factory)
+            return cls._instance
+
+    @classmethod
+    def set_monitor_factory(cls, monitor_factory):
+        cls._default_factory = monitor_factory
+
+    def __init__(self, monitor_factory=None):
+        self._monitor_factory = monitor_factory or SystemMonitor
+        self._lock = threading.RLock()
+        self._refcount = 0
+        self._monitor = None
+        self._sampler = None
+        self._subscriptions = {}
+        self._passive = set()
+        self._throttles = {}
+        self._throughput = None
+        self._profiler = None
+
+    @property
+    def monitor(self):
+        return self._monitor
+
+    @property
+    def sampler(self):
+        return self._sampler
+
+    @property
+    def refcount(self):
+        return self._refcount
+
+    def latest(self):
+        return self._sampler.latest() if self._sampler else None
+
+    def acquire(self, interval_ms=DEFAULT_INTERVAL_MS):
+        with self._lock:
+            if self._refcount == 0:
+                self._monitor = self._monitor_factory(nvidia_smi_interval_ms=interval_ms, defer_lhm=True)
+                self._sampler = Sampler(self._monitor, interval_ms)
+                self._sampler.profiler = self._profiler
+                if self._throughput is not None:
+                    self._sampler.configure_throughput(*self._throughput)
+                self._monitor.on_backend_ready = self._sampler.request_sample
+            self._refcount += 1
+            return self._monitor
+
+    def release(self):
+        with self._lock:
+            if self._refcount == 0:
+                return
+            self._refcount -= 1
+            if self._refcount == 0:
+                self._subscriptions.clear()
+                self._passive.clear()
+                self._throttles.clear()
+                self._sampler.stop()
+                self._monitor.close()
+                self._sampler = None
+                self._monitor = None
+
+    def subscribe(self, callback, interval_ms=DEFAULT_INTERVAL_MS, intervals=None, passive=False, **sample_options):
+        with self._lock:
+            if callback in self._subscriptions:
+                self.update_subscription(callback, interval_ms, intervals, **sample_options)
+                return self._monitor
+            monitor = self.acquire(interval_ms)
+            self._subscriptions[callback] = (interval_ms, intervals or {}, sample_options)
+            if passive:
+                self._passive.add(callback)
+            self._sampler.add_callback(callback)
+            self._apply_subscriptions()
+            self._sampler.start()
+            return monitor
+
+    def update_subscription(self, callback, interval_ms=DEFAULT_INTERVAL_MS, intervals=None, **sample_options):
+        with self._lock:
+            if callback not in self._subscriptions:
+                return
+            self._subscriptions[callback] = (interval_ms, intervals or {}, sample_options)
+            self._apply_subscriptions()
+            self._sampler.request_sample()
+
+    def unsubscribe(self, callback):
+        with self._lock:
+            if callback not in self._subscriptions:
+                return
+            del self._subscriptions[callback]
+            self._passive.discard(callback)
+            self._throttles.pop(callback, None)
+            self._sampler.remove_callback(callback)
+            if self._subscriptions:
+                self._apply_subscriptions()
+            self.release()
+
+    def configure_throughput(self, smoothing_ms, interfaces=(), disks=()):
+        with self._lock:
+            self._throughput = (smoothing_ms, interfaces, disks)
+            if self._sampler is not None:
+                self._sampler.configure_throughput(smoothing_ms, interfaces, disks)
+
+    @property
+    def profiler(self):
+        return self._profiler
+
+    def set_profiler(self, profiler):
+        with self._lock:
+            self._profiler = profiler
+            if self._sampler is not None:
+                self._sampler.profiler = profiler
+
+    def set_throttle(self, callback, mode, interval_ms=None):
+        with self._lock:
+            if callback not in self._subscriptions:
+                return
+            if mode is None:
+                self._throttles.pop(callback, None)
+            else:
+                self._throttles[callback] = (mode, interval_ms)
+            self._apply_throttle()
+
+    def _active(self):
+        return [callback for callback in self._subscriptions if callback not in self._passive]
+
+    def _apply_throttle(self):
+        active = self._active()
+        if not active or any(callback not in self._throttles for callback in active):
+            self._sampler.set_throttle(None)
+            return
+        throttles = [self._throttles[callback] for callback in active]
+        if all(mode == THROTTLE_PAUSE for mode, _ in throttles):
+            self._sampler.set_throttle(THROTTLE_PAUSE)
+            return
+        intervals = [interval for mode, interval in throttles if mode == THROTTLE_LOW and interval]
+        self._sampler.set_throttle(THROTTLE_LOW, min(intervals) if intervals else None)
+
+    def _apply_subscriptions(self):
+        subscriptions = [self._subscriptions[callback] for callback in self._active()] or list(self._subscriptions.values())
+        intervals = [interval for interval, _, _ in subscriptions]
+        options = {}
+        for _, _, sample_options in self._subscriptions.values():
+            for key, value in sample_options.items():
+                options[key] = options.get(key, False) or value
+        metric_intervals = {}
+        for metric in METRICS:
+            if not any(metric in overrides for _, overrides, _ in subscriptions):
+                continue
+            requested = [overrides.get(metric, interval) for interval, overrides, _ in subscriptions]
+            periodic = [interval for interval in requested if interval > 0]
+            metric_intervals[metric] = min(periodic) if periodic else 0
+        self._sampler.set_sample_options(**options)
+        self._sampler.set_interval(min(intervals) if intervals else DEFAULT_INTERVAL_MS)
+        self._sampler.set_intervals(metric_intervals)
+        self._apply_throttle()
@@ -0,0 +1,191 @@
+import subprocess
+import shutil
+import platform
+import threading
+import time
+
+QUERY_FIELDS = [
+    "count",
+    "index",
+    "name",
+    "utilization.gpu",
+    "temperature.gpu",
+    "memory.used",
+    "memory.total",
+    "clocks.gr",
+    "clocks.mem"
+]
+
+FIELD_KEYS = ["count", "index", "name", "usage", "temperature", "memory_used", "memory_total", "clock_core", "clock_memory"]
+
+class NvidiaSmiStream:
+    def __init__(self, interval_ms=1000, executable="nvidia-smi", restart_delay=5.0, first_frame_timeout=2.0):
+        self._interval_ms = max(int(interval_ms), 100)
+        self._executable = executable
+        self._path = None
+        self._restart_delay = restart_delay
+        self._first_frame_timeout = first_frame_timeout
+        self._lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._first_frame = threading.Event()
+        self._stopped = threading.Event()
+        self._gpus = {}
+        self._process = None
+        self._reader = None
+        self._last_start = 0
+        self._restarts = 0
+        self._closed = False
+        self.on_restart = None
+
+    @property
+    def restarts(self):
+        return self._restarts
+
+    def available(self):
+        if self._path is None:
+            self._path = shutil.which(self._executable) or ""
+        return bool(self._path)
+
+    def is_running(self):
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        with self._start_lock:
+            return self._start()
+
+    def _start(self):
+        if self._closed or self.is_running():
+            return self.is_running()
+        if not self.available():
+            return False
+        if self._last_start:
+            self._restarts += 1
+        self._last_start = time.monotonic()
+        command = [
+            self._path,
+            f"--query-gpu={','.join(QUERY_FIELDS)}",
+            "--format=csv,noheader,nounits",
+            f"--loop-ms={self._interval_ms}"
+        ]
+        kwargs = {"creationflags": subprocess.CREATE_NO_WINDOW} if platform.system() == "Windows" else {}
+        try:
+            self._process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                stdin=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                **kwargs
+            )
+        except Exception:
+            self._process = None
+            return False
+        self._reader = threading.Thread(target=self._read_stream, args=(self._process,), name="NvidiaSmiStream", daemon=True)
+        self._reader.start()
+        return True
+
+    def stop(self):
+        self._closed = True
+        self._stopped.set()
+        process = self._process
+        self._process = None
+        if process is not None and process.poll() is None:
+            try:
+                process.terminate()
+                process.wait(1)
+            except Exception:
+                try:
+                    process.kill()
+                except Exception:
+                    pass
+
+    def latest(self):
+        if not self._closed and self._process is None:
+            if not self._last_start or time.monotonic() - self._last_start >= self._restart_delay:
+                self.start()
+        if not self._first_frame.is_set():
+            return None
+        with self._lock:
+            return [self._gpus[i] for i in sorted(self._gpus)]
+
+    def wait_first_frame(self, timeout=None):
+        return self._first_frame.wait(self._first_frame_timeout if timeout is None else timeout)
+
+    def _publish(self, frame):
+        if frame:
+            with self._lock:
+                self._gpus = frame
+            if not self._first_frame.is_set():
+                self._first_frame.set()
+                callback = self.on_restart
+                if self._restarts and callback is not None:
+                    callback()
+
+    def _restart(self, process):
+        if process is not self._process:
+            return
+        self._first_frame.clear()
+        with self._lock:
+            self._gpus = {}
+        delay = self._restart_delay - (time.monotonic() - self._last_start)
+        if delay > 0 and self._stopped.wait(delay):
+            return
+        try:
+            process.wait(1)
+        except Exception:
+            pass
+        with self._start_lock:
+            if self._closed or process is not self._process:
+                return
+            self._process = None
+            self._start()
+
+    def _read_stream(self, process):
+        frame = {}
+        try:
+            for line in process.stdout:
+                if not line.strip():
+                    self._publish(frame)
+                    frame = {}
+                    continue
+                parsed = self._parse_line(line)
+                if parsed is None:
+                    continue
+                count, gpu = parsed
+                if gpu["index"] in frame:
+                    self._publish(frame)
+                    frame = {}
+                frame[gpu["index"]] = gpu
+                if count is not None and len(frame) >= count:
+                    self._publish(frame)
+                    frame = {}
+            self._publish(frame)
+        except Exception:
+            pass
+        finally:
+            try:
+                process.stdout.close()
+            except Exception:
+                pass
+            self._restart(process)
+
+    def _parse_line(self, line):
+        parts = [p.strip() for p in line.split(",")]
+        if len(parts) != len(FIELD_KEYS):
+            return None
+        try:
+            index = int(parts[1])
+        except ValueError:
+            return None
+        count = self._parse_number(parts[0])
+        gpu = {"index": index, "name": parts[2], "type": "nvidia"}
+        for key, raw in zip(FIELD_KEYS[3:], parts[3:]):
+            gpu[key] = self._parse_number(raw)
+        return (int(count) if count else None), gpu
+
+    def _parse_number(self, raw):
+        try:
+            return float(raw)
+        except ValueError:
+            return None
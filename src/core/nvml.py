@@ -0,0 +1,125 @@
+import ctypes
+import ctypes.util
+import sys
+import threading
+
+NVML_SUCCESS = 0
+NVML_TEMPERATURE_GPU = 0
+NVML_CLOCK_GRAPHICS = 0
+NVML_CLOCK_MEM = 2
+NAME_BUFFER_SIZE = 96
+LIBRARY_NAMES = {
+    "win32": ("nvml.dll",),
+    "linux": ("libnvidia-ml.so.1", "libnvidia-ml.so")
+}
+
+
+class NvmlUtilization(ctypes.Structure):
+    _fields_ = [("gpu", ctypes.c_uint), ("memory", ctypes.c_uint)]
+
+
+class NvmlMemory(ctypes.Structure):
+    _fields_ = [("total", ctypes.c_ulonglong), ("free", ctypes.c_ulonglong), ("used", ctypes.c_ulonglong)]
+
+
+class Nvml:
+    def __init__(self, library=None):
+        self._library = library
+        self._lib = None
+        self._handles = []
+        self._names = []
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._failed = False
+
+    def _load(self):
+        candidates = [self._library] if self._library else list(LIBRARY_NAMES.get(sys.platform, ()))
+        found = ctypes.util.find_library("nvidia-ml")
+        if found and not self._library:
+            candidates.append(found)
+        for name in candidates:
+            try:
+                return ctypes.CDLL(name)
+            except OSError:
+                continue
+        return None
+
+    def available(self):
+        if self._initialized:
+            return True
+        if self._failed:
+            return False
+        with self._lock:
+            if not self._initialized and not self._failed:
+                self._initialized = self._init()
+                self._failed = not self._initialized
+        return self._initialized
+
+    def _init(self):
+        lib = self._load()
+        if lib is None:
+            return False
+        try:
+            if lib.nvmlInit_v2() != NVML_SUCCESS:
+                return False
+            count = ctypes.c_uint()
+            if lib.nvmlDeviceGetCount_v2(ctypes.byref(count)) != NVML_SUCCESS:
+                lib.nvmlShutdown()
+                return False
+            handles = []
+            names = []
+            for i in range(count.value):
+                handle = ctypes.c_void_p()
+                if lib.nvmlDeviceGetHandleByIndex_v2(i, ctypes.byref(handle)) != NVML_SUCCESS:
+                    continue
+                buffer = ctypes.create_string_buffer(NAME_BUFFER_SIZE)
+                lib.nvmlDeviceGetName(handle, buffer, NAME_BUFFER_SIZE)
+                handles.append(handle)
+                names.append(buffer.value.decode("utf-8", "replace"))
+        except AttributeError:
+            return False
+        self._lib = lib
+        self._handles = handles
+        self._names = names
+        return bool(handles)
+
+    def _uint(self, function, *args):
+        value = ctypes.c_uint()
+        if function(*args, ctypes.byref(value)) != NVML_SUCCESS:
+            return None
+        return float(value.value)
+
+    def latest(self):
+        if not self.available():
+            return []
+        lib = self._lib
+        gpus = []
+        with self._lock:
+            for i, handle in enumerate(self._handles):
+                utilization = NvmlUtilization()
+                usage = float(utilization.gpu) if lib.nvmlDeviceGetUtilizationRates(handle, ctypes.byref(utilization)) == NVML_SUCCESS else None
+                memory = NvmlMemory()
+                has_memory = lib.nvmlDeviceGetMemoryInfo(handle, ctypes.byref(memory)) == NVML_SUCCESS
+                gpus.append({
+                    "index": i,
+                    "name": self._names[i],
+                    "usage": usage,
+                    "temperature": self._uint(lib.nvmlDeviceGetTemperature, handle, NVML_TEMPERATURE_GPU),
+                    "memory_used": memory.used / 1048576.0 if has_memory else None,
+                    "memory_total": memory.total / 1048576.0 if has_memory else None,
+                    "clock_core": self._uint(lib.nvmlDeviceGetClockInfo, handle, NVML_CLOCK_GRAPHICS),
+                    "clock_memory": self._uint(lib.nvmlDeviceGetClockInfo, handle, NVML_CLOCK_MEM)
+                })
+        return gpus
+
+    def close(self):
+        with self._lock:
+            if self._initialized and self._lib is not None:
+                try:
+                    self._lib.nvmlShutdown()
+                except Exception:
+                    pass
+            self._lib = None
+            self._handles = []
+            self._initialized = False
+            self._failed = True
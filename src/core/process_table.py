@@ -0,0 +1,221 @@
+import heapq
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+from operator import itemgetter
+
+import psutil
+
+ProcessInfo = namedtuple("ProcessInfo", ["pid", "name", "cpu", "rss"])
+ProcessTop = namedtuple("ProcessTop", ["timestamp", "by_cpu", "by_rss", "count", "collect_ms"])
+
+DEFAULT_TOP_N = 5
+MIN_PROCESS_INTERVAL_MS = 500
+PRIME_DELAY = 0.5
+STAT_READ_SIZE = 1024
+
+def _sysconf(name, default):
+    try:
+        return os.sysconf(name)
+    except (AttributeError, ValueError, OSError):
+        return default
+
+CLOCK_TICKS = _sysconf("SC_CLK_TCK", 100)
+PAGE_SIZE = _sysconf("SC_PAGE_SIZE", 4096)
+
+def format_bytes(value):
+    if value >= 1 << 30:
+        return f"{value / (1 << 30):.1f} GB"
+    return f"{value / (1 << 20):.0f} MB"
+
+
+class ProcessTable:
+    def __init__(self, top_n=DEFAULT_TOP_N, proc_root="/proc", procfs=None):
+        self.top_n = top_n
+        self._proc_root = proc_root
+        if procfs is None:
+            procfs = sys.platform.startswith("linux") and os.path.isdir(proc_root)
+        self._procfs = procfs
+        self._cpu_count = psutil.cpu_count() or 1
+        self._entries = {}
+        self._denied = set()
+        self._last_collect = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def reset(self):
+        self._last_collect = None
+
+    def collect(self):
+        started = time.perf_counter_ns()
+        now = time.monotonic()
+        elapsed = now - self._last_collect if self._last_collect is not None else None
+        self._last_collect = now
+        if self._procfs:
+            rows = self._collect_procfs(elapsed)
+        else:
+            rows = self._collect_psutil()
+        if elapsed is None:
+            return None
+        n = self.top_n
+        by_cpu = [ProcessInfo(*row) for row in heapq.nlargest(n, rows, key=itemgetter(2))]
+        by_rss = [ProcessInfo(*row) for row in heapq.nlargest(n, rows, key=itemgetter(3))]
+        return ProcessTop(time.time(), by_cpu, by_rss, len(rows), (time.perf_counter_ns() - started) / 1_000_000)
+
+    def _read_stat(self, pid):
+        try:
+            fd = os.open(f"{self._proc_root}/{pid}/stat", os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            data = os.read(fd, STAT_READ_SIZE)
+        except OSError:
+            return None
+        finally:
+            os.close(fd)
+        close = data.rfind(b")")
+        if close < 0:
+            return None
+        fields = data[close + 2:].split()
+        try:
+            return data[data.find(b"(") + 1:close], int(fields[11]) + int(fields[12]), int(fields[19]), int(fields[21]) * PAGE_SIZE
+        except (IndexError, ValueError):
+            return None
+
+    def _collect_procfs(self, elapsed):
+        entries = self._entries
+        seen = {}
+        rows = []
+        scale = 100.0 / (elapsed * CLOCK_TICKS * self._cpu_count) if elapsed else 0.0
+        try:
+            names = os.listdir(self._proc_root)
+        except OSError:
+            return rows
+        for name in names:
+            if not name.isdigit():
+                continue
+            pid = int(name)
+            stat = self._read_stat(pid)
+            if stat is None:
+                continue
+            comm, ticks, start, rss = stat
+            entry = entries.get(pid)
+            if entry is None or entry[1] != start:
+                entry = [comm.decode("utf-8", "replace"), start, ticks]
+                cpu = 0.0
+            else:
+                cpu = (ticks - entry[2]) * scale
+                entry[2] = ticks
+            seen[pid] = entry
+            rows.append((pid, entry[0], cpu, rss))
+        self._entries = seen
+        return rows
+
+    def _collect_psutil(self):
+        entries = self._entries
+        seen = {}
+        rows = []
+        denied = self._denied
+        try:
+            pids = psutil.pids()
+        except Exception:
+            return rows
+        self._denied = denied = denied.intersection(pids)
+        for pid in pids:
+            if pid in denied:
+                continue
+            entry = entries.get(pid)
+            try:
+                if entry is None:
+                    process = psutil.Process(pid)
+                    entry = (process, process.name())
+                    process.cpu_percent(None)
+                    cpu = 0.0
+                    rss = process.memory_info().rss
+                else:
+                    process = entry[0]
+                    with process.oneshot():
+                        cpu = process.cpu_percent(None) / self._cpu_count
+                        rss = process.memory_info().rss
+            except psutil.AccessDenied:
+                denied.add(pid)
+                continue
+            except psutil.Error:
+                continue
+            seen[pid] = entry
+            rows.append((pid, entry[1], cpu, rss))
+        self._entries = seen
+        return rows
+
+
+class ProcessSampler:
+    def __init__(self, table, interval_ms=2000, callback=None):
+        self._table = table
+        self._interval = max(interval_ms, MIN_PROCESS_INTERVAL_MS) / 1000.0
+        self._callback = callback
+        self._wake = threading.Event()
+        self._paused = False
+        self._running = False
+        self._thread = None
+        self._latest = None
+
+    @property
+    def table(self):
+        return self._table
+
+    def latest(self):
+        return self._latest
+
+    def set_interval(self, interval_ms):
+        self._interval = max(interval_ms, MIN_PROCESS_INTERVAL_MS) / 1000.0
+        self._wake.set()
+
+    def set_top_n(self, top_n):
+        self._table.top_n = top_n
+        self._wake.set()
+
+    def set_paused(self, paused):
+        if paused == self._paused:
+            return
+        self._paused = paused
+        self._wake.set()
+
+    def is_running(self):
+        return self._running
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="ProcessSampler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=2.0):
+        self._running = False
+        self._wake.set()
+        thread = self._thread
+        self._thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def _run(self):
+        while self._running:
+            if self._paused:
+                self._table.reset()
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            try:
+                top = self._table.collect()
+            except Exception:
+                top = None
+            if top is not None:
+                self._latest = top
+                callback = self._callback
+                if callback is not None:
+                    callback(top)
+            self._wake.wait(self._interval if top is not None else PRIME_DELAY)
+            self._wake.clear()
@@ -0,0 +1,230 @@
+import os
+from array import array
+from operator import add
+from src.core.sysfs import sys_path, list_dir
+
+STAT_BUFFER_SIZE = 65536
+MEMINFO_BUFFER_SIZE = 8192
+NET_DEV_BUFFER_SIZE = 8192
+DISKSTATS_BUFFER_SIZE = 16384
+SECTOR_SIZE = 512
+STAT_LINE_SLACK = 64
+CPU_FIELDS = 8
+MEMINFO_KEYS = {
+    b"MemTotal:": "total",
+    b"MemFree:": "free",
+    b"MemAvailable:": "available",
+    b"Buffers:": "buffers",
+    b"Cached:": "cached",
+    b"SReclaimable:": "reclaimable",
+    b"Dirty:": "dirty",
+    b"SwapTotal:": "swap_total",
+    b"SwapFree:": "swap_free"
+}
+
+
+class ProcFile:
+    def __init__(self, path, size):
+        self._path = path
+        self._fd = None
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+
+    @property
+    def size(self):
+        return len(self._buffer)
+
+    def resize(self, size):
+        self._view.release()
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+
+    def read(self):
+        if self._fd is None:
+            self._fd = os.open(self._path, os.O_RDONLY)
+        try:
+            n = os.preadv(self._fd, [self._view], 0)
+        except OSError:
+            self.close()
+            raise
+        return self._view[:n]
+
+    def close(self):
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
+
+class ProcfsReader:
+    def __init__(self, root="/"):
+        self._root = root
+        self._stat = ProcFile(sys_path(root, "proc/stat"), STAT_BUFFER_SIZE)
+        self._meminfo = ProcFile(sys_path(root, "proc/meminfo"), MEMINFO_BUFFER_SIZE)
+        self._stat_sized = False
+        self._totals = array("Q")
+        self._idles = array("Q")
+        self._percents = array("d")
+        self._meminfo_index = None
+        self._meminfo_lines = 0
+        self._memory = None
+        self._net_dev = ProcFile(sys_path(root, "proc/net/dev"), NET_DEV_BUFFER_SIZE)
+        self._diskstats = ProcFile(sys_path(root, "proc/diskstats"), DISKSTATS_BUFFER_SIZE)
+        self._block_devices = None
+        self._diskstats_lines = None
+
+    def available(self):
+        try:
+            self._stat.read()
+            self._meminfo.read()
+        except OSError:
+            return False
+        return True
+
+    def _cpu_block(self):
+        data = bytes(self._stat.read())
+        end = data.find(b"\nintr")
+        if end < 0:
+            end = data.find(b"\nctxt")
+        if end < 0:
+            if len(data) < self._stat.size:
+                end = len(data)
+            else:
+                self._stat.resize(self._stat.size * 2)
+                self._stat_sized = False
+                return self._cpu_block()
+        block = data[:end]
+        if not self._stat_sized:
+            self._stat.resize(end + STAT_LINE_SLACK * (block.count(b"\n") + 1))
+            self._stat_sized = True
+        return block
+
+    def _read_cpu(self):
+        block = self._cpu_block()
+        lines = block.count(b"\n") + 1
+        tokens = block.split()
+        stride = len(tokens) // lines
+        if stride <= CPU_FIELDS or stride * lines != len(tokens) or not all(token.startswith(b"cpu") for token in tokens[::stride]):
+            return self._read_cpu_lines(block)
+        columns = [list(map(int, tokens[field::stride])) for field in range(1, CPU_FIELDS + 1)]
+        return array("Q", map(sum, zip(*columns))), array("Q", map(add, columns[3], columns[4]))
+
+    def _read_cpu_lines(self, block):
+        totals, idles = array("Q"), array("Q")
+        for line in block.split(b"\n"):
+            if not line.startswith(b"cpu"):
+                continue
+            values = [int(value) for value in line.split()[1:CPU_FIELDS + 1]]
+            totals.append(sum(values))
+            idles.append(values[3] + (values[4] if len(values) > 4 else 0))
+        return totals, idles
+
+    def cpu_percent(self):
+        totals, idles = self._read_cpu()
+        previous_totals, previous_idles = self._totals, self._idles
+        self._totals, self._idles = totals, idles
+        if len(previous_totals) != len(totals):
+            self._percents = array("d", [0.0] * len(totals))
+            return 0.0
+        percents = self._percents
+        for i, (total, idle, previous_total, previous_idle) in enumerate(zip(totals, idles, previous_totals, previous_idles)):
+            total_delta = total - previous_total
+            if total_delta > 0:
+                busy_delta = total_delta - (idle - previous_idle)
+                percents[i] = min(max(busy_delta * 100.0 / total_delta, 0.0), 100.0)
+        return percents[0]
+
+    def core_percents(self):
+        return list(self._percents[1:])
+
+    def _index_meminfo(self, lines):
+        index = {}
+        for i, line in enumerate(lines):
+            key = line.split(None, 1)[0] if line else b""
+            if key in MEMINFO_KEYS:
+                index[MEMINFO_KEYS[key]] = (i, key)
+        self._meminfo_lines = max((i for i, _ in index.values()), default=0) + 1
+        return index
+
+    def memory(self):
+        index = self._meminfo_index
+        if index is None:
+            lines = bytes(self._meminfo.read()).split(b"\n")
+            index = self._meminfo_index = self._index_meminfo(lines)
+        else:
+            lines = bytes(self._meminfo.read()).split(b"\n", self._meminfo_lines)
+        values = {}
+        for name, (i, key) in index.items():
+            line = lines[i] if i < len(lines) else b""
+            if not line.startswith(key):
+                self._meminfo_index = None
+                return self.memory()
+            values[name] = int(line.split(None, 2)[1]) * 1024
+        total = values.get("total", 0)
+        available = values.get("available")
+        if available is None:
+            available = values.get("free", 0) + values.get("buffers", 0) + values.get("cached", 0)
+        swap_total = values.get("swap_total", 0)
+        swap_free = values.get("swap_free", 0)
+        memory = {
+            "total": total,
+            "available": available,
+            "used": total - available,
+            "free": values.get("free", 0),
+            "cached": values.get("cached", 0) + values.get("reclaimable", 0),
+            "dirty": values.get("dirty", 0),
+            "swap_total": swap_total,
+            "swap_used": swap_total - swap_free,
+            "swap_free": swap_free,
+            "percent": (total - available) * 100.0 / total if total else 0.0
+        }
+        self._memory = memory
+        return memory
+
+    def memory_percent(self):
+        return self.memory()["percent"]
+
+    def last_memory(self):
+        return self._memory
+
+    def _read_full(self, file):
+        data = file.read()
+        while len(data) >= file.size:
+            file.resize(file.size * 2)
+            data = file.read()
+        return bytes(data)
+
+    def net_counters(self):
+        counters = {}
+        for line in self._read_full(self._net_dev).split(b"\n")[2:]:
+            name, sep, rest = line.partition(b":")
+            if not sep:
+                continue
+            fields = rest.split()
+            counters[name.strip().decode("utf-8", "replace")] = (int(fields[0]), int(fields[8]), int(fields[1]), int(fields[9]))
+        return counters
+
+    def disk_counters(self):
+        lines = self._read_full(self._diskstats).splitlines()
+        if len(lines) != self._diskstats_lines:
+            self._diskstats_lines = len(lines)
+            self._block_devices = set(list_dir(sys_path(self._root, "sys/block"))) or None
+        whole = self._block_devices
+        counters = {}
+        for line in lines:
+            fields = line.split(None, 10)
+            if len(fields) < 10:
+                continue
+            name = fields[2].decode("utf-8", "replace")
+            if whole is not None and name not in whole:
+                continue
+            counters[name] = (int(fields[5]) * SECTOR_SIZE, int(fields[9]) * SECTOR_SIZE, int(fields[3]), int(fields[7]))
+        return counters
+
+    def close(self):
+        self._stat.close()
+        self._meminfo.close()
+        self._net_dev.close()
+        self._diskstats.close()
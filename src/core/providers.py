@@ -0,0 +1,314 @@
+import time
+from functools import partial
+from src.core.throughput import psutil_net_counters, psutil_disk_counters
+
+LIST_METRICS = frozenset(("gpu", "gpu_temp"))
+PROBE_ROUNDS = 3
+REPROBE_INTERVAL = 30.0
+SHARED_READ_WINDOW = 0.02
+
+
+class SensorProvider:
+    name = "provider"
+    priority = 100
+
+    def __init__(self, readers):
+        self._readers = dict(readers)
+        self.metrics = frozenset(self._readers)
+
+    def probe(self):
+        return True
+
+    def reader(self, metric):
+        return self._readers[metric]
+
+    def read(self, metric):
+        return self._readers[metric]()
+
+
+class FunctionProvider(SensorProvider):
+    def __init__(self, name, readers, probe=None, priority=SensorProvider.priority):
+        super().__init__(readers)
+        self.name = name
+        self.priority = priority
+        self._probe = probe
+
+    def probe(self):
+        return self._probe() if self._probe is not None else True
+
+
+class LhmProvider(SensorProvider):
+    name = "lhm"
+    priority = 10
+
+    def __init__(self, monitor):
+        super().__init__({
+            "cpu": partial(monitor.read_sensor, "cpu.load.total"),
+            "ram": partial(monitor.read_sensor, "memory.load"),
+            "cpu_temp": self._cpu_temp,
+            "gpu": self._gpu,
+            "gpu_temp": self._gpu_temp
+        })
+        self._monitor = monitor
+
+    def probe(self):
+        return self._monitor.lhm_ready()
+
+    def _first_positive(self, key):
+        for sensor in self._monitor.lhm_sensors(key):
+            value = sensor.Value
+            if value is not None and value > 0:
+                return float(value)
+        return None
+
+    def _cpu_temp(self):
+        return self._first_positive("cpu.temp")
+
+    def _gpu(self):
+        gpus = self._monitor.lhm_gpus()
+        if not gpus:
+            return None
+        return [(gpu["name"], self._monitor.read_sensor(gpu["load"]) or 0.0) for gpu in gpus]
+
+    def _gpu_temp(self):
+        temps = []
+        for gpu in self._monitor.lhm_gpus():
+            value = self._first_positive(gpu["temp"])
+            if value is not None:
+                temps.append((gpu["name"], value))
+        return temps or None
+
+
+class PsutilProvider(SensorProvider):
+    name = "psutil"
+    priority = 60
+
+    def __init__(self, psutil):
+        super().__init__({
+            "cpu": partial(psutil.cpu_percent, interval=None),
+            "ram": lambda: psutil.virtual_memory().percent,
+            "net": partial(psutil_net_counters, psutil),
+            "disk": partial(psutil_disk_counters, psutil)
+        })
+
+
+class ProcfsProvider(SensorProvider):
+    name = "procfs"
+    priority = 50
+
+    def __init__(self, reader):
+        super().__init__({"cpu": reader.cpu_percent, "ram": reader.memory_percent, "net": reader.net_counters, "disk": reader.disk_counters})
+        self._reader = reader
+
+    def probe(self):
+        return self._reader.available()
+
+
+class HwmonProvider(SensorProvider):
+    name = "hwmon"
+    priority = 40
+
+    def __init__(self, backend):
+        super().__init__({"cpu_temp": backend.cpu_temperature, "gpu_temp": backend.gpu_temperatures})
+        self._backend = backend
+
+    def probe(self):
+        return bool(self._backend.sensors())
+
+
+class NvidiaProvider(SensorProvider):
+    name = "nvidia"
+    priority = 20
+
+    def __init__(self, nvml, nvidia_smi):
+        super().__init__({"gpu": self._gpu, "gpu_temp": self._gpu_temp})
+        self._nvml = nvml
+        self._nvidia_smi = nvidia_smi
+
+    def probe(self):
+        return self._nvml.available() or self._nvidia_smi.available()
+
+    def gpus(self):
+        if self._nvml.available():
+            return self._nvml.latest()
+        if self._nvidia_smi.available():
+            return self._nvidia_smi.latest()
+        return None
+
+    def _gpu(self):
+        gpus = self.gpus()
+        return None if gpus is None else [(gpu["name"], gpu["usage"] or 0.0) for gpu in gpus]
+
+    def _gpu_temp(self):
+        gpus = self.gpus()
+        return None if gpus is None else [(gpu["name"], gpu["temperature"]) for gpu in gpus if gpu["temperature"] is not None]
+
+
+class SysfsGpuProvider(SensorProvider):
+    name = "sysfs"
+    priority = 30
+
+    def __init__(self, backend, clock=time.monotonic):
+        super().__init__({"gpu": self._gpu, "gpu_temp": self._gpu_temp})
+        self._backend = backend
+        self._clock = clock
+        self._gpus = None
+        self._read_at = None
+
+    def probe(self):
+        return bool(self._backend.gpus())
+
+    def gpus(self):
+        now = self._clock()
+        if self._read_at is None or now - self._read_at >= SHARED_READ_WINDOW:
+            self._gpus = self._backend.read()
+            self._read_at = now
+        return self._gpus
+
+    def _gpu(self):
+        return [(gpu["name"], gpu["usage"]) for gpu in self.gpus() if gpu["usage"] is not None]
+
+    def _gpu_temp(self):
+        return [(gpu["name"], gpu["temperature"]) for gpu in self.gpus() if gpu["temperature"] is not None]
+
+
+def merge_devices(lists):
+    merged = []
+    seen = {}
+    for items in lists:
+        counts = {}
+        for item in items:
+            count = counts[item[0]] = counts.get(item[0], 0) + 1
+            if count > seen.get(item[0], 0):
+                merged.append(item)
+        for name, count in counts.items():
+            seen[name] = max(seen.get(name, 0), count)
+    return merged
+
+def merged_reader(readers):
+    def read():
+        values = [value for value in (reader() for reader in readers) if value is not None]
+        return merge_devices(values) if values else None
+    return read
+
+
+class ProviderRegistry:
+    def __init__(self, providers=(), clock=time.monotonic):
+        self._providers = list(providers)
+        self._clock = clock
+        self._dispatch = {}
+        self._selected = {}
+        self._retry_at = {}
+        self._failed = {}
+        self._timings = {}
+
+    def register(self, provider):
+        self._providers.append(provider)
+        self.invalidate()
+
+    def providers(self):
+        return list(self._providers)
+
+    def invalidate(self):
+        self._dispatch = {}
+        self._selected = {}
+        self._retry_at = {}
+        self._failed = {}
+
+    def selected(self):
+        return {metric: [provider.name for provider in providers] for metric, providers in self._selected.items()}
+
+    def timings(self):
+        return {metric: dict(timings) for metric, timings in self._timings.items()}
+
+    def read(self, metric):
+        reader = self._dispatch.get(metric)
+        retry_at = self._retry_at.get(metric)
+        if retry_at is not None and reader is not None and self._clock() >= retry_at:
+            value = self._probe(metric)
+            if value is not None:
+                return value
+            reader = None
+        if reader is not None:
+            try:
+                value = reader()
+            except Exception:
+                value = None
+            if value is not None:
+                return value
+        return self._recover(metric)
+
+    def _read_once(self, provider, metric):
+        try:
+            return provider.read(metric)
+        except Exception:
+            return None
+
+    def _recover(self, metric):
+        now = self._clock()
+        selected = self._selected.get(metric)
+        if selected is None:
+            return self._probe(metric)
+        if not selected:
+            return self._probe(metric) if now >= self._retry_at.get(metric, 0) else None
+        for provider in selected:
+            if self._read_once(provider, metric) is None:
+                self._failed[(metric, provider)] = now + REPROBE_INTERVAL
+        return self._probe(metric)
+
+    def _probe(self, metric):
+        now = self._clock()
+        candidates = []
+        retry_at = None
+        for provider in self._providers:
+            if metric not in provider.metrics:
+                continue
+            failed_until = self._failed.get((metric, provider), 0)
+            if failed_until <= now:
+                best = None
+                try:
+                    if not provider.probe():
+                        continue
+                    for _ in range(PROBE_ROUNDS):
+                        started = time.perf_counter_ns()
+                        value = provider.read(metric)
+                        elapsed = time.perf_counter_ns() - started
+                        if value is None:
+                            break
+                        best = elapsed if best is None else min(best, elapsed)
+                except Exception:
+                    value = None
+                if value is None:
+                    failed_until = self._failed[(metric, provider)] = now + REPROBE_INTERVAL
+            if failed_until > now:
+                retry_at = failed_until if retry_at is None else min(retry_at, failed_until)
+            else:
+                coverage = len(value) if metric in LIST_METRICS else 1
+                candidates.append((provider.priority, -coverage, best, provider, value))
+        self._timings[metric] = {provider.name: round(best / 1000, 1) for _, _, best, provider, _ in candidates}
+        self._dispatch.pop(metric, None)
+        if not candidates:
+            self._selected[metric] = ()
+            self._retry_at[metric] = now + REPROBE_INTERVAL if retry_at is None else retry_at
+            return None
+        if retry_at is None:
+            self._retry_at.pop(metric, None)
+        else:
+            self._retry_at[metric] = retry_at
+        candidates.sort(key=lambda candidate: candidate[:3])
+        if metric in LIST_METRICS:
+            chosen = []
+            covered = 0
+            for candidate in candidates:
+                merged = merge_devices([value for *_, value in chosen] + [candidate[4]])
+                if len(merged) > covered:
+                    chosen.append(candidate)
+                    covered = len(merged)
+            self._selected[metric] = tuple(candidate[3] for candidate in chosen)
+            readers = [provider.reader(metric) for provider in self._selected[metric]]
+            self._dispatch[metric] = readers[0] if len(readers) == 1 else merged_reader(readers)
+            return merge_devices([candidate[4] for candidate in chosen])
+        best = candidates[0]
+        self._selected[metric] = (best[3],)
+        self._dispatch[metric] = best[3].reader(metric)
+        return best[4]
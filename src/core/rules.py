@@ -0,0 +1,224 @@
+import math
+import os
+import subprocess
+import sys
+import threading
+from bisect import bisect_right
+from datetime import datetime
+
+KINDS = ("cpu", "ram", "gpu", "cpu_temp", "gpu_temp", "process", "fleet")
+RULE_KINDS = {
+    "usage": ("cpu", "ram", "gpu", "process", "fleet"),
+    "temp": ("cpu_temp", "gpu_temp"),
+    "cpu": ("cpu",),
+    "ram": ("ram",),
+    "gpu": ("gpu",),
+    "cpu_temp": ("cpu_temp",),
+    "gpu_temp": ("gpu_temp",),
+    "process": ("process",),
+    "fleet": ("fleet",)
+}
+PALETTE_NAMES = ("low", "medium", "high")
+DEFAULT_RULES = [
+    {"metric": "usage", "above": 50, "color": "medium"},
+    {"metric": "usage", "above": 80, "color": "high"},
+    {"metric": "temp", "above": 50, "color": "medium"},
+    {"metric": "temp", "above": 75, "color": "high"}
+]
+NOTIFY_TITLE = "Overlay"
+INF = math.inf
+
+
+class Rule:
+    __slots__ = ("metric", "above", "hysteresis", "sustain", "color", "notify", "log", "command")
+
+    def __init__(self, metric, above, hysteresis, sustain, color, notify, log, command):
+        self.metric = metric
+        self.above = above
+        self.hysteresis = hysteresis
+        self.sustain = sustain
+        self.color = color
+        self.notify = notify
+        self.log = log
+        self.command = command
+
+    @property
+    def exit(self):
+        return self.above - self.hysteresis
+
+
+class _Ladder:
+    __slots__ = ("rules", "thresholds", "colors")
+
+    def __init__(self, rules, default_color):
+        self.rules = sorted(rules, key=lambda rule: rule.above)
+        self.thresholds = [rule.above for rule in self.rules]
+        self.colors = []
+        color = default_color
+        for rule in self.rules:
+            color = rule.color or color
+            self.colors.append(color)
+        self.colors.append(default_color)
+
+
+class _Channel:
+    __slots__ = ("kind", "level", "low", "high", "pending", "color")
+
+    def __init__(self, kind, ladder):
+        self.kind = kind
+        self.level = -1
+        self.low = -INF
+        self.high = ladder.thresholds[0] if ladder.thresholds else INF
+        self.pending = None
+        self.color = ladder.colors[-1]
+
+
+def _number(value, default=0.0):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return default
+    return float(value)
+
+def compile_rules(rules, palette):
+    compiled = []
+    for rule in rules or ():
+        if not isinstance(rule, dict) or rule.get("metric") not in RULE_KINDS:
+            continue
+        above = rule.get("above")
+        if isinstance(above, bool) or not isinstance(above, (int, float)):
+            continue
+        color = rule.get("color")
+        if color in PALETTE_NAMES:
+            color = palette.get(color)
+        notify = rule.get("notify")
+        command = rule.get("command")
+        compiled.append(Rule(
+            rule["metric"],
+            float(above),
+            max(_number(rule.get("hysteresis")), 0.0),
+            max(_number(rule.get("sustain_s")), 0.0),
+            color if isinstance(color, str) and color else None,
+            notify if isinstance(notify, str) and notify else bool(notify),
+            rule.get("log") if isinstance(rule.get("log"), str) else bool(rule.get("log")),
+            command if isinstance(command, str) and command else None
+        ))
+    return compiled
+
+def snapshot_channels(snapshot):
+    channels = [("cpu", "cpu", snapshot.cpu_usage), ("ram", "ram", snapshot.ram_usage), ("cpu_temp", "cpu_temp", snapshot.cpu_temp)]
+    for i, (_, usage) in enumerate(snapshot.gpu_info or ()):
+        channels.append((f"gpu{i}", "gpu", usage))
+    for i, (_, temp) in enumerate(snapshot.gpu_temps or ()):
+        channels.append((f"gpu_temp{i}", "gpu_temp", temp))
+    return channels
+
+
+class RulesEngine:
+    def __init__(self, rules=None, palette=None, default_color=None, notify=None, log_path=None):
+        palette = dict(palette or {})
+        self.rules = compile_rules(DEFAULT_RULES if rules is None else rules, palette)
+        self._default_color = default_color or palette.get("low")
+        self._ladders = {kind: _Ladder([rule for rule in self.rules if kind in RULE_KINDS[rule.metric]], self._default_color) for kind in KINDS}
+        self._channels = {}
+        self._notify = notify
+        self._log_path = log_path
+        self._log_lock = threading.Lock()
+        self._commands = []
+        self.transitions = 0
+
+    def color(self, channel):
+        state = self._channels.get(channel)
+        return state.color if state is not None else self._default_color
+
+    def color_for(self, kind, value):
+        ladder = self._ladders[kind]
+        return ladder.colors[bisect_right(ladder.thresholds, value) - 1]
+
+    def active(self):
+        return {channel: self._ladders[state.kind].rules[state.level] for channel, state in self._channels.items() if state.level >= 0}
+
+    def evaluate(self, snapshot):
+        events = []
+        now = snapshot.timestamp
+        channels = self._channels
+        ladders = self._ladders
+        for channel, kind, value in snapshot_channels(snapshot):
+            if value is None:
+                continue
+            state = channels.get(channel)
+            if state is None:
+                state = channels[channel] = _Channel(kind, ladders[kind])
+            if state.low <= value < state.high and state.pending is None:
+                continue
+            self._transition(channel, ladders[kind], state, value, now, events)
+        for event in events:
+            self._run_actions(*event)
+        return events
+
+    def _transition(self, channel, ladder, state, value, now, events):
+        rules = ladder.rules
+        level = state.level
+        while level >= 0 and value < rules[level].exit:
+            events.append((channel, rules[level], False, value, now))
+            level -= 1
+        target = bisect_right(ladder.thresholds, value) - 1
+        pending = state.pending
+        if target > level:
+            if pending is None:
+                pending = {}
+            for candidate in range(level + 1, target + 1):
+                since = pending.setdefault(candidate, now)
+                if now - since < rules[candidate].sustain:
+                    break
+                del pending[candidate]
+                level = candidate
+                events.append((channel, rules[level], True, value, now))
+            for candidate in [candidate for candidate in pending if candidate > target]:
+                del pending[candidate]
+            state.pending = pending or None
+        else:
+            state.pending = None
+        state.level = level
+        state.low = rules[level].exit if level >= 0 else -INF
+        state.high = ladder.thresholds[level + 1] if level + 1 < len(rules) else INF
+        state.color = ladder.colors[level]
+
+    def _run_actions(self, channel, rule, entered, value, timestamp):
+        self.transitions += 1
+        message = self._message(rule, channel, value, entered)
+        if entered and rule.notify and self._notify is not None:
+            try:
+                self._notify(NOTIFY_TITLE, message)
+            except Exception:
+                pass
+        if rule.log and self._log_path:
+            self._write_log(timestamp, message)
+        if entered and rule.command:
+            self._spawn(rule, channel, value)
+
+    def _message(self, rule, channel, value, entered):
+        template = rule.notify if entered and isinstance(rule.notify, str) else rule.log if isinstance(rule.log, str) else None
+        if template:
+            try:
+                return template.format(metric=channel, value=value, above=rule.above)
+            except (KeyError, IndexError, ValueError):
+                return template
+        state = "above" if entered else "back below"
+        return f"{channel} {value:.1f} {state} {rule.exit if not entered else rule.above:g}"
+
+    def _write_log(self, timestamp, message):
+        line = f"{datetime.fromtimestamp(timestamp).isoformat(timespec='seconds')} {message}\n"
+        with self._log_lock:
+            try:
+                with open(self._log_path, "a", encoding="utf-8") as f:
+                    f.write(line)
+            except OSError:
+                pass
+
+    def _spawn(self, rule, channel, value):
+        self._commands = [process for process in self._commands if process.poll() is None]
+        env = dict(os.environ, OVERLAY_METRIC=channel, OVERLAY_VALUE=f"{value:.1f}", OVERLAY_THRESHOLD=f"{rule.above:g}")
+        flags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+        try:
+            self._commands.append(subprocess.Popen(rule.command, shell=True, env=env, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, creationflags=flags))
+        except OSError:
+            pass
@@ -0,0 +1,225 @@
+import threading
+import time
+from src.core.system_monitor import METRICS, BACKEND_METRICS, enabled_metrics
+
+COALESCE_WINDOW = 0.025
+THROTTLE_PAUSE = "pause"
+THROTTLE_LOW = "low"
+MIN_METRIC_INTERVAL_MS = 50
+
+def parse_metric_intervals(value):
+    intervals = {}
+    for metric, interval in (value or {}).items():
+        if metric not in METRICS or not isinstance(interval, (int, float)) or interval < 0:
+            continue
+        intervals[metric] = 0 if interval == 0 else max(int(interval), MIN_METRIC_INTERVAL_MS)
+    return intervals
+
+class Sampler:
+    def __init__(self, monitor, interval_ms=1000, intervals=None, **sample_options):
+        self._monitor = monitor
+        self._interval = interval_ms / 1000.0
+        self._intervals = dict(intervals or {})
+        self._sample_options = sample_options
+        self._enabled = enabled_metrics(**sample_options)
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._force = True
+        self._running = False
+        self._thread = None
+        self._latest = None
+        self._next_due = {}
+        self._last_sample_ns = 0
+        self._sample_count = 0
+        self._started_at = None
+        self._reads = {}
+        self._coalesced_reads = 0
+        self._throttle = None
+        self._throttle_interval = None
+        self._throttle_since = None
+        self._throttled = {THROTTLE_PAUSE: 0.0, THROTTLE_LOW: 0.0}
+        self._throughput = None
+        self.profiler = None
+
+    @property
+    def monitor(self):
+        return self._monitor
+
+    def latest(self):
+        return self._latest
+
+    def metric_interval(self, metric):
+        interval = self._intervals.get(metric)
+        if interval is None:
+            return self._interval
+        if interval <= 0:
+            return None
+        return interval / 1000.0
+
+    def _effective_interval(self, metric):
+        interval = self.metric_interval(metric)
+        if interval is not None and self._throttle == THROTTLE_LOW and self._throttle_interval:
+            return max(interval, self._throttle_interval)
+        return interval
+
+    def stats(self):
+        return {
+            "samples": self._sample_count,
+            "last_sample_ms": self._last_sample_ns / 1_000_000,
+            "interval_ms": self._interval * 1000,
+            "reads": dict(self._reads),
+            "reads_saved": self._reads_saved(),
+            "coalesced_reads": self._coalesced_reads,
+            "throttle": self._throttle,
+            "throttled_s": self.throttled_seconds()
+        }
+
+    def throttled_seconds(self):
+        throttled = dict(self._throttled)
+        if self._throttle is not None:
+            throttled[self._throttle] += time.monotonic() - self._throttle_since
+        return throttled
+
+    def set_throttle(self, mode, interval_ms=None):
+        interval = interval_ms / 1000.0 if interval_ms else None
+        if mode == self._throttle and interval == self._throttle_interval:
+            return
+        now = time.monotonic()
+        if self._throttle is not None:
+            self._throttled[self._throttle] += now - self._throttle_since
+        self._throttle = mode
+        self._throttle_interval = interval
+        self._throttle_since = now if mode is not None else None
+        if mode is None:
+            self.request_sample()
+        else:
+            self._wake.set()
+
+    def _reads_saved(self):
+        if self._started_at is None:
+            return 0
+        fixed_rate = int((time.monotonic() - self._started_at) / self._interval) + 1
+        return sum(max(fixed_rate - count, 0) for metric, count in self._reads.items() if metric in BACKEND_METRICS)
+
+    def add_callback(self, callback):
+        with self._lock:
+            if callback not in self._callbacks:
+                self._callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def set_interval(self, interval_ms):
+        self._interval = interval_ms / 1000.0
+        self._reschedule()
+
+    def _reschedule(self):
+        self._next_due = {metric: due for metric, due in self._next_due.items() if due == float("inf")}
+        self._wake.set()
+
+    def set_intervals(self, intervals):
+        intervals = dict(intervals or {})
+        if intervals == self._intervals:
+            return
+        self._intervals = intervals
+        self._reschedule()
+
+    def set_sample_options(self, **sample_options):
+        self._sample_options = sample_options
+        self._enabled = enabled_metrics(**sample_options)
+
+    def configure_throughput(self, smoothing_ms, interfaces=(), disks=()):
+        self._throughput = (smoothing_ms, tuple(interfaces or ()), tuple(disks or ()))
+
+    def request_sample(self):
+        self._force = True
+        self._wake.set()
+
+    def is_running(self):
+        return self._running
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="SystemSampler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=2.0):
+        self._running = False
+        self._wake.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        self._thread = None
+
+    def _due_metrics(self, enabled, now):
+        next_due = self._next_due
+        if self._force:
+            self._force = False
+            return {metric for metric in enabled if next_due.get(metric) != float("inf")}
+        horizon = now + COALESCE_WINDOW
+        return {metric for metric in enabled if metric not in next_due or next_due[metric] <= horizon}
+
+    def _schedule(self, due, now):
+        for metric in due:
+            interval = self._effective_interval(metric)
+            self._next_due[metric] = now + interval if interval is not None else float("inf")
+
+    def _run(self):
+        while self._running:
+            if self._throttle == THROTTLE_PAUSE:
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            enabled = self._enabled
+            now = time.monotonic()
+            due = self._due_metrics(enabled, now)
+            if "inventory" in due and "gpu" in enabled:
+                due.add("gpu")
+            if due:
+                self._schedule(due, now)
+                self._sample(frozenset(due), enabled)
+            upcoming = [self._next_due.get(metric, now) for metric in enabled]
+            remaining = min(upcoming, default=now + self._interval) - time.monotonic()
+            self._wake.wait(max(0.0, min(remaining, 3600.0)))
+            self._wake.clear()
+
+    def _apply_throughput(self):
+        throughput = self._throughput
+        if throughput is None:
+            return
+        self._throughput = None
+        try:
+            self._monitor.configure_throughput(*throughput)
+        except Exception:
+            pass
+
+    def _sample(self, due, enabled):
+        self._apply_throughput()
+        started = time.perf_counter_ns()
+        try:
+            snapshot = self._monitor.sample_metrics(due, self._latest, enabled)
+        except Exception:
+            snapshot = None
+        self._last_sample_ns = time.perf_counter_ns() - started
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.record("sample", self._last_sample_ns)
+        if snapshot is None or not self._running:
+            return
+        for metric in due:
+            self._reads[metric] = self._reads.get(metric, 0) + 1
+        self._coalesced_reads += max(len(due & BACKEND_METRICS) - 1, 0)
+        self._latest = snapshot
+        self._sample_count += 1
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback(snapshot)
+            except Exception:
+                pass
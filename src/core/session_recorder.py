@@ -0,0 +1,251 @@
+import json
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from bisect import bisect_right
+from datetime import datetime
+from src.core.system_monitor import SystemSnapshot, OPTIONAL_FIELDS, gpu_devices
+
+MAGIC = b"OVLREC\x00\x01"
+PREAMBLE = struct.Struct("<8sII")
+DEFAULT_BATCH_RECORDS = 600
+NAN = float("nan")
+
+def snapshot_columns(gpu_count):
+    columns = ["cpu", "ram", "cpu_temp"]
+    columns += [f"gpu{i}" for i in range(gpu_count)]
+    columns += [f"gpu_temp{i}" for i in range(gpu_count)]
+    return columns
+
+def snapshot_gpu_names(snapshot):
+    return [name for name, _, _ in gpu_devices(snapshot)]
+
+def snapshot_values(snapshot, gpu_names):
+    devices = {}
+    for name, usage, temp in gpu_devices(snapshot):
+        devices.setdefault(name, []).append((usage, temp))
+    gpus = [devices[name].pop(0) if devices.get(name) else (None, None) for name in gpu_names]
+    values = [snapshot.cpu_usage, snapshot.ram_usage, snapshot.cpu_temp]
+    values += [usage for usage, _ in gpus]
+    values += [temp for _, temp in gpus]
+    return [NAN if value is None else value for value in values]
+
+def values_snapshot(timestamp, cpu_name, gpu_names, values):
+    gpu_count = len(gpu_names)
+    gpu_usage = values[3:3 + gpu_count]
+    gpu_temps = values[3 + gpu_count:3 + 2 * gpu_count]
+    return SystemSnapshot(
+        timestamp=timestamp,
+        time_text=datetime.fromtimestamp(timestamp).strftime("%H:%M:%S"),
+        cpu_name=cpu_name,
+        cpu_usage=values[0] or 0.0,
+        ram_usage=values[1] or 0.0,
+        cpu_temp=values[2],
+        gpu_info=tuple((name, usage) for name, usage in zip(gpu_names, gpu_usage) if usage is not None),
+        gpu_temps=tuple((name, temp) for name, temp in zip(gpu_names, gpu_temps) if temp is not None) or None
+    )
+
+
+class SessionRecorder:
+    def __init__(self, path, batch_records=DEFAULT_BATCH_RECORDS):
+        self._path = path
+        self._batch_records = max(int(batch_records), 1)
+        self._lock = threading.Lock()
+        self._file = None
+        self._record = None
+        self._buffer = None
+        self._pending = 0
+        self._gpu_names = ()
+        self._records = 0
+        self._closed = False
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def records(self):
+        return self._records
+
+    def _open(self, snapshot):
+        self._gpu_names = snapshot_gpu_names(snapshot)
+        columns = snapshot_columns(len(self._gpu_names))
+        self._record = struct.Struct(f"<d{len(columns)}f")
+        self._buffer = bytearray(self._record.size * self._batch_records)
+        header = json.dumps({
+            "columns": columns,
+            "cpu_name": snapshot.cpu_name,
+            "gpu_names": self._gpu_names,
+            "started": snapshot.timestamp
+        }).encode("utf-8")
+        directory = os.path.dirname(self._path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+        self._file = open(self._path, "wb")
+        self._file.write(PREAMBLE.pack(MAGIC, self._record.size, len(header)) + header)
+
+    def record(self, snapshot):
+        with self._lock:
+            if self._closed:
+                return
+            if self._file is None:
+                self._open(snapshot)
+            self._record.pack_into(self._buffer, self._pending * self._record.size, snapshot.timestamp, *snapshot_values(snapshot, self._gpu_names))
+            self._pending += 1
+            self._records += 1
+            if self._pending == self._batch_records:
+                self._flush()
+
+    def _flush(self):
+        if self._pending:
+            self._file.write(memoryview(self._buffer)[:self._pending * self._record.size])
+            self._pending = 0
+        self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._file is not None:
+                self._flush()
+                self._file.close()
+                self._file = None
+
+
+class SessionReader:
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, record_size, header_size = PREAMBLE.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a session recording")
+        header = json.loads(self._mmap[PREAMBLE.size:PREAMBLE.size + header_size].decode("utf-8"))
+        self.columns = header["columns"]
+        self.cpu_name = header.get("cpu_name", "CPU")
+        self.gpu_names = header.get("gpu_names", [])
+        self._record = struct.Struct(f"<d{len(self.columns)}f")
+        if self._record.size != record_size:
+            self.close()
+            raise ValueError(f"{path} has an unexpected record size")
+        self._offset = PREAMBLE.size + header_size
+        self._count = (len(self._mmap) - self._offset) // record_size
+        self._timestamps = None
+
+    def __len__(self):
+        return self._count
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def record(self, index):
+        values = self._record.unpack_from(self._mmap, self._offset + index * self._record.size)
+        return values[0], values[1:]
+
+    def records(self):
+        end = self._offset + self._count * self._record.size
+        return self._record.iter_unpack(memoryview(self._mmap)[self._offset:end])
+
+    def timestamps(self):
+        if self._timestamps is None:
+            self._timestamps = [values[0] for values in self.records()]
+        return self._timestamps
+
+    def column(self, name):
+        position = self.columns.index(name) + 1
+        return [values[position] for values in self.records()]
+
+    def index_at(self, timestamp):
+        return max(bisect_right(self.timestamps(), timestamp) - 1, 0)
+
+    def snapshot(self, index):
+        timestamp, values = self.record(index)
+        values = [None if math.isnan(value) else round(value, 2) for value in values]
+        return values_snapshot(timestamp, self.cpu_name, self.gpu_names, values)
+
+
+class ReplayMonitor:
+    def __init__(self, path, speed=1.0, loop=False, **_monitor_options):
+        self._reader = SessionReader(path)
+        if not len(self._reader):
+            self._reader.close()
+            raise ValueError(f"{path} contains no records")
+        self._speed = max(float(speed), 0.01)
+        self._loop = loop
+        self._lock = threading.Lock()
+        self._started = None
+        self._first = self._reader.record(0)[0]
+        self._duration = self._reader.record(len(self._reader) - 1)[0] - self._first
+        self._current = None
+        self.on_backend_ready = None
+
+    @property
+    def reader(self):
+        return self._reader
+
+    @property
+    def cpu_name(self):
+        return self._reader.cpu_name
+
+    @property
+    def backend_ready(self):
+        return True
+
+    def wait_backend_ready(self, timeout=None):
+        return True
+
+    def startup_timings(self):
+        return {"first_sample_ms": 0.0, "backend_ready_ms": 0.0, "full_sensors_ms": 0.0}
+
+    def finished(self):
+        if self._loop or self._started is None:
+            return False
+        return (time.monotonic() - self._started) * self._speed >= self._duration
+
+    def _position(self):
+        if self._started is None:
+            self._started = time.monotonic()
+        elapsed = (time.monotonic() - self._started) * self._speed
+        if self._loop and self._duration > 0:
+            elapsed %= self._duration
+        return self._reader.index_at(self._first + elapsed)
+
+    def sample(self, cpu_temp=True, gpu=True, gpu_temp=True, net=False, disk=False):
+        return self.sample_metrics(frozenset(), enabled=None)
+
+    def sample_metrics(self, metrics, previous=None, enabled=None):
+        with self._lock:
+            snapshot = self._reader.snapshot(self._position())
+            if enabled is not None:
+                cleared = {field: default for metric, (field, default) in OPTIONAL_FIELDS.items() if metric not in enabled}
+                if cleared:
+                    snapshot = snapshot._replace(**cleared)
+            self._current = snapshot
+            return snapshot
+
+    def get_gpu_info(self):
+        snapshot = self._current or self._reader.snapshot(0)
+        return list(snapshot.gpu_info)
+
+    def get_cpu_name(self):
+        return self._reader.cpu_name
+
+    def clear_cache(self):
+        pass
+
+    def configure_throughput(self, smoothing_ms, interfaces=(), disks=()):
+        pass
+
+    def throughput_devices(self):
+        return [], []
+
+    def close(self):
+        with self._lock:
+            self._reader.close()
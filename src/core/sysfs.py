@@ -0,0 +1,67 @@
+import os
+
+READ_SIZE = 64
+
+def sys_path(root, *parts):
+    return os.path.join(root or "/", *[part.lstrip("/") for part in parts])
+
+def read_text(path, default=None):
+    try:
+        with open(path, "r") as f:
+            return f.read().strip()
+    except OSError:
+        return default
+
+def list_dir(path):
+    try:
+        return sorted(os.listdir(path))
+    except OSError:
+        return []
+
+
+class CachedFile:
+    def __init__(self, path, size=READ_SIZE):
+        self._path = path
+        self._size = size
+        self._fd = None
+
+    @property
+    def path(self):
+        return self._path
+
+    def exists(self):
+        return os.path.exists(self._path)
+
+    def read(self):
+        if self._fd is None:
+            self._fd = os.open(self._path, os.O_RDONLY)
+        try:
+            return os.pread(self._fd, self._size, 0)
+        except OSError:
+            self.close()
+            raise
+
+    def read_int(self):
+        try:
+            return int(self.read())
+        except (OSError, ValueError):
+            return None
+
+    def read_float(self, scale=1.0):
+        value = self.read_int()
+        return value / scale if value is not None else None
+
+    def close(self):
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+
+    def __del__(self):
+        self.close()
+
+
+def cached_file(path):
+    return CachedFile(path) if os.path.exists(path) else None
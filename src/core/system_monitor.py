@@ -1,24 +1,139 @@
 import psutil
 import datetime
 import subprocess
-import shutil
 import platform
 import time
 import os
 import sys
+import threading
+from collections import namedtuple
+from src.core.nvidia_smi import NvidiaSmiStream
+from src.core.nvml import Nvml
+from src.core.linux_gpu import SysfsGpuBackend
+from src.core.hwmon import HwmonBackend
+from src.core.procfs import ProcfsReader
+from src.core.throughput import RateMeter, NetRate, DiskRate, NET_EXCLUDE, DISK_EXCLUDE
+from src.core.providers import ProviderRegistry, LhmProvider, PsutilProvider, NvidiaProvider, SysfsGpuProvider, HwmonProvider, ProcfsProvider
+
+SystemSnapshot = namedtuple(
+    "SystemSnapshot",
+    ["timestamp", "time_text", "cpu_name", "cpu_usage", "ram_usage", "cpu_temp", "gpu_info", "gpu_temps", "net_io", "disk_io"],
+    defaults=(None, (), None, None, None)
+)
+
+METRICS = ("clock", "cpu", "ram", "cpu_temp", "gpu", "gpu_temp", "inventory", "net", "disk")
+BACKEND_METRICS = frozenset(("cpu", "ram", "cpu_temp", "gpu", "gpu_temp", "inventory"))
+OPTIONAL_FIELDS = {
+    "cpu_temp": ("cpu_temp", None),
+    "gpu": ("gpu_info", ()),
+    "gpu_temp": ("gpu_temps", None),
+    "net": ("net_io", None),
+    "disk": ("disk_io", None)
+}
+
+def gpu_devices(snapshot):
+    temps = {}
+    for name, temp in snapshot.gpu_temps or ():
+        temps.setdefault(name, []).append(temp)
+    devices = []
+    for name, usage in snapshot.gpu_info or ():
+        matched = temps.get(name)
+        devices.append((name, usage, matched.pop(0) if matched else None))
+    for name, remaining in temps.items():
+        devices.extend((name, None, temp) for temp in remaining)
+    return devices
+
+def enabled_metrics(cpu_temp=True, gpu=True, gpu_temp=True, net=False, disk=False):
+    metrics = {"clock", "cpu", "ram", "inventory"}
+    if cpu_temp:
+        metrics.add("cpu_temp")
+    if gpu:
+        metrics.add("gpu")
+    if gpu_temp:
+        metrics.add("gpu_temp")
+    if net:
+        metrics.add("net")
+    if disk:
+        metrics.add("disk")
+    return frozenset(metrics)
 
 class SystemMonitor:
-    def __init__(self):
+    def __init__(self, nvidia_smi_interval_ms=1000, defer_lhm=False, sysfs_root="/", providers=()):
+        self._created_ns = time.perf_counter_ns()
+        self._lock = threading.RLock()
         self._cpu_name_cache = None
         self._gpu_info_cache = None
-        self._gpu_cache_time = 0
-        self._gpu_cache_duration = 5
         self._lhm_computer = None
         self._lhm_initialized = False
         self._Hardware = None
-        self._init_lhm()
+        self._lhm_update_list = []
+        self._sensor_index = {}
+        self._lhm_gpus = []
+        self._lhm_cpu_name = None
+        self._sensor_index_dirty = False
+        self._nvidia_smi = NvidiaSmiStream(nvidia_smi_interval_ms)
+        self._nvidia_smi.on_restart = self._invalidate_gpus
+        self._nvml = Nvml()
+        self._sysfs_gpus = SysfsGpuBackend(sysfs_root) if platform.system() == "Linux" else None
+        self._hwmon = HwmonBackend(sysfs_root) if platform.system() == "Linux" else None
+        self._procfs = ProcfsReader(sysfs_root) if platform.system() == "Linux" else None
+        self._nvidia = NvidiaProvider(self._nvml, self._nvidia_smi)
+        builtin = [LhmProvider(self), self._nvidia]
+        if self._sysfs_gpus is not None:
+            builtin.append(SysfsGpuProvider(self._sysfs_gpus))
+        if self._hwmon is not None:
+            builtin.append(HwmonProvider(self._hwmon))
+        if self._procfs is not None:
+            builtin.append(ProcfsProvider(self._procfs))
+        builtin.append(PsutilProvider(psutil))
+        self._providers = ProviderRegistry(builtin + list(providers))
+        self._net_rates = RateMeter(NetRate, exclude=NET_EXCLUDE)
+        self._disk_rates = RateMeter(DiskRate, exclude=DISK_EXCLUDE)
+        self._closed = False
+        self._backend_ready = threading.Event()
+        self._startup_timings = {"first_sample_ms": None, "backend_ready_ms": None, "full_sensors_ms": None}
+        self._lhm_thread = None
+        self.on_backend_ready = None
+        if defer_lhm:
+            self._lhm_thread = threading.Thread(target=self._init_lhm, name="LhmInit", daemon=True)
+            self._lhm_thread.start()
+        else:
+            self._init_lhm()
+
+    @property
+    def backend_ready(self):
+        return self._backend_ready.is_set()
+
+    def wait_backend_ready(self, timeout=None):
+        return self._backend_ready.wait(timeout)
+
+    def startup_timings(self):
+        return dict(self._startup_timings)
+
+    @property
+    def providers(self):
+        return self._providers
+
+    def register_provider(self, provider):
+        with self._lock:
+            self._providers.register(provider)
+            self._gpu_info_cache = None
+
+    def _elapsed_ms(self):
+        return (time.perf_counter_ns() - self._created_ns) / 1_000_000
 
     def _init_lhm(self):
+        try:
+            self._open_lhm()
+            self._warm_nvidia_smi()
+        finally:
+            self._startup_timings["backend_ready_ms"] = self._elapsed_ms()
+            self._backend_ready.set()
+            callback = self.on_backend_ready
+            if callback is not None:
+                callback()
+
+    def _open_lhm(self):
         if platform.system() != "Windows":
             return
         try:
@@ -47,23 +162,122 @@ class SystemMonitor:
             import clr
             clr.AddReference(dll_path)
             from LibreHardwareMonitor import Hardware
-            self._Hardware = Hardware
-            self._lhm_computer = Hardware.Computer()
-            self._lhm_computer.IsCpuEnabled = True
-            self._lhm_computer.IsGpuEnabled = True
-            self._lhm_computer.IsMemoryEnabled = True
-            self._lhm_computer.Open()
-            self._lhm_initialized = True
+            computer = Hardware.Computer()
+            computer.IsCpuEnabled = True
+            computer.IsGpuEnabled = True
+            computer.IsMemoryEnabled = True
+            computer.Open()
+            with self._lock:
+                if self._closed:
+                    computer.Close()
+                    return
+                self._Hardware = Hardware
+                self._lhm_computer = computer
+                self._watch_hardware_changes()
+                self._build_sensor_index()
+                self._cpu_name_cache = None
+                self._gpu_info_cache = None
+                self._lhm_initialized = True
+                self._providers.invalidate()
         except Exception as e:
             self._lhm_initialized = False
             self._init_error = str(e)
 
+    def _warm_nvidia_smi(self):
+        if self._nvml.available() or not self._nvidia_smi.start():
+            return
+        if self._nvidia_smi.wait_first_frame():
+            self._invalidate_gpus()
+
+    def _invalidate_gpus(self):
+        with self._lock:
+            self._gpu_info_cache = None
+            self._providers.invalidate()
+
+    def _watch_hardware_changes(self):
+        try:
+            self._lhm_computer.HardwareAdded += self._on_hardware_changed
+            self._lhm_computer.HardwareRemoved += self._on_hardware_changed
+        except Exception:
+            pass
+
+    def _on_hardware_changed(self, hardware):
+        self._sensor_index_dirty = True
+
+    def _build_sensor_index(self):
+        hardware_type = self._Hardware.HardwareType
+        sensor_type = self._Hardware.SensorType
+        gpu_types = [
+            (hardware_type.GpuNvidia, "nvidia"),
+            (hardware_type.GpuAmd, "amd"),
+            (hardware_type.GpuIntel, "intel")
+        ]
+        update_list = []
+        index = {}
+        gpus = []
+        cpu_name = None
+        for hw in self._lhm_computer.Hardware:
+            update_list.append(hw)
+            for sub in hw.SubHardware:
+                update_list.append(sub)
+            hw_type = hw.HardwareType
+            sensors = [(sensor, sensor.SensorType, sensor.Name) for sensor in hw.Sensors]
+            if hw_type == hardware_type.Cpu:
+                if cpu_name is None:
+                    cpu_name = hw.Name
+                for sensor, s_type, name in sensors:
+                    if s_type == sensor_type.Load and "Total" in name:
+                        index.setdefault("cpu.load.total", sensor)
+                temps = [sensor for sensor, s_type, name in sensors if s_type == sensor_type.Temperature]
+                package = [t for t in temps if "Package" in t.Name or "Tctl" in t.Name or "Tdie" in t.Name]
+                if temps and "cpu.temp" not in index:
+                    index["cpu.temp"] = tuple(package + [t for t in temps if t not in package])
+            elif hw_type == hardware_type.Memory:
+                for sensor, s_type, name in sensors:
+                    if s_type == sensor_type.Load and "Memory" in name:
+                        index.setdefault("memory.load", sensor)
+            else:
+                gpu_type = next((name for t, name in gpu_types if hw_type == t), None)
+                if gpu_type is None:
+                    continue
+                i = len(gpus)
+                gpu = {"name": hw.Name, "type": gpu_type, "load": f"gpu[{i}].load.core", "temp": f"gpu[{i}].temp.core"}
+                gpus.append(gpu)
+                for sensor, s_type, name in sensors:
+                    if s_type == sensor_type.Load and "Core" in name:
+                        index.setdefault(gpu["load"], sensor)
+                temps = tuple(sensor for sensor, s_type, _ in sensors if s_type == sensor_type.Temperature)
+                if temps:
+                    index[gpu["temp"]] = temps
+        self._lhm_update_list = update_list
+        self._sensor_index = index
+        self._lhm_gpus = gpus
+        self._lhm_cpu_name = cpu_name
+        self._sensor_index_dirty = False
+
+    def lhm_ready(self):
+        return bool(self._lhm_initialized and self._lhm_computer)
+
+    def lhm_sensors(self, key):
+        return self._sensor_index.get(key, ())
+
+    def lhm_gpus(self):
+        return self._lhm_gpus
+
+    def read_sensor(self, key):
+        sensor = self._sensor_index.get(key)
+        if sensor is None:
+            return None
+        value = sensor.Value
+        return float(value) if value is not None else None
+
     def _update_hardware(self):
         if self._lhm_computer:
-            for hw in self._lhm_computer.Hardware:
+            if self._sensor_index_dirty:
+                self._build_sensor_index()
+                self._providers.invalidate()
+            for hw in self._lhm_update_list:
                 hw.Update()
-                for sub in hw.SubHardware:
-                    sub.Update()
 
     @property
     def cpu_name(self):
@@ -72,10 +286,8 @@ class SystemMonitor:
         return self._cpu_name_cache
 
     def _get_cpu_name(self):
-        if self._lhm_initialized and self._lhm_computer:
-            for hw in self._lhm_computer.Hardware:
-                if hw.HardwareType == self._Hardware.HardwareType.Cpu:
-                    return hw.Name
+        if self._lhm_initialized and self._lhm_cpu_name:
+            return self._lhm_cpu_name
         try:
             if platform.system() == "Windows":
                 import winreg
@@ -94,155 +306,154 @@ class SystemMonitor:
         except:
             return "CPU"
 
+    def sample(self, cpu_temp=True, gpu=True, gpu_temp=True, net=False, disk=False):
+        metrics = enabled_metrics(cpu_temp, gpu, gpu_temp, net, disk)
+        return self.sample_metrics(metrics, enabled=metrics)
+
+    def sample_metrics(self, metrics, previous=None, enabled=None):
+        with self._lock:
+            if not metrics.isdisjoint(BACKEND_METRICS):
+                self._update_hardware()
+            if "inventory" in metrics:
+                self._cpu_name_cache = None
+                self._gpu_info_cache = None
+            values = {"timestamp": time.time(), "time_text": self.get_current_time(), "cpu_name": self.cpu_name}
+            if "cpu" in metrics:
+                values["cpu_usage"] = self._read_cpu_usage()
+            if "ram" in metrics:
+                values["ram_usage"] = self._read_ram_usage()
+            if "cpu_temp" in metrics:
+                values["cpu_temp"] = self._read_cpu_temperature()
+            if "gpu" in metrics:
+                values["gpu_info"] = tuple(self._read_gpu_info())
+            if "gpu_temp" in metrics:
+                gpu_temps = self._read_gpu_temperature()
+                values["gpu_temps"] = tuple(gpu_temps) if gpu_temps else None
+            if "net" in metrics:
+                values["net_io"] = self._net_rates.update(self._providers.read("net"), time.monotonic())
+            if "disk" in metrics:
+                values["disk_io"] = self._disk_rates.update(self._providers.read("disk"), time.monotonic())
+            if previous is None:
+                previous = SystemSnapshot(values["timestamp"], values["time_text"], values["cpu_name"], 0.0, 0.0)
+            snapshot = previous._replace(**values)
+            if enabled is not None:
+                cleared = {field: default for metric, (field, default) in OPTIONAL_FIELDS.items() if metric not in enabled}
+                if cleared:
+                    snapshot = snapshot._replace(**cleared)
+            self._record_sample_timing()
+            return snapshot
+
+    def _record_sample_timing(self):
+        timings = self._startup_timings
+        if timings["first_sample_ms"] is None:
+            timings["first_sample_ms"] = self._elapsed_ms()
+        if timings["full_sensors_ms"] is None and self._backend_ready.is_set():
+            timings["full_sensors_ms"] = self._elapsed_ms()
+
     def get_cpu_usage(self):
-        if self._lhm_initialized and self._lhm_computer:
+        with self._lock:
             self._update_hardware()
-            for hw in self._lhm_computer.Hardware:
-                if hw.HardwareType == self._Hardware.HardwareType.Cpu:
-                    for sensor in hw.Sensors:
-                        if sensor.SensorType == self._Hardware.SensorType.Load and "Total" in sensor.Name:
-                            if sensor.Value is not None:
-                                return float(sensor.Value)
-        return psutil.cpu_percent(interval=None)
+            return self._read_cpu_usage()
 
     def get_ram_usage(self):
-        if self._lhm_initialized and self._lhm_computer:
+        with self._lock:
             self._update_hardware()
-            for hw in self._lhm_computer.Hardware:
-                if hw.HardwareType == self._Hardware.HardwareType.Memory:
-                    for sensor in hw.Sensors:
-                        if sensor.SensorType == self._Hardware.SensorType.Load and "Memory" in sensor.Name:
-                            if sensor.Value is not None:
-                                return float(sensor.Value)
-        return psutil.virtual_memory().percent
+            return self._read_ram_usage()
 
     def get_cpu_temperature(self):
-        if self._lhm_initialized and self._lhm_computer:
+        with self._lock:
             self._update_hardware()
-            for hw in self._lhm_computer.Hardware:
-                if hw.HardwareType == self._Hardware.HardwareType.Cpu:
-                    for sensor in hw.Sensors:
-                        if sensor.SensorType == self._Hardware.SensorType.Temperature:
-                            if sensor.Value is not None and sensor.Value > 0:
-                                return float(sensor.Value)
-        if platform.system() == "Linux":
-            try:
-                temps = psutil.sensors_temperatures()
-                if temps:
-                    for name in ["coretemp", "k10temp", "zenpower", "cpu_thermal", "acpitz"]:
-                        if name in temps:
-                            return temps[name][0].current
-                    first_sensor = list(temps.values())[0]
-                    if first_sensor:
-                        return first_sensor[0].current
-            except:
-                pass
-        return None
+            return self._read_cpu_temperature()
 
     def get_gpu_temperature(self):
-        temps = []
-        if self._lhm_initialized and self._lhm_computer:
+        with self._lock:
             self._update_hardware()
-            for hw in self._lhm_computer.Hardware:
-                if hw.HardwareType in [self._Hardware.HardwareType.GpuNvidia, 
-                                        self._Hardware.HardwareType.GpuAmd,
-                                        self._Hardware.HardwareType.GpuIntel]:
-                    for sensor in hw.Sensors:
-                        if sensor.SensorType == self._Hardware.SensorType.Temperature:
-                            if sensor.Value is not None and sensor.Value > 0:
-                                temps.append(float(sensor.Value))
-                                break
-            if temps:
-                return temps
-        if platform.system() == "Linux":
-            try:
-                sensor_temps = psutil.sensors_temperatures()
-                for name in ["amdgpu", "radeon", "nouveau"]:
-                    if name in sensor_temps:
-                        temps.append(sensor_temps[name][0].current)
-            except:
-                pass
-        if shutil.which("nvidia-smi"):
-            try:
-                output = subprocess.check_output(
-                    ["nvidia-smi", "--query-gpu=temperature.gpu", "--format=csv,noheader,nounits"],
-                    creationflags=subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
-                ).decode("utf-8").strip().split('\n')
-                for temp in output:
-                    temps.append(float(temp.strip()))
-            except:
-                pass
-        return temps if temps else None
+            return self._read_gpu_temperature()
 
     def get_gpu_info(self):
-        current_time = time.time()
-        if self._gpu_info_cache and (current_time - self._gpu_cache_time) < self._gpu_cache_duration:
-            return self._get_gpu_usage_from_cache()
-
-        gpus = []
-        if self._lhm_initialized and self._lhm_computer:
+        with self._lock:
             self._update_hardware()
-            for hw in self._lhm_computer.Hardware:
-                if hw.HardwareType in [self._Hardware.HardwareType.GpuNvidia,
-                                        self._Hardware.HardwareType.GpuAmd,
-                                        self._Hardware.HardwareType.GpuIntel]:
-                    gpu_type = "nvidia" if hw.HardwareType == self._Hardware.HardwareType.GpuNvidia else \
-                               "amd" if hw.HardwareType == self._Hardware.HardwareType.GpuAmd else "intel"
-                    usage = 0.0
-                    for sensor in hw.Sensors:
-                        if sensor.SensorType == self._Hardware.SensorType.Load and "Core" in sensor.Name:
-                            if sensor.Value is not None:
-                                usage = float(sensor.Value)
-                                break
-                    gpus.append({"name": hw.Name, "type": gpu_type, "usage": usage})
-
-        if not gpus:
-            gpus = self._get_gpu_info_fallback()
-
-        self._gpu_info_cache = gpus
-        self._gpu_cache_time = current_time
-
-        return [(g["name"], g.get("usage", 0.0)) for g in gpus]
-
-    def _get_gpu_usage_from_cache(self):
-        if self._lhm_initialized and self._lhm_computer:
+            return self._read_gpu_info()
+
+    def get_cpu_core_usage(self):
+        with self._lock:
+            if self._procfs is not None and self._providers.selected().get("cpu") == ["procfs"]:
+                return self._procfs.core_percents()
+            return psutil.cpu_percent(interval=None, percpu=True)
+
+    def get_memory_details(self):
+        with self._lock:
+            if self._procfs is not None:
+                try:
+                    return self._procfs.memory()
+                except (OSError, ValueError, IndexError):
+                    pass
+            memory = psutil.virtual_memory()
+            swap = psutil.swap_memory()
+            return {
+                "total": memory.total,
+                "available": memory.available,
+                "used": memory.total - memory.available,
+                "free": memory.free,
+                "cached": getattr(memory, "cached", None),
+                "dirty": None,
+                "swap_total": swap.total,
+                "swap_used": swap.used,
+                "swap_free": swap.free,
+                "percent": memory.percent
+            }
+
+    def configure_throughput(self, smoothing_ms, interfaces=(), disks=()):
+        with self._lock:
+            self._net_rates.configure(smoothing_ms, interfaces)
+            self._disk_rates.configure(smoothing_ms, disks)
+
+    def throughput_devices(self):
+        with self._lock:
+            return self._net_rates.devices(self._providers.read("net")), self._disk_rates.devices(self._providers.read("disk"))
+
+    def get_cpu_core_temperatures(self):
+        with self._lock:
             self._update_hardware()
-            result = []
-            for hw in self._lhm_computer.Hardware:
-                if hw.HardwareType in [self._Hardware.HardwareType.GpuNvidia,
-                                        self._Hardware.HardwareType.GpuAmd,
-                                        self._Hardware.HardwareType.GpuIntel]:
-                    usage = 0.0
-                    for sensor in hw.Sensors:
-                        if sensor.SensorType == self._Hardware.SensorType.Load and "Core" in sensor.Name:
-                            if sensor.Value is not None:
-                                usage = float(sensor.Value)
-                                break
-                    result.append((hw.Name, usage))
-            if result:
-                return result
-        return [(g["name"], g.get("usage", 0.0)) for g in self._gpu_info_cache]
-
-    def _get_gpu_info_fallback(self):
-        gpus = []
-        if shutil.which("nvidia-smi"):
-            try:
-                kwargs = {"creationflags": subprocess.CREATE_NO_WINDOW} if platform.system() == "Windows" else {}
-                names = subprocess.check_output(
-                    ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader"],
-                    **kwargs
-                ).decode("utf-8").strip().split('\n')
-                usages = subprocess.check_output(
-                    ["nvidia-smi", "--query-gpu=utilization.gpu", "--format=csv,noheader,nounits"],
-                    **kwargs
-                ).decode("utf-8").strip().split('\n')
-                for i, name in enumerate(names):
-                    usage = float(usages[i].strip()) if i < len(usages) else 0.0
-                    gpus.append({"name": name.strip(), "type": "nvidia", "usage": usage})
-            except:
-                pass
+            if self.lhm_ready():
+                temps = [(sensor.Name, float(sensor.Value)) for sensor in self.lhm_sensors("cpu.temp") if sensor.Name.startswith("CPU Core") and sensor.Value is not None]
+                if temps:
+                    return temps
+            if self._hwmon is not None:
+                return self._hwmon.core_temperatures() or []
+            return []
+
+    def _read_cpu_usage(self):
+        value = self._providers.read("cpu")
+        return value if value is not None else 0.0
+
+    def _read_ram_usage(self):
+        value = self._providers.read("ram")
+        return value if value is not None else 0.0
+
+    def _read_cpu_temperature(self):
+        return self._providers.read("cpu_temp")
 
-        if platform.system() == "Windows" and not gpus:
+    def _read_gpu_temperature(self):
+        return self._providers.read("gpu_temp") or None
+
+    def _read_gpu_info(self):
+        gpus = self._providers.read("gpu")
+        if gpus:
+            return gpus
+        if self._gpu_info_cache is None:
+            self._gpu_info_cache = self._get_gpu_inventory()
+        return list(self._gpu_info_cache)
+
+    def get_gpu_details(self):
+        details = [dict(gpu, type="nvidia") for gpu in self._nvidia.gpus() or ()]
+        if self._sysfs_gpus is not None:
+            details += self._sysfs_gpus.read()
+        return details
+
+    def _get_gpu_inventory(self):
+        gpus = []
+        if platform.system() == "Windows":
             try:
                 command = ["powershell", "-Command", "Get-CimInstance -ClassName Win32_VideoController | Select-Object -ExpandProperty Name"]
                 output = subprocess.check_output(
@@ -252,9 +463,7 @@ class SystemMonitor:
                 lines = output.split("\n")
                 for line in lines:
                     if line.strip():
-                        name = line.strip()
-                        gpu_type = "amd" if "AMD" in name or "ATI" in name else "nvidia" if "NVIDIA" in name else "intel" if "Intel" in name else "other"
-                        gpus.append({"name": name, "type": gpu_type, "usage": 0.0})
+                        gpus.append((line.strip(), 0.0))
             except:
                 pass
 
@@ -266,13 +475,26 @@ class SystemMonitor:
     def clear_cache(self):
         self._cpu_name_cache = None
         self._gpu_info_cache = None
-        self._gpu_cache_time = 0
+        self._providers.invalidate()
 
     def close(self):
-        if self._lhm_computer:
-            try:
-                self._lhm_computer.Close()
-            except:
-                pass
-            self._lhm_computer = None
-            self._lhm_initialized = False
+        self._nvidia_smi.stop()
+        self._nvml.close()
+        if self._sysfs_gpus is not None:
+            self._sysfs_gpus.close()
+        if self._hwmon is not None:
+            self._hwmon.close()
+        if self._procfs is not None:
+            self._procfs.close()
+        with self._lock:
+            self._closed = True
+            if self._lhm_computer:
+                try:
+                    self._lhm_computer.Close()
+                except:
+                    pass
+                self._lhm_computer = None
+                self._lhm_initialized = False
+                self._lhm_update_list = []
+                self._sensor_index = {}
+                self._lhm_gpus = []
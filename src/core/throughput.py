@@ -0,0 +1,103 @@
+import math
+from collections import namedtuple
+
+NetRate = namedtuple("NetRate", ["name", "rx_bytes", "tx_bytes", "rx_packets", "tx_packets"])
+DiskRate = namedtuple("DiskRate", ["name", "read_bytes", "write_bytes", "reads", "writes"])
+
+DEFAULT_SMOOTHING_MS = 2000
+NET_EXCLUDE = ("lo", "Loopback", "veth", "docker", "br-", "virbr", "vEthernet", "ifb")
+DISK_EXCLUDE = ("loop", "ram", "zram")
+WRAP_32 = 1 << 32
+WRAP_64 = 1 << 64
+
+def counter_delta(current, previous):
+    if current >= previous:
+        return current - previous
+    width = WRAP_32 if previous < WRAP_32 else WRAP_64
+    delta = current + width - previous
+    return delta if delta < width // 2 else None
+
+def format_rate(value):
+    if value >= 1 << 30:
+        return f"{value / (1 << 30):.1f} GB/s"
+    if value >= 1 << 20:
+        return f"{value / (1 << 20):.1f} MB/s"
+    if value >= 1 << 10:
+        return f"{value / (1 << 10):.0f} KB/s"
+    return f"{value:.0f} B/s"
+
+def psutil_net_counters(psutil):
+    return {name: (c.bytes_recv, c.bytes_sent, c.packets_recv, c.packets_sent) for name, c in (psutil.net_io_counters(pernic=True) or {}).items()}
+
+def psutil_disk_counters(psutil):
+    return {name: (c.read_bytes, c.write_bytes, c.read_count, c.write_count) for name, c in (psutil.disk_io_counters(perdisk=True) or {}).items()}
+
+
+class RateMeter:
+    def __init__(self, row, smoothing_ms=DEFAULT_SMOOTHING_MS, include=(), exclude=()):
+        self._row = row
+        self._tau = max(smoothing_ms, 0) / 1000.0
+        self._include = frozenset(include or ())
+        self._exclude = tuple(exclude)
+        self._devices = {}
+        self._skipped = set()
+        self._last = None
+
+    def configure(self, smoothing_ms=DEFAULT_SMOOTHING_MS, include=()):
+        self._tau = max(smoothing_ms, 0) / 1000.0
+        include = frozenset(include or ())
+        if include != self._include:
+            self._include = include
+            self._devices = {}
+            self._skipped = set()
+            self._last = None
+
+    def _wanted(self, name):
+        if self._include:
+            return name in self._include
+        return not name.startswith(self._exclude)
+
+    def devices(self, counters):
+        return [name for name, values in (counters or {}).items() if self._wanted(name) and any(values)]
+
+    def update(self, counters, now):
+        if counters is None:
+            return self._last
+        devices = self._devices
+        skipped = self._skipped
+        seen = {}
+        rows = []
+        for name, values in counters.items():
+            if name in skipped:
+                continue
+            state = devices.get(name)
+            if state is None:
+                if not self._wanted(name):
+                    skipped.add(name)
+                    continue
+                seen[name] = [values, now, None]
+                continue
+            previous, then, rates = state
+            elapsed = now - then
+            state[0] = values
+            state[1] = now
+            seen[name] = state
+            if elapsed <= 0:
+                if rates is not None:
+                    rows.append(self._row(name, *rates))
+                continue
+            current = []
+            for value, old in zip(values, previous):
+                delta = counter_delta(value, old)
+                current.append(None if delta is None else delta / elapsed)
+            if rates is None:
+                rates = [rate or 0.0 for rate in current]
+            else:
+                alpha = 1.0 - math.exp(-elapsed / self._tau) if self._tau else 1.0
+                rates = [old if rate is None else old + alpha * (rate - old) for rate, old in zip(current, rates)]
+            state[2] = rates
+            if any(values):
+                rows.append(self._row(name, *rates))
+        self._devices = seen
+        self._last = tuple(rows)
+        return self._last
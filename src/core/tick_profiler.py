@@ -0,0 +1,113 @@
+import json
+import threading
+import time
+from array import array
+
+STAGES = ("sample", "format", "layout", "sparklines", "paint")
+BUCKET_COUNT = 24
+DEFAULT_WINDOW = 600
+
+def bucket_for(ns):
+    return min(max(int(ns) // 1000, 1).bit_length() - 1, BUCKET_COUNT - 1)
+
+def bucket_label(index):
+    if index == BUCKET_COUNT - 1:
+        return f">={1 << index}us"
+    return f"<{1 << (index + 1)}us"
+
+def format_duration(us):
+    if us is None:
+        return "-"
+    if us >= 10000:
+        return f"{us / 1000:.1f} ms"
+    return f"{us:.0f} µs"
+
+
+class StageHistogram:
+    def __init__(self, window=DEFAULT_WINDOW):
+        self._window = max(int(window), 1)
+        self._samples = array("q", bytes(8 * self._window))
+        self._buckets = [0] * BUCKET_COUNT
+        self._next = 0
+        self._count = 0
+        self._total = 0
+        self._sum = 0
+        self._last = 0
+        self._max = 0
+
+    def add(self, ns):
+        if self._count == self._window:
+            old = self._samples[self._next]
+            self._buckets[bucket_for(old)] -= 1
+            self._sum -= old
+        else:
+            self._count += 1
+        self._samples[self._next] = ns
+        self._next = (self._next + 1) % self._window
+        self._buckets[bucket_for(ns)] += 1
+        self._sum += ns
+        self._total += 1
+        self._last = ns
+        if ns > self._max:
+            self._max = ns
+
+    def percentile(self, q):
+        if not self._count:
+            return None
+        values = sorted(self._samples[:self._count])
+        return values[min(int(len(values) * q / 100.0), len(values) - 1)]
+
+    def stats(self):
+        if not self._count:
+            return {"count": 0}
+        return {
+            "count": self._total,
+            "window": self._count,
+            "last_us": self._last / 1000,
+            "mean_us": self._sum / self._count / 1000,
+            "p50_us": self.percentile(50) / 1000,
+            "p95_us": self.percentile(95) / 1000,
+            "p99_us": self.percentile(99) / 1000,
+            "max_us": self._max / 1000,
+            "histogram": {bucket_label(i): n for i, n in enumerate(self._buckets) if n}
+        }
+
+
+class TickProfiler:
+    def __init__(self, window=DEFAULT_WINDOW):
+        self._window = window
+        self._lock = threading.Lock()
+        self._stages = {stage: StageHistogram(window) for stage in STAGES}
+        self._started = time.time()
+
+    def record(self, stage, ns):
+        histogram = self._stages.get(stage)
+        if histogram is None:
+            with self._lock:
+                histogram = self._stages.setdefault(stage, StageHistogram(self._window))
+        histogram.add(ns)
+
+    def reset(self):
+        with self._lock:
+            self._stages = {stage: StageHistogram(self._window) for stage in STAGES}
+            self._started = time.time()
+
+    def stats(self):
+        return {stage: histogram.stats() for stage, histogram in list(self._stages.items())}
+
+    def summary(self, percentile=95):
+        key = f"p{percentile}_us"
+        lines = []
+        for stage, stats in self.stats().items():
+            if stats["count"]:
+                lines.append((stage, stats.get(key, stats["last_us"])))
+        return lines
+
+    def dump(self, path=None, extra=None):
+        data = {"started": self._started, "dumped": time.time(), "window": self._window, "stages": self.stats()}
+        data.update(extra or {})
+        text = json.dumps(data, indent=2)
+        if path:
+            with open(path, "w") as f:
+                f.write(text)
+        return text
@@ -0,0 +1,104 @@
+from PySide6.QtCore import Qt, QRect, QSize
+from PySide6.QtGui import QColor, QFontMetrics, QStaticText
+
+VALUE_TEMPLATES = ["100.0%", "100.0°C", "00:00:00", "N/A", "9999 µs", "99.9 ms", "9999 MB"]
+STATIC_TEXT_CACHE_LIMIT = 512
+
+class PainterRenderer:
+    def __init__(self, font, margins, spacing, templates=VALUE_TEMPLATES):
+        self._font = font
+        self._metrics = QFontMetrics(font)
+        self._margins = margins
+        self._spacing = spacing
+        self._line_height = self._metrics.lineSpacing()
+        self._value_width = max(self._metrics.horizontalAdvance(t) for t in templates)
+        self._static_texts = {}
+        self._label_widths = {}
+        self._colors = {}
+        self._rows = []
+        self._row_tops = {}
+        self._size = QSize(0, 0)
+
+    def size(self):
+        return self._size
+
+    def _static_text(self, text):
+        static = self._static_texts.get(text)
+        if static is None:
+            if len(self._static_texts) >= STATIC_TEXT_CACHE_LIMIT:
+                self._static_texts = {}
+            static = QStaticText(text)
+            static.setTextFormat(Qt.PlainText)
+            static.prepare(font=self._font)
+            self._static_texts[text] = static
+        return static
+
+    def _label_width(self, text):
+        width = self._label_widths.get(text)
+        if width is None:
+            width = self._metrics.horizontalAdvance(text)
+            self._label_widths[text] = width
+        return width
+
+    def _color(self, name):
+        color = self._colors.get(name)
+        if color is None:
+            color = QColor(name)
+            self._colors[name] = color
+        return color
+
+    def line_top(self, key, line):
+        top = self._row_tops.get(key)
+        if top is None:
+            return None
+        return top + line * self._line_height
+
+    def line_height(self):
+        return self._line_height
+
+    def set_state(self, keys, state):
+        rows = []
+        for key in keys:
+            visible, lines = state[key]
+            if visible and lines:
+                rows.append((key, tuple((f"{text}: ", value, label_color, value_color) for text, value, label_color, value_color in lines)))
+
+        structure = [(key, len(lines), tuple(label for label, _, _, _ in lines)) for key, lines in rows]
+        previous_structure = [(key, len(lines), tuple(label for label, _, _, _ in lines)) for key, lines in self._rows]
+        resized = structure != previous_structure
+
+        dirty = QRect()
+        if resized:
+            self._row_tops = {}
+            y = self._margins.top()
+            label_width = 0
+            for key, lines in rows:
+                self._row_tops[key] = y
+                y += len(lines) * self._line_height + self._spacing
+                for label, _, _, _ in lines:
+                    label_width = max(label_width, self._label_width(label))
+            height = y - (self._spacing if rows else 0) + self._margins.bottom()
+            width = self._margins.left() + label_width + self._value_width + self._margins.right()
+            self._size = QSize(width, height)
+        else:
+            old = dict(self._rows)
+            for key, lines in rows:
+                if old.get(key) != lines:
+                    top = self._row_tops[key]
+                    dirty = dirty.united(QRect(0, top, self._size.width(), len(lines) * self._line_height))
+        self._rows = rows
+        return resized, dirty
+
+    def paint(self, painter, area):
+        painter.setFont(self._font)
+        x = self._margins.left()
+        for key, lines in self._rows:
+            top = self._row_tops[key]
+            if top > area.bottom() or top + len(lines) * self._line_height < area.top():
+                continue
+            for i, (label, value, label_color, value_color) in enumerate(lines):
+                y = top + i * self._line_height
+                painter.setPen(self._color(label_color))
+                painter.drawStaticText(x, y, self._static_text(label))
+                painter.setPen(self._color(value_color))
+                painter.drawStaticText(x + self._label_width(label), y, self._static_text(value))
@@ -1,21 +1,70 @@
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QMenu
-from PySide6.QtCore import Qt, QTimer, Signal
-from PySide6.QtGui import QColor, QFont, QGuiApplication, QPainter, QBrush, QAction
-from src.core.system_monitor import SystemMonitor
+from PySide6.QtCore import Qt, QTimer, Signal, QRect
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QGuiApplication, QPainter, QBrush, QAction, QPalette
+import html
+import os
+import threading
+import time
+from src.core.monitor_service import MonitorService
+from src.core.sampler import THROTTLE_PAUSE, THROTTLE_LOW, parse_metric_intervals
+from src.core.metric_history import MetricHistory
+from src.core.tick_profiler import TickProfiler, format_duration
+from src.core.process_table import ProcessTable, ProcessSampler, format_bytes
+from src.core.fleet import FleetCollector
+from src.core.throughput import format_rate
+from src.core.rules import RulesEngine
+from src.ui.sparkline import Sparkline
+from src.ui.overlay_renderer import PainterRenderer, VALUE_TEMPLATES
+from src.ui.visibility import VisibilityWatcher, VISIBLE
 from src.utils.translations import TRANSLATIONS
 
+RENDER_BUDGET_NS = 1_000_000
+SPARKLINE_GAP = 8
+PROCESS_NAME_WIDTH = 24
+FLEET_VALUE_TEMPLATE = "100% · 100% · 100%"
+NET_VALUE_TEMPLATE = "↓ 999.9 MB/s ↑ 999.9 MB/s"
+DISK_VALUE_TEMPLATE = "R 999.9 MB/s · W 999.9 MB/s · 9999 IOPS"
+
 class OverlayWindow(QWidget):
     positionChanged = Signal(int, int)
     openSettingsRequested = Signal()
+    snapshotReady = Signal()
+    ruleNotification = Signal(str, str)
 
     def __init__(self, config_manager):
         super().__init__()
+        self._created_ns = time.perf_counter_ns()
+        self._first_paint_ms = None
         self.config_manager = config_manager
-        self.monitor = SystemMonitor()
         self._stay_on_top = True
+        self._pending_snapshot = None
+        self._render_queued = False
+        self._render_lock = threading.Lock()
+        self.render_stats = {"ticks": 0, "last_ns": 0, "max_ns": 0, "over_budget": 0}
+        self._sparklines = {}
+        self._sparkline_rows = []
+        self._painter_renderer = None
+        self.profiler = None
+        self.process_sampler = None
+        self._processes = None
+        self.fleet_collector = None
+        self._fleet = None
+        self._fleet_address = None
         self.load_config()
+        self.history = MetricHistory(self.config.get("history_samples", 300))
+        self.service = MonitorService.instance()
+        self.snapshotReady.connect(self._on_snapshot_ready, Qt.QueuedConnection)
         self.init_ui()
-        self.start_timer()
+        self._update_profiler()
+        self.start_sampler()
+        self._update_process_sampler()
+        self._update_fleet_collector()
+        self.visibility = VisibilityWatcher(self)
+        self.visibility.stateChanged.connect(self._on_visibility_changed)
+
+    @property
+    def monitor(self):
+        return self.service.monitor
 
     def load_config(self):
         self.config = self.config_manager.config
@@ -31,24 +80,48 @@ class OverlayWindow(QWidget):
 
         layout = QVBoxLayout()
         self.setLayout(layout)
+        self._base_margins = layout.contentsMargins()
 
         self.time_label = QLabel()
         self.cpu_label = QLabel()
         self.cpu_temp_label = QLabel()
         self.ram_label = QLabel()
+        self.net_label = QLabel()
+        self.disk_label = QLabel()
         self.gpu_label = QLabel()
         self.gpu_temp_label = QLabel()
-
-        for label in [self.time_label, self.cpu_label, self.cpu_temp_label,
-                      self.ram_label, self.gpu_label, self.gpu_temp_label]:
+        self.fleet_label = QLabel()
+        self.top_cpu_label = QLabel()
+        self.top_ram_label = QLabel()
+        self.debug_label = QLabel()
+
+        self._labels = {
+            "time": self.time_label,
+            "cpu": self.cpu_label,
+            "cpu_temp": self.cpu_temp_label,
+            "ram": self.ram_label,
+            "net": self.net_label,
+            "disk": self.disk_label,
+            "gpu": self.gpu_label,
+            "gpu_temp": self.gpu_temp_label,
+            "fleet": self.fleet_label,
+            "top_cpu": self.top_cpu_label,
+            "top_ram": self.top_ram_label,
+            "debug": self.debug_label
+        }
+        for label in self._labels.values():
             layout.addWidget(label)
 
         self.apply_styles()
-        self.update_stats()
+        if self.service.latest() is not None:
+            self.render_snapshot(self.service.latest())
         self.adjustSize()
         QTimer.singleShot(100, self.update_position)
 
     def paintEvent(self, event):
+        started = time.perf_counter_ns()
+        if self._first_paint_ms is None:
+            self._first_paint_ms = (started - self._created_ns) / 1_000_000
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
         bg_color = QColor(self.config.get("background_color", "#000000"))
@@ -56,6 +129,80 @@ class OverlayWindow(QWidget):
         painter.setBrush(QBrush(bg_color))
         painter.setPen(Qt.NoPen)
         painter.drawRoundedRect(self.rect(), 15, 15)
+        if self._painter_renderer is not None:
+            self._painter_renderer.paint(painter, event.rect())
+        if self.show_sparklines:
+            self._paint_sparklines(painter, event.rect())
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.record("paint", time.perf_counter_ns() - started)
+
+    def sizeHint(self):
+        if self._painter_renderer is not None:
+            return self._painter_renderer.size()
+        return super().sizeHint()
+
+    def _line_top(self, key, line, lines):
+        if self._painter_renderer is not None:
+            return self._painter_renderer.line_top(key, line), self._painter_renderer.line_height()
+        label = self._labels[key]
+        geometry = label.geometry()
+        line_height = self._font_metrics.lineSpacing()
+        top = geometry.top() + (geometry.height() - lines * line_height) // 2
+        return top + line * line_height, line_height
+
+    def _sparkline_column(self):
+        x = self.width() - self.layout().contentsMargins().right() + SPARKLINE_GAP
+        return QRect(x, 0, self.sparkline_width, self.height())
+
+    def _paint_sparklines(self, painter, area):
+        if not self._sparkline_column().intersects(area):
+            return
+        x = self._sparkline_column().x()
+        for key, line, lines, metric in self._sparkline_rows:
+            spark = self._sparklines.get(metric)
+            if spark is None:
+                continue
+            top, line_height = self._line_top(key, line, lines)
+            if top is None:
+                continue
+            spark.paint(painter, x, top + (line_height - spark.height()) // 2)
+
+    def _update_sparklines(self, snapshot, indices):
+        if not self.show_sparklines:
+            return
+        visible = {key: row[0] for key, row in self._display_state.items()}
+        rows = []
+        if visible.get("cpu"):
+            rows.append(("cpu", 0, 1, "cpu", snapshot.cpu_usage))
+        if visible.get("cpu_temp") and snapshot.cpu_temp is not None:
+            rows.append(("cpu_temp", 0, 1, "cpu_temp", snapshot.cpu_temp))
+        if visible.get("ram"):
+            rows.append(("ram", 0, 1, "ram", snapshot.ram_usage))
+        if visible.get("gpu"):
+            gpu_indices = indices["gpu"]
+            for line, i in enumerate(gpu_indices):
+                rows.append(("gpu", line, len(gpu_indices), f"gpu{i}", snapshot.gpu_info[i][1]))
+        if visible.get("gpu_temp"):
+            temp_indices = indices["gpu_temp"]
+            for line, i in enumerate(temp_indices):
+                rows.append(("gpu_temp", line, len(temp_indices), f"gpu_temp{i}", snapshot.gpu_temps[i][1]))
+
+        height = max(self._font_metrics.lineSpacing() - 4, 4)
+        for _, _, _, metric, value in rows:
+            spark = self._sparklines.get(metric)
+            if spark is None or not spark.matches(self.sparkline_width, height, self.sparkline_samples, self.base_color):
+                spark = Sparkline(self.sparkline_width, height, self.sparkline_samples, self.base_color)
+                values = self.history.values(metric, self.sparkline_samples)
+                if len(values):
+                    spark.seed(values)
+                else:
+                    spark.push(value)
+                self._sparklines[metric] = spark
+            else:
+                spark.push(value)
+        self._sparkline_rows = [row[:4] for row in rows]
+        self.update(self._sparkline_column())
 
     def apply_styles(self):
         self.font = QFont(self.config.get("font_family", "Arial"), self.config.get("font_size", 14))
@@ -65,58 +212,48 @@ class OverlayWindow(QWidget):
         self.color_low = self.config.get("color_low", "#4CAF50")
         self.color_medium = self.config.get("color_medium", "#FFC107")
         self.color_high = self.config.get("color_high", "#F44336")
-
-        self.time_label.setVisible(self.config.get("show_time", True))
-        self.cpu_label.setVisible(self.config.get("show_cpu", True))
-        self.cpu_temp_label.setVisible(self.config.get("show_cpu_temp", False))
-        self.ram_label.setVisible(self.config.get("show_ram", True))
-        self.gpu_temp_label.setVisible(self.config.get("show_gpu_temp", False))
-
-        for label in [self.time_label, self.cpu_label, self.cpu_temp_label,
-                      self.ram_label, self.gpu_label, self.gpu_temp_label]:
+        self.rules = RulesEngine(
+            self.config.get("rules"),
+            {"low": self.color_low, "medium": self.color_medium, "high": self.color_high},
+            notify=self.ruleNotification.emit,
+            log_path=os.path.join(self.config_manager.config_dir, "rules.log")
+        )
+        self.render_engine = self.config.get("render_engine", "labels")
+        self.show_sparklines = self.config.get("show_sparklines", False)
+        self.sparkline_width = self.config.get("sparkline_width", 60)
+        self.sparkline_samples = self.config.get("sparkline_samples", 60)
+        self.show_tick_timing = self.config.get("show_tick_timing", False)
+        self._sparklines = {}
+        self._sparkline_rows = []
+        margins = self._base_margins
+        extra = self.sparkline_width + SPARKLINE_GAP if self.show_sparklines else 0
+        self.layout().setContentsMargins(margins.left(), margins.top(), margins.right() + extra, margins.bottom())
+
+        if self.render_engine == "painter":
+            self._painter_renderer = PainterRenderer(self.font, self.layout().contentsMargins(), self.layout().spacing(), self._value_templates())
+            for label in self._labels.values():
+                label.setVisible(False)
+        else:
+            self._painter_renderer = None
+            self.time_label.setVisible(self.config.get("show_time", True))
+            self.cpu_label.setVisible(self.config.get("show_cpu", True))
+            self.cpu_temp_label.setVisible(self.config.get("show_cpu_temp", False))
+            self.ram_label.setVisible(self.config.get("show_ram", True))
+            self.gpu_temp_label.setVisible(self.config.get("show_gpu_temp", False))
+
+        self._font_metrics = QFontMetrics(self.font)
+        self._display_state = {}
+        self._label_extents = {}
+        self._label_colors = {}
+        self._palettes = {}
+        for label in self._labels.values():
             label.setFont(self.font)
-            label.setStyleSheet(f"color: {self.base_color};")
+            self._set_label_color(label, self.base_color)
 
         self.update()
         self.adjustSize()
         self.update_position()
 
-    def _format_with_color(self, label_text, value_text, color):
-        if not self.dynamic_colors:
-            return f"{label_text}: {value_text}", self.base_color
-        if self.color_only_value:
-            return f"<span style='color:{self.base_color}'>{label_text}: </span><span style='color:{color}'>{value_text}</span>", None
-        return f"{label_text}: {value_text}", color
-
-    def _apply_label_style(self, label, text, color):
-        if color is None:
-            label.setTextFormat(Qt.RichText)
-            label.setText(text)
-        else:
-            label.setTextFormat(Qt.PlainText)
-            label.setText(text)
-            label.setStyleSheet(f"color: {color};")
-
-    def _get_color_for_percentage(self, percentage):
-        if not self.dynamic_colors:
-            return self.base_color
-        if percentage < 50:
-            return self.color_low
-        elif percentage < 80:
-            return self.color_medium
-        else:
-            return self.color_high
-
-    def _get_color_for_temp(self, temp):
-        if not self.dynamic_colors:
-            return self.base_color
-        if temp < 50:
-            return self.color_low
-        elif temp < 75:
-            return self.color_medium
-        else:
-            return self.color_high
-
     def update_position(self):
         preset = self.config.get("position_preset", "custom")
         screen = QGuiApplication.primaryScreen().availableGeometry()
@@ -150,14 +287,156 @@ class OverlayWindow(QWidget):
     def reload_settings(self):
         self.load_config()
         self.apply_styles()
-        new_interval = self.config.get("update_interval_ms", 1000)
-        if self.timer.interval() != new_interval:
-            self.timer.setInterval(new_interval)
-
-    def start_timer(self):
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_stats)
-        self.timer.start(self.config.get("update_interval_ms", 1000))
+        self.history.set_capacity(self.config.get("history_samples", 300))
+        self._update_profiler()
+        self._update_process_sampler()
+        self._update_fleet_collector()
+        self._configure_throughput()
+        self.service.update_subscription(self._on_sample, self.config.get("update_interval_ms", 1000), self._metric_intervals(), **self._sample_options())
+        if self.visibility.state is not None:
+            self._on_visibility_changed(self.visibility.state)
+
+    def _update_profiler(self):
+        enabled = self.config.get("tick_profiling", False) or self.config.get("show_tick_timing", False)
+        if enabled and self.profiler is None:
+            self.profiler = TickProfiler()
+        elif not enabled:
+            self.profiler = None
+        self.service.set_profiler(self.profiler)
+
+    def _update_process_sampler(self):
+        if not self.config.get("show_processes", False):
+            if self.process_sampler is not None:
+                self.process_sampler.stop()
+                self.process_sampler = None
+                self._processes = None
+            return
+        top_n = self.config.get("process_count", 5)
+        interval_ms = self.config.get("process_interval_ms", 2000)
+        if self.process_sampler is None:
+            self.process_sampler = ProcessSampler(ProcessTable(top_n), interval_ms, self._on_processes)
+            self.process_sampler.start()
+        else:
+            self.process_sampler.set_top_n(top_n)
+            self.process_sampler.set_interval(interval_ms)
+
+    def _on_processes(self, top):
+        self._processes = top
+        self._request_render()
+
+    def _update_fleet_collector(self):
+        address = (self.config.get("fleet_bind", "127.0.0.1"), self.config.get("fleet_port", 9465))
+        if self.fleet_collector is not None and (not self.config.get("fleet_enabled", False) or address != self._fleet_address):
+            self.fleet_collector.stop()
+            self.fleet_collector = None
+            self._fleet = None
+        if self.fleet_collector is not None or not self.config.get("fleet_enabled", False):
+            return
+        collector = FleetCollector(address[0], address[1], self._on_fleet)
+        try:
+            collector.start()
+        except OSError:
+            return
+        self.fleet_collector = collector
+        self._fleet_address = address
+
+    def _on_fleet(self, hosts):
+        self._fleet = hosts
+        self._request_render()
+
+    def _request_render(self):
+        with self._render_lock:
+            if self._pending_snapshot is None or self._render_queued:
+                return
+            self._render_queued = True
+        self.snapshotReady.emit()
+
+    def _on_visibility_changed(self, state):
+        if self.process_sampler is not None:
+            self.process_sampler.set_paused(state != VISIBLE)
+        if state == VISIBLE:
+            self.service.set_throttle(self._on_sample, None)
+            return
+        mode = self.config.get("hidden_sampling", THROTTLE_LOW)
+        if mode not in (THROTTLE_PAUSE, THROTTLE_LOW):
+            mode = THROTTLE_LOW
+        self.service.set_throttle(self._on_sample, mode, self.config.get("hidden_interval_ms", 5000))
+
+    def _sample_options(self):
+        show_gpu = self.config.get("show_gpu", True)
+        return {
+            "cpu_temp": self.config.get("show_cpu_temp", False),
+            "gpu": show_gpu,
+            "gpu_temp": show_gpu and self.config.get("show_gpu_temp", False),
+            "net": self.config.get("show_net", False),
+            "disk": self.config.get("show_disk", False)
+        }
+
+    def _configure_throughput(self):
+        self.service.configure_throughput(self.config.get("io_smoothing_ms", 2000), self.config.get("net_interfaces", []), self.config.get("disk_devices", []))
+
+    def _metric_intervals(self):
+        return parse_metric_intervals(self.config.get("metric_intervals_ms"))
+
+    def _value_templates(self):
+        templates = list(VALUE_TEMPLATES)
+        if self.config.get("fleet_enabled", False):
+            templates.append(FLEET_VALUE_TEMPLATE)
+        if self.config.get("show_net", False):
+            templates.append(NET_VALUE_TEMPLATE)
+        if self.config.get("show_disk", False):
+            templates.append(DISK_VALUE_TEMPLATE)
+        return templates
+
+    def startup_timings(self):
+        timings = {"first_paint_ms": self._first_paint_ms}
+        if self.monitor is not None:
+            timings.update(self.monitor.startup_timings())
+        return timings
+
+    def diagnostics(self):
+        sampler = self.service.sampler
+        return {
+            "render": dict(self.render_stats),
+            "startup": self.startup_timings(),
+            "sampler": sampler.stats() if sampler is not None else None
+        }
+
+    def start_sampler(self):
+        self._configure_throughput()
+        self.service.subscribe(self._on_sample, self.config.get("update_interval_ms", 1000), self._metric_intervals(), **self._sample_options())
+
+    def shutdown(self):
+        self.service.unsubscribe(self._on_sample)
+        if self.process_sampler is not None:
+            self.process_sampler.stop()
+            self.process_sampler = None
+        if self.fleet_collector is not None:
+            self.fleet_collector.stop()
+            self.fleet_collector = None
+
+    def _on_sample(self, snapshot):
+        self.history.record(snapshot)
+        with self._render_lock:
+            self._pending_snapshot = snapshot
+        self._request_render()
+
+    def _on_snapshot_ready(self):
+        with self._render_lock:
+            self._render_queued = False
+            snapshot = self._pending_snapshot
+        if snapshot is None:
+            return
+        started = time.perf_counter_ns()
+        self.render_snapshot(snapshot)
+        elapsed = time.perf_counter_ns() - started
+        stats = self.render_stats
+        stats["ticks"] += 1
+        stats["last_ns"] = elapsed
+        if elapsed > stats["max_ns"]:
+            stats["max_ns"] = elapsed
+        if elapsed > RENDER_BUDGET_NS:
+            stats["over_budget"] += 1
 
     def _clean_manufacturer(self, name, show_manufacturer):
         if show_manufacturer:
@@ -181,106 +460,196 @@ class OverlayWindow(QWidget):
         return cleaned_name if cleaned_name else name
 
     def update_stats(self):
-        self.time_label.setText(f"{self.trans['time']}: {self.monitor.get_current_time()}")
-        self.time_label.setStyleSheet(f"color: {self.base_color};")
-
-        show_cpu_name = self.config.get("show_cpu_name", False)
-        show_cpu_manufacturer = self.config.get("show_cpu_manufacturer", True)
-
-        if show_cpu_name:
-            cpu_name = self.monitor.cpu_name
-            cpu_label_text = self._clean_manufacturer(cpu_name, show_cpu_manufacturer)
+        if self.service.sampler:
+            self.service.sampler.request_sample()
+
+    def render_snapshot(self, snapshot):
+        profiler = self.profiler
+        if profiler is not None:
+            started = time.perf_counter_ns()
+        self.rules.evaluate(snapshot)
+        state, indices = self._build_display_state(snapshot)
+        state["fleet"] = self._build_fleet_row()
+        state["top_cpu"], state["top_ram"] = self._build_process_rows()
+        state["debug"] = self._build_debug_row()
+        if profiler is not None:
+            formatted = time.perf_counter_ns()
+            profiler.record("format", formatted - started)
+        if self._painter_renderer is not None:
+            self._display_state = state
+            resized, dirty = self._painter_renderer.set_state(list(self._labels), state)
+            if resized:
+                self.adjustSize()
+                self.update()
+            elif not dirty.isNull():
+                self.update(dirty)
+        elif self._apply_display_state(state):
+            self.adjustSize()
+        if profiler is not None:
+            laid_out = time.perf_counter_ns()
+            profiler.record("layout", laid_out - formatted)
+        self._update_sparklines(snapshot, indices)
+        if profiler is not None and self.show_sparklines:
+            profiler.record("sparklines", time.perf_counter_ns() - laid_out)
+
+    def _build_debug_row(self):
+        if not self.show_tick_timing or self.profiler is None:
+            return (False, ())
+        base = self.base_color
+        lines = tuple((self.trans.get(f"tick_{stage}", stage), format_duration(us), base, base) for stage, us in self.profiler.summary())
+        return (bool(lines), lines)
+
+    def _build_net_row(self, snapshot):
+        if not self.config.get("show_net", False) or not snapshot.net_io:
+            return (False, ())
+        base = self.base_color
+        return (True, tuple((nic.name[:PROCESS_NAME_WIDTH], f"↓ {format_rate(nic.rx_bytes)} ↑ {format_rate(nic.tx_bytes)}", base, base) for nic in snapshot.net_io))
+
+    def _build_disk_row(self, snapshot):
+        if not self.config.get("show_disk", False) or not snapshot.disk_io:
+            return (False, ())
+        base = self.base_color
+        return (True, tuple(
+            (disk.name[:PROCESS_NAME_WIDTH], f"R {format_rate(disk.read_bytes)} · W {format_rate(disk.write_bytes)} · {disk.reads + disk.writes:.0f} IOPS", base, base)
+            for disk in snapshot.disk_io
+        ))
+
+    def _build_fleet_row(self):
+        hosts = self._fleet
+        if not hosts or not self.config.get("fleet_enabled", False):
+            return (False, ())
+        base = self.base_color
+        lines = [(self.trans["fleet"], "CPU · RAM · GPU", base, base)]
+        for host in hosts:
+            snapshot = host.snapshot
+            values = [snapshot.cpu_usage, snapshot.ram_usage]
+            if snapshot.gpu_info:
+                values.append(max(usage for _, usage in snapshot.gpu_info))
+            lines.append(self._format_line(host.name[:PROCESS_NAME_WIDTH], " · ".join(f"{value:.0f}%" for value in values), self.rules.color_for("fleet", max(values))))
+        return (True, tuple(lines))
+
+    def _build_process_rows(self):
+        top = self._processes
+        if top is None or not self.config.get("show_processes", False):
+            return (False, ()), (False, ())
+        base = self.base_color
+        cpu_lines = tuple(self._format_line(p.name[:PROCESS_NAME_WIDTH], f"{p.cpu:.1f}%", self.rules.color_for("process", p.cpu)) for p in top.by_cpu if p.cpu > 0)
+        ram_lines = tuple((p.name[:PROCESS_NAME_WIDTH], format_bytes(p.rss), base, base) for p in top.by_rss)
+        return (bool(cpu_lines), cpu_lines), (bool(ram_lines), ram_lines)
+
+    def _build_display_state(self, snapshot):
+        base = self.base_color
+        state = {}
+
+        state["time"] = (self.config.get("show_time", True), ((self.trans['time'], snapshot.time_text, base, base),))
+
+        if self.config.get("show_cpu_name", False):
+            cpu_label_text = self._clean_manufacturer(snapshot.cpu_name, self.config.get("show_cpu_manufacturer", True))
         else:
             cpu_label_text = self.trans['cpu']
-
-        cpu_usage = self.monitor.get_cpu_usage()
-        cpu_color = self._get_color_for_percentage(cpu_usage)
-        text, color = self._format_with_color(cpu_label_text, f"{cpu_usage:.1f}%", cpu_color)
-        self._apply_label_style(self.cpu_label, text, color)
+        cpu_usage = snapshot.cpu_usage
+        state["cpu"] = (self.config.get("show_cpu", True), (self._format_line(cpu_label_text, f"{cpu_usage:.1f}%", self.rules.color("cpu")),))
 
         if self.config.get("show_cpu_temp", False):
-            cpu_temp = self.monitor.get_cpu_temperature()
+            cpu_temp = snapshot.cpu_temp
+            cpu_temp_text = self.trans.get('cpu_temp', 'CPU Temp')
             if cpu_temp is not None:
-                temp_color = self._get_color_for_temp(cpu_temp)
-                text, color = self._format_with_color(self.trans.get('cpu_temp', 'CPU Temp'), f"{cpu_temp:.1f}°C", temp_color)
-                self._apply_label_style(self.cpu_temp_label, text, color)
+                line = self._format_line(cpu_temp_text, f"{cpu_temp:.1f}°C", self.rules.color("cpu_temp"))
             else:
-                self.cpu_temp_label.setText(f"{self.trans.get('cpu_temp', 'CPU Temp')}: N/A")
-                self.cpu_temp_label.setStyleSheet(f"color: {self.base_color};")
-            self.cpu_temp_label.setVisible(True)
+                line = (cpu_temp_text, "N/A", base, base)
+            state["cpu_temp"] = (True, (line,))
         else:
-            self.cpu_temp_label.setVisible(False)
+            state["cpu_temp"] = (False, ())
 
-        ram_usage = self.monitor.get_ram_usage()
-        ram_color = self._get_color_for_percentage(ram_usage)
-        text, color = self._format_with_color(self.trans['ram'], f"{ram_usage:.1f}%", ram_color)
-        self._apply_label_style(self.ram_label, text, color)
+        ram_usage = snapshot.ram_usage
+        state["ram"] = (self.config.get("show_ram", True), (self._format_line(self.trans['ram'], f"{ram_usage:.1f}%", self.rules.color("ram")),))
 
+        state["net"] = self._build_net_row(snapshot)
+        state["disk"] = self._build_disk_row(snapshot)
+
+        indices = {"gpu": [], "gpu_temp": []}
         if not self.config.get("show_gpu", True):
-            self.gpu_label.setVisible(False)
-            self.gpu_temp_label.setVisible(False)
-            self.adjustSize()
-            return
+            state["gpu"] = (False, ())
+            state["gpu_temp"] = (False, ())
+            return state, indices
 
-        gpu_info = self.monitor.get_gpu_info()
+        gpu_info = snapshot.gpu_info
         gpu_visibility = self.config.get("gpu_visibility", {})
         show_gpu_name = self.config.get("show_gpu_name", False)
         show_gpu_manufacturer = self.config.get("show_gpu_manufacturer", False)
-
-        visible_gpus = []
-        gpu_colors = []
-        if gpu_info:
-            for i, (name, usage) in enumerate(gpu_info):
-                if gpu_visibility.get(name, True):
-                    if show_gpu_name:
-                        display_name = self._clean_manufacturer(name, show_gpu_manufacturer)
-                    else:
-                        display_name = f"GPU {i + 1}" if len(gpu_info) > 1 else "GPU"
-                    gpu_color = self._get_color_for_percentage(usage)
-                    text, color = self._format_with_color(display_name, f"{usage:.1f}%", gpu_color)
-                    visible_gpus.append(text)
-                    gpu_colors.append(color)
-
-            if visible_gpus:
-                if gpu_colors and gpu_colors[0] is None:
-                    self.gpu_label.setTextFormat(Qt.RichText)
-                    self.gpu_label.setText("<br>".join(visible_gpus))
-                else:
-                    self.gpu_label.setTextFormat(Qt.PlainText)
-                    self.gpu_label.setText("\n".join(visible_gpus))
-                    if gpu_colors:
-                        self.gpu_label.setStyleSheet(f"color: {gpu_colors[0]};")
-                self.gpu_label.setVisible(True)
-            else:
-                self.gpu_label.setVisible(False)
-        else:
-            self.gpu_label.setVisible(False)
-
-        if self.config.get("show_gpu_temp", False):
-            gpu_temps = self.monitor.get_gpu_temperature()
-            if gpu_temps:
-                temp_texts = []
-                temp_colors = []
-                for t in gpu_temps:
-                    temp_color = self._get_color_for_temp(t)
-                    text, color = self._format_with_color(self.trans.get('gpu_temp', 'GPU Temp'), f"{t:.1f}°C", temp_color)
-                    temp_texts.append(text)
-                    temp_colors.append(color)
-                if temp_colors and temp_colors[0] is None:
-                    self.gpu_temp_label.setTextFormat(Qt.RichText)
-                    self.gpu_temp_label.setText("<br>".join(temp_texts))
+        gpu_lines = []
+        for i, (name, usage) in enumerate(gpu_info or ()):
+            if gpu_visibility.get(name, True):
+                if show_gpu_name:
+                    display_name = self._clean_manufacturer(name, show_gpu_manufacturer)
                 else:
-                    self.gpu_temp_label.setTextFormat(Qt.PlainText)
-                    self.gpu_temp_label.setText("\n".join(temp_texts))
-                    if temp_colors:
-                        self.gpu_temp_label.setStyleSheet(f"color: {temp_colors[0]};")
-                self.gpu_temp_label.setVisible(True)
+                    display_name = f"GPU {i + 1}" if len(gpu_info) > 1 else "GPU"
+                gpu_lines.append(self._format_line(display_name, f"{usage:.1f}%", self.rules.color(f"gpu{i}")))
+                indices["gpu"].append(i)
+        state["gpu"] = (bool(gpu_lines), tuple(gpu_lines))
+
+        gpu_temps = snapshot.gpu_temps if self.config.get("show_gpu_temp", False) else None
+        temp_lines = []
+        if gpu_temps:
+            gpu_temp_text = self.trans.get('gpu_temp', 'GPU Temp')
+            for i, (name, temp) in enumerate(gpu_temps):
+                if gpu_visibility.get(name, True):
+                    label_text = f"{gpu_temp_text} ({self._clean_manufacturer(name, show_gpu_manufacturer)})" if show_gpu_name else gpu_temp_text
+                    temp_lines.append(self._format_line(label_text, f"{temp:.1f}°C", self.rules.color(f"gpu_temp{i}")))
+                    indices["gpu_temp"].append(i)
+        state["gpu_temp"] = (bool(temp_lines), tuple(temp_lines))
+        return state, indices
+
+    def _apply_display_state(self, state):
+        relayout = False
+        for key, row in state.items():
+            if self._display_state.get(key) == row:
+                continue
+            self._display_state[key] = row
+            label = self._labels[key]
+            visible, lines = row
+            if label.isVisibleTo(self) != visible:
+                label.setVisible(visible)
+                relayout = True
+            if not visible:
+                continue
+            colors = {c for _, _, label_color, value_color in lines for c in (label_color, value_color)}
+            if len(colors) == 1:
+                if label.textFormat() != Qt.PlainText:
+                    label.setTextFormat(Qt.PlainText)
+                label.setText("\n".join(f"{text}: {value}" for text, value, _, _ in lines))
+                self._set_label_color(label, colors.pop())
             else:
-                self.gpu_temp_label.setVisible(False)
-        else:
-            self.gpu_temp_label.setVisible(False)
+                if label.textFormat() != Qt.RichText:
+                    label.setTextFormat(Qt.RichText)
+                label.setText("<br>".join(
+                    f"<span style='color:{label_color}'>{html.escape(text)}: </span><span style='color:{value_color}'>{html.escape(value)}</span>"
+                    for text, value, label_color, value_color in lines
+                ))
+                self._set_label_color(label, self.base_color)
+            extent = (len(lines), max(self._font_metrics.horizontalAdvance(f"{text}: {value}") for text, value, _, _ in lines))
+            if self._label_extents.get(key) != extent:
+                self._label_extents[key] = extent
+                relayout = True
+        return relayout
+
+    def _format_line(self, label_text, value_text, color):
+        if not self.dynamic_colors:
+            return (label_text, value_text, self.base_color, self.base_color)
+        if self.color_only_value:
+            return (label_text, value_text, self.base_color, color)
+        return (label_text, value_text, color, color)
 
-        self.adjustSize()
+    def _set_label_color(self, label, color):
+        if self._label_colors.get(label) == color:
+            return
+        palette = self._palettes.get(color)
+        if palette is None:
+            palette = QPalette(label.palette())
+            palette.setColor(QPalette.WindowText, QColor(color))
+            self._palettes[color] = palette
+        label.setPalette(palette)
+        self._label_colors[label] = color
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
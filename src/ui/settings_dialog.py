@@ -2,16 +2,20 @@ from PySide6.QtWidgets import (QDialog, QVBoxLayout, QFormLayout, QComboBox,
                                QSpinBox, QPushButton, QColorDialog, QSlider,
                                QHBoxLayout, QLabel, QCheckBox, QGroupBox, 
                                QScrollArea, QWidget, QLineEdit, QMessageBox)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont, QFontDatabase, QDesktopServices
 from PySide6.QtCore import QUrl
 from src.utils.translations import TRANSLATIONS
-from src.core.system_monitor import SystemMonitor
+from src.core.monitor_service import MonitorService
 from src.core.autostart_manager import AutostartManager
 from src.core.update_checker import UpdateChecker
 from src.core.config_manager import APP_VERSION
 
+GPU_REFRESH_MS = 5000
+
 class SettingsDialog(QDialog):
+    gpusChanged = Signal(object)
+
     def __init__(self, config_manager, on_apply_callback=None, parent=None, overlay_window=None, hotkey_manager=None):
         super().__init__(parent)
         self.config_manager = config_manager
@@ -219,6 +223,10 @@ class SettingsDialog(QDialog):
         self.color_only_value_check.setChecked(self.config_manager.get("color_only_value", False))
         appearance_layout.addRow("", self.color_only_value_check)
 
+        self.show_sparklines_check = QCheckBox()
+        self.show_sparklines_check.setChecked(self.config_manager.get("show_sparklines", False))
+        appearance_layout.addRow("", self.show_sparklines_check)
+
         self.color_low_label = QLabel()
         self.color_low_btn = QPushButton()
         self.color_low = self.config_manager.get("color_low", "#4CAF50")
@@ -316,6 +324,34 @@ class SettingsDialog(QDialog):
         self.show_gpu_check.setChecked(self.config_manager.get("show_gpu", True))
         components_layout.addRow("", self.show_gpu_check)
 
+        self.show_net_check = QCheckBox()
+        self.show_net_check.setChecked(self.config_manager.get("show_net", False))
+        components_layout.addRow("", self.show_net_check)
+
+        self.show_disk_check = QCheckBox()
+        self.show_disk_check.setChecked(self.config_manager.get("show_disk", False))
+        components_layout.addRow("", self.show_disk_check)
+
+        self.show_processes_check = QCheckBox()
+        self.show_processes_check.setChecked(self.config_manager.get("show_processes", False))
+        components_layout.addRow("", self.show_processes_check)
+
+        self.process_count_label = QLabel()
+        self.process_count_spin = QSpinBox()
+        self.process_count_spin.setRange(1, 20)
+        self.process_count_spin.setValue(self.config_manager.get("process_count", 5))
+        components_layout.addRow(self.process_count_label, self.process_count_spin)
+
+        self.fleet_enabled_check = QCheckBox()
+        self.fleet_enabled_check.setChecked(self.config_manager.get("fleet_enabled", False))
+        components_layout.addRow("", self.fleet_enabled_check)
+
+        self.fleet_port_label = QLabel()
+        self.fleet_port_spin = QSpinBox()
+        self.fleet_port_spin.setRange(1024, 65535)
+        self.fleet_port_spin.setValue(self.config_manager.get("fleet_port", 9465))
+        components_layout.addRow(self.fleet_port_label, self.fleet_port_spin)
+
         self.group_components.setLayout(components_layout)
         content_layout.addWidget(self.group_components)
 
@@ -355,24 +391,19 @@ class SettingsDialog(QDialog):
         self.group_temps.setLayout(temps_layout)
         content_layout.addWidget(self.group_temps)
 
-        self.monitor = SystemMonitor()
-        gpu_info = self.monitor.get_gpu_info()
         self.gpu_checks = {}
-
-        gpu_visibility = self.config_manager.get("gpu_visibility", {})
-
-        if gpu_info:
-            gpu_group = QGroupBox("GPUs")
-            gpu_layout = QFormLayout()
-            for name, _ in gpu_info:
-                check = QCheckBox(name)
-                is_visible = gpu_visibility.get(name, True)
-                check.setChecked(is_visible)
-                gpu_layout.addRow("", check)
-                self.gpu_checks[name] = check
-                check.toggled.connect(lambda: self.save_settings())
-            gpu_group.setLayout(gpu_layout)
-            content_layout.addWidget(gpu_group)
+        self.gpu_group = QGroupBox("GPUs")
+        self.gpu_layout = QFormLayout()
+        self.gpu_group.setLayout(self.gpu_layout)
+        self.gpu_group.setVisible(False)
+        content_layout.addWidget(self.gpu_group)
+        self.gpusChanged.connect(self._populate_gpus, Qt.QueuedConnection)
+        self.monitor_service = MonitorService.instance()
+        latest = self.monitor_service.latest()
+        if latest is not None:
+            self._populate_gpus(latest.gpu_info)
+        self.monitor = self.monitor_service.subscribe(self._on_sample, GPU_REFRESH_MS, passive=True, gpu=True)
+        self.finished.connect(self._release_monitor)
 
         self.group_content.setLayout(content_layout)
         scroll_layout.addWidget(self.group_content)
@@ -387,6 +418,35 @@ class SettingsDialog(QDialog):
         self.update_interval_spin.setValue(self.config_manager.get("update_interval_ms", 1000))
         advanced_layout.addRow(self.update_interval_label, self.update_interval_spin)
 
+        self.render_engine_label = QLabel()
+        self.render_engine_combo = QComboBox()
+        self.render_engine_combo.addItem("labels", "labels")
+        self.render_engine_combo.addItem("painter", "painter")
+        index = self.render_engine_combo.findData(self.config_manager.get("render_engine", "labels"))
+        if index >= 0:
+            self.render_engine_combo.setCurrentIndex(index)
+        advanced_layout.addRow(self.render_engine_label, self.render_engine_combo)
+
+        self.hidden_sampling_label = QLabel()
+        self.hidden_sampling_combo = QComboBox()
+        self.hidden_sampling_combo.addItem("low", "low")
+        self.hidden_sampling_combo.addItem("pause", "pause")
+        index = self.hidden_sampling_combo.findData(self.config_manager.get("hidden_sampling", "low"))
+        if index >= 0:
+            self.hidden_sampling_combo.setCurrentIndex(index)
+        advanced_layout.addRow(self.hidden_sampling_label, self.hidden_sampling_combo)
+
+        self.hidden_interval_label = QLabel()
+        self.hidden_interval_spin = QSpinBox()
+        self.hidden_interval_spin.setRange(1000, 60000)
+        self.hidden_interval_spin.setSingleStep(1000)
+        self.hidden_interval_spin.setValue(self.config_manager.get("hidden_interval_ms", 5000))
+        advanced_layout.addRow(self.hidden_interval_label, self.hidden_interval_spin)
+
+        self.show_tick_timing_check = QCheckBox()
+        self.show_tick_timing_check.setChecked(self.config_manager.get("show_tick_timing", False))
+        advanced_layout.addRow("", self.show_tick_timing_check)
+
         self.hotkey_enabled_check = QCheckBox()
         self.hotkey_enabled_check.setChecked(self.config_manager.get("hotkey_enabled", True))
         advanced_layout.addRow("", self.hotkey_enabled_check)
@@ -422,10 +482,17 @@ class SettingsDialog(QDialog):
         self.opacity_slider.valueChanged.connect(lambda: self.save_settings())
         self.dynamic_colors_check.toggled.connect(lambda: self.save_settings())
         self.color_only_value_check.toggled.connect(lambda: self.save_settings())
+        self.show_sparklines_check.toggled.connect(lambda: self.save_settings())
         self.show_time_check.toggled.connect(lambda: self.save_settings())
         self.show_cpu_check.toggled.connect(lambda: self.save_settings())
         self.show_ram_check.toggled.connect(lambda: self.save_settings())
         self.show_gpu_check.toggled.connect(lambda: self.save_settings())
+        self.show_net_check.toggled.connect(lambda: self.save_settings())
+        self.show_disk_check.toggled.connect(lambda: self.save_settings())
+        self.show_processes_check.toggled.connect(lambda: self.save_settings())
+        self.process_count_spin.valueChanged.connect(lambda: self.save_settings())
+        self.fleet_enabled_check.toggled.connect(lambda: self.save_settings())
+        self.fleet_port_spin.valueChanged.connect(lambda: self.save_settings())
         self.show_cpu_name_check.toggled.connect(lambda: self.save_settings())
         self.show_cpu_manufacturer_check.toggled.connect(lambda: self.save_settings())
         self.show_ram_check.toggled.connect(lambda: self.save_settings())
@@ -434,11 +501,36 @@ class SettingsDialog(QDialog):
         self.show_cpu_temp_check.toggled.connect(lambda: self.save_settings())
         self.show_gpu_temp_check.toggled.connect(lambda: self.save_settings())
         self.update_interval_spin.valueChanged.connect(lambda: self.save_settings())
+        self.render_engine_combo.currentIndexChanged.connect(lambda: self.save_settings())
+        self.hidden_sampling_combo.currentIndexChanged.connect(lambda: self.save_settings())
+        self.hidden_interval_spin.valueChanged.connect(lambda: self.save_settings())
+        self.show_tick_timing_check.toggled.connect(lambda: self.save_settings())
         self.hotkey_enabled_check.toggled.connect(lambda: self.save_settings())
         self.hotkey_edit.editingFinished.connect(lambda: self.save_settings())
         self.autostart_check.toggled.connect(self.on_autostart_changed)
         self.check_updates_check.toggled.connect(lambda: self.save_settings())
 
+    def _release_monitor(self):
+        if self.monitor is not None:
+            self.monitor = None
+            self.monitor_service.unsubscribe(self._on_sample)
+
+    def _on_sample(self, snapshot):
+        if any(name not in self.gpu_checks for name, _ in snapshot.gpu_info or ()):
+            self.gpusChanged.emit(snapshot.gpu_info)
+
+    def _populate_gpus(self, gpu_info):
+        gpu_visibility = self.config_manager.get("gpu_visibility", {})
+        for name, _ in gpu_info or ():
+            if name in self.gpu_checks:
+                continue
+            check = QCheckBox(name)
+            check.setChecked(gpu_visibility.get(name, True))
+            self.gpu_layout.addRow("", check)
+            self.gpu_checks[name] = check
+            check.toggled.connect(lambda: self.save_settings())
+        self.gpu_group.setVisible(bool(self.gpu_checks))
+
     def retranslate_ui(self):
         trans = TRANSLATIONS.get(self.current_lang, TRANSLATIONS["en"])
         self.setWindowTitle(trans["settings"])
@@ -471,16 +563,23 @@ class SettingsDialog(QDialog):
         self.opacity_label.setText(trans["opacity"])
         self.dynamic_colors_check.setText(trans.get("dynamic_colors", "Dynamic Colors by Usage"))
         self.color_only_value_check.setText(trans.get("color_only_value", "Color Only Value (not label)"))
-        self.color_low_label.setText(trans.get("color_low", "Low Usage Color (0-50%)"))
+        self.show_sparklines_check.setText(trans.get("show_sparklines", "Show Sparklines"))
+        self.color_low_label.setText(trans.get("color_low", "Low Level Color"))
         self.color_low_btn.setText(trans["pick_color"])
-        self.color_medium_label.setText(trans.get("color_medium", "Medium Usage Color (50-80%)"))
+        self.color_medium_label.setText(trans.get("color_medium", "Medium Level Color"))
         self.color_medium_btn.setText(trans["pick_color"])
-        self.color_high_label.setText(trans.get("color_high", "High Usage Color (80-100%)"))
+        self.color_high_label.setText(trans.get("color_high", "High Level Color"))
         self.color_high_btn.setText(trans["pick_color"])
         self.show_time_check.setText(trans["show_time"])
         self.show_cpu_check.setText(trans["show_cpu"])
         self.show_ram_check.setText(trans["show_ram"])
         self.show_gpu_check.setText(trans["show_gpu"])
+        self.show_net_check.setText(trans["show_net"])
+        self.show_disk_check.setText(trans["show_disk"])
+        self.show_processes_check.setText(trans["show_processes"])
+        self.process_count_label.setText(trans["process_count"])
+        self.fleet_enabled_check.setText(trans["show_fleet"])
+        self.fleet_port_label.setText(trans["fleet_port"])
         self.show_cpu_name_check.setText(trans["show_cpu_name"])
         self.show_cpu_manufacturer_check.setText(trans["show_cpu_manufacturer"])
         self.show_ram_check.setText(trans["show_ram"])
@@ -494,6 +593,14 @@ class SettingsDialog(QDialog):
         self.group_temps.setTitle(trans["cat_temperatures"])
 
         self.update_interval_label.setText(trans["update_interval"])
+        self.render_engine_label.setText(trans["render_engine"])
+        self.render_engine_combo.setItemText(0, trans["engine_labels"])
+        self.render_engine_combo.setItemText(1, trans["engine_painter"])
+        self.hidden_sampling_label.setText(trans["hidden_sampling"])
+        self.hidden_sampling_combo.setItemText(0, trans["hidden_low"])
+        self.hidden_sampling_combo.setItemText(1, trans["hidden_pause"])
+        self.hidden_interval_label.setText(trans["hidden_interval"])
+        self.show_tick_timing_check.setText(trans["show_tick_timing"])
         self.hotkey_label.setText(trans["hotkey_toggle"])
         self.hotkey_enabled_check.setText(trans["hotkey_enabled"])
         self.autostart_check.setText(trans["autostart"])
@@ -586,6 +693,7 @@ class SettingsDialog(QDialog):
         self.config_manager.set("background_opacity", self.opacity_slider.value() / 100.0)
         self.config_manager.set("dynamic_colors", self.dynamic_colors_check.isChecked())
         self.config_manager.set("color_only_value", self.color_only_value_check.isChecked())
+        self.config_manager.set("show_sparklines", self.show_sparklines_check.isChecked())
         self.config_manager.set("color_low", self.color_low)
         self.config_manager.set("color_medium", self.color_medium)
         self.config_manager.set("color_high", self.color_high)
@@ -593,6 +701,12 @@ class SettingsDialog(QDialog):
         self.config_manager.set("show_cpu", self.show_cpu_check.isChecked())
         self.config_manager.set("show_ram", self.show_ram_check.isChecked())
         self.config_manager.set("show_gpu", self.show_gpu_check.isChecked())
+        self.config_manager.set("show_net", self.show_net_check.isChecked())
+        self.config_manager.set("show_disk", self.show_disk_check.isChecked())
+        self.config_manager.set("show_processes", self.show_processes_check.isChecked())
+        self.config_manager.set("process_count", self.process_count_spin.value())
+        self.config_manager.set("fleet_enabled", self.fleet_enabled_check.isChecked())
+        self.config_manager.set("fleet_port", self.fleet_port_spin.value())
         self.config_manager.set("show_cpu_name", self.show_cpu_name_check.isChecked())
         self.config_manager.set("show_cpu_manufacturer", self.show_cpu_manufacturer_check.isChecked())
         self.config_manager.set("show_ram", self.show_ram_check.isChecked())
@@ -601,12 +715,16 @@ class SettingsDialog(QDialog):
         self.config_manager.set("show_cpu_temp", self.show_cpu_temp_check.isChecked())
         self.config_manager.set("show_gpu_temp", self.show_gpu_temp_check.isChecked())
         self.config_manager.set("update_interval_ms", self.update_interval_spin.value())
+        self.config_manager.set("render_engine", self.render_engine_combo.currentData())
+        self.config_manager.set("hidden_sampling", self.hidden_sampling_combo.currentData())
+        self.config_manager.set("hidden_interval_ms", self.hidden_interval_spin.value())
+        self.config_manager.set("show_tick_timing", self.show_tick_timing_check.isChecked())
         self.config_manager.set("hotkey_enabled", self.hotkey_enabled_check.isChecked())
         self.config_manager.set("hotkey_toggle", self.hotkey_edit.text())
         self.config_manager.set("autostart", self.autostart_check.isChecked())
         self.config_manager.set("check_updates", self.check_updates_check.isChecked())
 
-        gpu_visibility = {}
+        gpu_visibility = dict(self.config_manager.get("gpu_visibility", {}))
         for name, check in self.gpu_checks.items():
             gpu_visibility[name] = check.isChecked()
         self.config_manager.set("gpu_visibility", gpu_visibility)
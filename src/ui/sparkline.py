@@ -0,0 +1,72 @@
+from PySide6.QtCore import Qt, QPointF
+from PySide6.QtGui import QPixmap, QPainter, QPen, QColor
+
+class Sparkline:
+    def __init__(self, width, height, samples, color, minimum=0.0, maximum=100.0):
+        self._width = max(int(width), 2)
+        self._height = max(int(height), 2)
+        self._samples = max(int(samples), 2)
+        self._color = color
+        self._minimum = minimum
+        self._maximum = maximum
+        self._step = (self._width - 1) / (self._samples - 1)
+        self._carry = 0.0
+        self._head = self._width - 1
+        self._last_y = None
+        self._pen = QPen(QColor(color))
+        self._pen.setWidthF(1.2)
+        self._clear = QColor(Qt.transparent)
+        self._pixmap = QPixmap(self._width, self._height)
+        self._pixmap.fill(self._clear)
+
+    def matches(self, width, height, samples, color):
+        return (self._width, self._height, self._samples, self._color) == (int(width), int(height), int(samples), color)
+
+    def width(self):
+        return self._width
+
+    def height(self):
+        return self._height
+
+    def seed(self, values):
+        for value in values:
+            self.push(value)
+
+    def _to_y(self, value):
+        span = self._maximum - self._minimum
+        ratio = (value - self._minimum) / span if span else 0.0
+        ratio = min(max(ratio, 0.0), 1.0)
+        return (self._height - 1) * (1.0 - ratio)
+
+    def push(self, value):
+        y = self._to_y(value)
+        painter = QPainter(self._pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        if self._last_y is None:
+            painter.setPen(self._pen)
+            painter.drawPoint(QPointF(self._head, y))
+        else:
+            self._carry += self._step
+            shift = int(self._carry)
+            self._carry -= shift
+            start = self._head
+            if shift:
+                painter.setCompositionMode(QPainter.CompositionMode_Clear)
+                for offset in (0, -self._width):
+                    painter.fillRect(start + 1 + offset, 0, shift, self._height, self._clear)
+                painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+            painter.setPen(self._pen)
+            for offset in (0, -self._width):
+                painter.drawLine(QPointF(start + offset, self._last_y), QPointF(start + shift + offset, y))
+            self._head = (start + shift) % self._width
+        painter.end()
+        self._last_y = y
+
+    def paint(self, painter, x, y):
+        x = int(x)
+        y = int(y)
+        oldest = self._head + 1
+        tail = self._width - oldest
+        if tail:
+            painter.drawPixmap(x, y, self._pixmap, oldest, 0, tail, self._height)
+        painter.drawPixmap(x + tail, y, self._pixmap, 0, 0, oldest, self._height)
@@ -0,0 +1,100 @@
+import sys
+import ctypes
+from PySide6.QtCore import QObject, QEvent, QTimer, Signal
+from PySide6.QtGui import QGuiApplication
+
+POLL_INTERVAL_MS = 2000
+
+VISIBLE = "visible"
+HIDDEN = "hidden"
+MINIMIZED = "minimized"
+COVERED = "covered"
+LOCKED = "locked"
+
+DESKTOP_SWITCHDESKTOP = 0x0100
+GA_ROOT = 2
+UNEXPOSED_PLATFORMS = ("offscreen", "minimal")
+
+def is_session_locked():
+    if sys.platform != 'win32':
+        return False
+    try:
+        user32 = ctypes.windll.user32
+        desktop = user32.OpenInputDesktop(0, False, DESKTOP_SWITCHDESKTOP)
+        if not desktop:
+            return True
+        try:
+            return not user32.SwitchDesktop(desktop)
+        finally:
+            user32.CloseDesktop(desktop)
+    except Exception:
+        return False
+
+def is_window_covered(widget):
+    if sys.platform != 'win32':
+        return False
+    try:
+        from ctypes import wintypes
+        user32 = ctypes.windll.user32
+        user32.WindowFromPoint.restype = wintypes.HWND
+        user32.WindowFromPoint.argtypes = [wintypes.POINT]
+        user32.GetAncestor.restype = wintypes.HWND
+        user32.GetAncestor.argtypes = [wintypes.HWND, wintypes.UINT]
+        hwnd = int(widget.winId())
+        ratio = widget.devicePixelRatioF()
+        rect = widget.frameGeometry().adjusted(2, 2, -2, -2)
+        points = [rect.center(), rect.topLeft(), rect.topRight(), rect.bottomLeft(), rect.bottomRight()]
+        for point in points:
+            found = user32.WindowFromPoint(wintypes.POINT(int(point.x() * ratio), int(point.y() * ratio)))
+            if found and user32.GetAncestor(found, GA_ROOT) == hwnd:
+                return False
+        return True
+    except Exception:
+        return False
+
+
+class VisibilityWatcher(QObject):
+    stateChanged = Signal(str)
+
+    WATCHED_EVENTS = (QEvent.Show, QEvent.Hide, QEvent.WindowStateChange, QEvent.Expose)
+
+    def __init__(self, widget):
+        super().__init__(widget)
+        self._widget = widget
+        self._state = None
+        widget.installEventFilter(self)
+        self._timer = QTimer(self)
+        self._timer.setInterval(POLL_INTERVAL_MS)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start()
+
+    @property
+    def state(self):
+        return self._state
+
+    def eventFilter(self, watched, event):
+        if watched is self._widget and event.type() in self.WATCHED_EVENTS:
+            QTimer.singleShot(0, self.refresh)
+        return False
+
+    def _current_state(self):
+        widget = self._widget
+        if not widget.isVisible():
+            return HIDDEN
+        if widget.isMinimized():
+            return MINIMIZED
+        if is_session_locked():
+            return LOCKED
+        handle = widget.windowHandle()
+        if handle is not None and not handle.isExposed() and QGuiApplication.platformName() not in UNEXPOSED_PLATFORMS:
+            return COVERED
+        if is_window_covered(widget):
+            return COVERED
+        return VISIBLE
+
+    def refresh(self):
+        state = self._current_state()
+        if state != self._state:
+            self._state = state
+            self.stateChanged.emit(state)
+        return state
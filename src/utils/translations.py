@@ -29,6 +29,13 @@ TRANSLATIONS = {
         "show_gpu_manufacturer": "Show GPU Manufacturer",
         "show_cpu_temp": "Show CPU Temperature",
         "show_gpu_temp": "Show GPU Temperature",
+        "show_net": "Show Network Throughput",
+        "show_disk": "Show Disk Throughput",
+        "show_processes": "Show Top Processes",
+        "process_count": "Processes Listed",
+        "show_fleet": "Show Fleet Hosts",
+        "fleet_port": "Fleet Collector Port",
+        "fleet": "Fleet",
         "cat_components": "Components",
         "cat_details": "Details",
         "cat_temperatures": "Temperatures",
@@ -54,6 +61,21 @@ TRANSLATIONS = {
         "autostart": "Start with System",
         "check_updates": "Check for Updates",
         "update_interval": "Update Interval (ms)",
+        "render_engine": "Render Engine",
+        "engine_labels": "Qt Labels",
+        "engine_painter": "Custom Painted",
+        "hidden_sampling": "When Hidden",
+        "hidden_low": "Sample Slowly",
+        "hidden_pause": "Pause Sampling",
+        "hidden_interval": "Hidden Interval (ms)",
+        "show_tick_timing": "Show Tick Timing",
+        "tick_timing": "Tick Timing (p95)",
+        "save_tick_dump": "Save Timing Dump",
+        "tick_sample": "Sample",
+        "tick_format": "Format",
+        "tick_layout": "Layout",
+        "tick_sparklines": "Sparklines",
+        "tick_paint": "Paint",
         "update_available": "Update Available",
         "update_message": "A new version {version} is available. Download now?",
         "download": "Download",
@@ -63,9 +85,10 @@ TRANSLATIONS = {
         "check_now": "Check Now",
         "dynamic_colors": "Dynamic Colors by Usage",
         "color_only_value": "Color Only Value (not label)",
-        "color_low": "Low Usage Color (0-50%)%",
-        "color_medium": "Medium Usage Color (50-80%)",
-        "color_high": "High Usage Color (80-100%)",
+        "show_sparklines": "Show Sparklines",
+        "color_low": "Low Level Color",
+        "color_medium": "Medium Level Color",
+        "color_high": "High Level Color",
         "stay_on_top": "Stay on Top",
         "open_settings": "Settings"
     },
@@ -99,6 +122,13 @@ TRANSLATIONS = {
         "show_gpu_manufacturer": "Mostrar Fabricante GPU",
         "show_cpu_temp": "Mostrar Temperatura CPU",
         "show_gpu_temp": "Mostrar Temperatura GPU",
+        "show_net": "Mostrar Tráfico de Red",
+        "show_disk": "Mostrar Actividad de Disco",
+        "show_processes": "Mostrar Procesos Principales",
+        "process_count": "Procesos Mostrados",
+        "show_fleet": "Mostrar Equipos de la Flota",
+        "fleet_port": "Puerto del Colector de Flota",
+        "fleet": "Flota",
         "cat_components": "Componentes",
         "cat_details": "Detalles",
         "cat_temperatures": "Temperaturas",
@@ -124,6 +154,21 @@ TRANSLATIONS = {
         "autostart": "Iniciar con el Sistema",
         "check_updates": "Buscar Actualizaciones",
         "update_interval": "Intervalo de Actualización (ms)",
+        "render_engine": "Motor de Renderizado",
+        "engine_labels": "Etiquetas Qt",
+        "engine_painter": "Dibujado Personalizado",
+        "hidden_sampling": "Al Ocultar",
+        "hidden_low": "Muestrear Lentamente",
+        "hidden_pause": "Pausar Muestreo",
+        "hidden_interval": "Intervalo Oculto (ms)",
+        "show_tick_timing": "Mostrar Tiempos por Ciclo",
+        "tick_timing": "Tiempos por Ciclo (p95)",
+        "save_tick_dump": "Guardar Volcado de Tiempos",
+        "tick_sample": "Muestreo",
+        "tick_format": "Formato",
+        "tick_layout": "Diseño",
+        "tick_sparklines": "Mini Gráficas",
+        "tick_paint": "Pintado",
         "update_available": "Actualización Disponible",
         "update_message": "Una nueva versión {version} está disponible. ¿Descargar ahora?",
         "download": "Descargar",
@@ -133,9 +178,10 @@ TRANSLATIONS = {
         "check_now": "Buscar Ahora",
         "dynamic_colors": "Colores Dinámicos por Uso",
         "color_only_value": "Colorear Solo el Valor (no la etiqueta)",
-        "color_low": "Color Uso Bajo (0-50%)",
-        "color_medium": "Color Uso Medio (50-80%)",
-        "color_high": "Color Uso Alto (80-100%)",
+        "show_sparklines": "Mostrar Mini Gráficas",
+        "color_low": "Color Nivel Bajo",
+        "color_medium": "Color Nivel Medio",
+        "color_high": "Color Nivel Alto",
         "stay_on_top": "Superponer",
         "open_settings": "Configuración"
     }
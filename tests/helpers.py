@@ -0,0 +1,180 @@
+import os
+import stat
+import sys
+from src.core.system_monitor import SystemSnapshot
+
+
+def make_snapshot(timestamp=0.0, cpu=10.0, ram=20.0, cpu_temp=None, gpus=(), gpu_temps=None, cpu_name="CPU", time_text=""):
+    return SystemSnapshot(
+        timestamp=timestamp,
+        time_text=time_text,
+        cpu_name=cpu_name,
+        cpu_usage=cpu,
+        ram_usage=ram,
+        cpu_temp=cpu_temp,
+        gpu_info=tuple(gpus),
+        gpu_temps=None if gpu_temps is None else tuple(gpu_temps)
+    )
+
+
+NVIDIA_SMI_SCRIPT = """#!{python}
+import sys, time
+gpus = {gpus}
+loop_ms = None
+for arg in sys.argv[1:]:
+    if arg.startswith("--loop-ms="):
+        loop_ms = int(arg.split("=", 1)[1])
+tick = 0
+while True:
+    for i in range(gpus):
+        print(f"{{gpus}}, {{i}}, NVIDIA GeForce RTX 40{{9 - i}}0, {{(tick * 7 + i) % 100}}, {{50 + i}}, 1024, 24564, 2520, 10501", flush=True)
+    if loop_ms is None:
+        break
+    tick += 1
+    time.sleep(loop_ms / 1000)
+"""
+
+def write_fake_nvidia_smi(directory, gpus=1):
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, "nvidia-smi")
+    with open(path, "w") as f:
+        f.write(NVIDIA_SMI_SCRIPT.format(python=sys.executable, gpus=gpus))
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return path
+
+
+def _write(path, value):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        f.write(f"{value}\n")
+
+def _link_driver(root, device, driver):
+    target = os.path.join(root, "sys/bus/pci/drivers", driver)
+    os.makedirs(target, exist_ok=True)
+    os.makedirs(device, exist_ok=True)
+    link = os.path.join(device, "driver")
+    if not os.path.lexists(link):
+        os.symlink(target, link)
+
+CPU_HWMON_LABELS = {
+    "coretemp": lambda cores: [("Package id 0", 61000)] + [(f"Core {i}", 55000 + i * 1000) for i in range(cores)],
+    "k10temp": lambda cores: [("Tctl", 63000), ("Tdie", 61000)] + [(f"Tccd{i + 1}", 58000 + i * 500) for i in range(max(cores // 8, 1))]
+}
+
+def write_fake_hwmon(root, name, sensors, index=None, device=None):
+    hwmon = os.path.join(root, "sys/class/hwmon")
+    os.makedirs(hwmon, exist_ok=True)
+    if index is None:
+        index = len(os.listdir(hwmon))
+    link = os.path.join(hwmon, f"hwmon{index}")
+    if device is not None:
+        os.symlink(device, link)
+        return link
+    _write(os.path.join(link, "name"), name)
+    for i, (label, millidegrees) in enumerate(sensors, start=1):
+        _write(os.path.join(link, f"temp{i}_label"), label)
+        _write(os.path.join(link, f"temp{i}_input"), millidegrees)
+    return link
+
+def write_fake_sysfs(root, amd=1, i915=0, xe=0, cpu_chip=None, cores=4):
+    drm = os.path.join(root, "sys/class/drm")
+    if cpu_chip is not None:
+        write_fake_hwmon(root, cpu_chip, CPU_HWMON_LABELS[cpu_chip](cores))
+    card = 0
+    for i in range(amd):
+        device = os.path.join(drm, f"card{card}", "device")
+        _link_driver(root, device, "amdgpu")
+        _write(os.path.join(device, "vendor"), "0x1002")
+        _write(os.path.join(device, "device"), "0x73bf")
+        _write(os.path.join(device, "gpu_busy_percent"), 37 + i)
+        _write(os.path.join(device, "mem_info_vram_used"), 2147483648)
+        _write(os.path.join(device, "mem_info_vram_total"), 17163091968)
+        _write(os.path.join(device, "hwmon/hwmon9/temp1_label"), "edge")
+        _write(os.path.join(device, "hwmon/hwmon9/temp1_input"), 52000 + i * 1000)
+        _write(os.path.join(device, "hwmon/hwmon9/temp2_label"), "junction")
+        _write(os.path.join(device, "hwmon/hwmon9/temp2_input"), 61000)
+        _write(os.path.join(device, "hwmon/hwmon9/name"), "amdgpu")
+        write_fake_hwmon(root, "amdgpu", (), device=os.path.join(device, "hwmon/hwmon9"))
+        os.makedirs(os.path.join(drm, f"card{card}-DP-1"), exist_ok=True)
+        card += 1
+    for i in range(i915):
+        card_path = os.path.join(drm, f"card{card}")
+        device = os.path.join(card_path, "device")
+        _link_driver(root, device, "i915")
+        _write(os.path.join(device, "vendor"), "0x8086")
+        _write(os.path.join(device, "device"), "0x4680")
+        _write(os.path.join(card_path, "gt_act_freq_mhz"), 650)
+        _write(os.path.join(card_path, "gt_max_freq_mhz"), 1300)
+        card += 1
+    for i in range(xe):
+        device = os.path.join(drm, f"card{card}", "device")
+        _link_driver(root, device, "xe")
+        _write(os.path.join(device, "vendor"), "0x8086")
+        _write(os.path.join(device, "device"), "0xe20b")
+        _write(os.path.join(device, "tile0/gt0/freq0/act_freq"), 2000)
+        _write(os.path.join(device, "tile0/gt0/freq0/max_freq"), 2850)
+        card += 1
+    return root
+
+
+def write_fake_proc(root, count=1000, first_pid=100):
+    os.makedirs(root, exist_ok=True)
+    for i in range(count):
+        pid = first_pid + i
+        os.makedirs(os.path.join(root, str(pid)), exist_ok=True)
+        _write(os.path.join(root, str(pid), "stat"),
+               f"{pid} (worker {i % 37}) S 1 {pid} {pid} 0 -1 4194560 120 0 0 0 {i * 3} {i} 0 0 20 0 1 0 {1000 + i} 104857600 {2048 + i * 16} "
+               "18446744073709551615 1 1 0 0 0 0 0 4096 0 0 0 0 17 0 0 0 0 0 0 0 0 0 0 0 0 0 0")
+    os.makedirs(os.path.join(root, "self"), exist_ok=True)
+    return root
+
+
+MEMINFO = """MemTotal:       32768000 kB
+MemFree:         8123456 kB
+MemAvailable:   20123456 kB
+Buffers:          512000 kB
+Cached:         10240000 kB
+SwapCached:            0 kB
+Active:         12000000 kB
+Inactive:        9000000 kB
+SwapTotal:       8388604 kB
+SwapFree:        8000000 kB
+Dirty:              2048 kB
+Writeback:             0 kB
+AnonPages:       9000000 kB
+Shmem:            400000 kB
+KReclaimable:     600000 kB
+Slab:             900000 kB
+SReclaimable:     600000 kB
+SUnreclaim:       300000 kB
+"""
+
+def write_fake_procfs(root, cores=8, tick=0):
+    proc = os.path.join(root, "proc")
+    lines = []
+    for i in range(-1, cores):
+        name = "cpu" if i < 0 else f"cpu{i}"
+        scale = cores if i < 0 else 1
+        busy = (1000 + tick * 37 + max(i, 0) * 11) * scale
+        lines.append(f"{name}  {busy} 12 {busy // 4} {(90000 + tick * 63) * scale} 300 0 40 0 0 0")
+    lines.append("intr 123456 " + " ".join("0" for _ in range(512)))
+    lines.append("ctxt 545865")
+    lines.append("btime 1700000000")
+    _write(os.path.join(proc, "stat"), "\n".join(lines))
+    with open(os.path.join(proc, "meminfo"), "w") as f:
+        f.write(MEMINFO)
+    lines = [
+        "Inter-|   Receive                                                |  Transmit",
+        " face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed"
+    ]
+    for i, name in enumerate(("lo", "eth0", "wlan0", "docker0")):
+        lines.append(f"{name:>6}: {(i + 1) * 65536 * (tick + 1)} {(i + 1) * 64 * (tick + 1)} 0 0 0 0 0 0 {(i + 1) * 4096 * (tick + 1)} {(i + 1) * 8 * (tick + 1)} 0 0 0 0 0 0")
+    _write(os.path.join(proc, "net", "dev"), "\n".join(lines))
+    lines = []
+    for disk in ("nvme0n1", "sda"):
+        lines.append(f" 259 0 {disk} {20 * (tick + 1)} 0 {160 * (tick + 1)} 10 {10 * (tick + 1)} 0 {80 * (tick + 1)} 5 0 20 15 0 0 0 0")
+        for part in (1, 2):
+            lines.append(f" 259 {part} {disk}{'p' if disk.startswith('nvme') else ''}{part} {10 * (tick + 1)} 0 {80 * (tick + 1)} 5 {5 * (tick + 1)} 0 {40 * (tick + 1)} 2 0 10 7 0 0 0 0")
+        os.makedirs(os.path.join(root, "sys", "block", disk), exist_ok=True)
+    _write(os.path.join(proc, "diskstats"), "\n".join(lines))
+    return proc
@@ -0,0 +1,134 @@
+import time
+from src.core.fleet import DELTA_MASK, FRAME, FleetAgent, FleetCollector, FleetEncoder, MAX_GPUS, parse_address
+from tests.helpers import make_snapshot
+
+ADDRESS = ("10.0.0.2", 40000)
+
+
+def host_snapshot(timestamp, cpu=12.5, gpus=2):
+    return make_snapshot(
+        timestamp,
+        cpu=cpu,
+        ram=41.0,
+        cpu_temp=55.5,
+        gpus=[(f"GPU {i}", 10.0 * (i + 1)) for i in range(gpus)],
+        gpu_temps=[(f"GPU {i}", 60.0 + i) for i in range(gpus)],
+        cpu_name="AMD Ryzen 9 7950X"
+    )
+
+
+def test_keyframe_and_delta_round_trip():
+    encoder = FleetEncoder("build-box")
+    collector = FleetCollector()
+    collector.feed(encoder.encode(host_snapshot(1.0)), ADDRESS, now=1.0)
+    collector.feed(encoder.encode(host_snapshot(2.0, cpu=80.0)), ADDRESS, now=2.0)
+    host, = collector.publish(now=2.0)
+    assert host.name == "build-box"
+    assert host.address == "10.0.0.2"
+    assert host.snapshot.cpu_name == "AMD Ryzen 9 7950X"
+    assert host.snapshot.cpu_usage == 80.0
+    assert host.snapshot.cpu_temp == 55.5
+    assert host.snapshot.gpu_info == (("GPU 0", 10.0), ("GPU 1", 20.0))
+    assert host.snapshot.gpu_temps == (("GPU 0", 60.0), ("GPU 1", 61.0))
+    stats = collector.stats()
+    assert (stats["keyframes"], stats["deltas"], stats["lost"]) == (1, 1, 0)
+
+
+def test_idle_delta_is_small():
+    encoder = FleetEncoder("idle", keyframe_interval=10)
+    keyframe = encoder.encode(host_snapshot(1.0))
+    delta = encoder.encode(host_snapshot(2.0))
+    assert len(delta) < len(keyframe)
+    assert len(delta) <= 30
+
+
+def test_lost_datagram_is_repaired_by_keyframe():
+    encoder = FleetEncoder("lossy", keyframe_interval=3)
+    collector = FleetCollector()
+    frames = [encoder.encode(host_snapshot(float(i), cpu=float(i))) for i in range(4)]
+    collector.feed(frames[0], ADDRESS, now=0.0)
+    collector.feed(frames[2], ADDRESS, now=2.0)
+    host, = collector.publish(now=2.0)
+    assert host.lost == 1
+    assert host.snapshot.cpu_usage == 2.0
+    collector.feed(frames[3], ADDRESS, now=3.0)
+    host, = collector.publish(now=3.0)
+    assert host.snapshot.cpu_usage == 3.0
+    assert collector.stats()["keyframes"] == 2
+
+
+def test_delta_without_keyframe_is_ignored():
+    encoder = FleetEncoder("late")
+    encoder.encode(host_snapshot(1.0))
+    collector = FleetCollector()
+    collector.feed(encoder.encode(host_snapshot(2.0)), ADDRESS, now=2.0)
+    assert collector.publish(now=2.0) == ()
+    assert collector.stats()["unknown"] == 1
+
+
+def test_invalid_datagrams_are_counted():
+    collector = FleetCollector()
+    collector.feed(b"nope", ADDRESS, now=0.0)
+    collector.feed(b"XXXX" + bytes(30), ADDRESS, now=0.0)
+    assert collector.stats()["invalid"] == 2
+
+
+def test_delta_with_oversized_mask_leaves_host_untouched():
+    encoder = FleetEncoder("bad-mask")
+    collector = FleetCollector()
+    collector.feed(encoder.encode(host_snapshot(1.0, cpu=10.0)), ADDRESS, now=1.0)
+    delta = bytearray(encoder.encode(host_snapshot(2.0, cpu=20.0)))
+    DELTA_MASK.pack_into(delta, FRAME.size, 1 | (1 << 63))
+    collector.feed(bytes(delta) + bytes(16), ADDRESS, now=2.0)
+    host, = collector.publish(now=2.0)
+    assert host.snapshot.cpu_usage == 10.0
+    assert host.snapshot.timestamp == 1.0
+    stats = collector.stats()
+    assert (stats["invalid"], stats["deltas"], stats["lost"]) == (1, 0, 0)
+
+
+def test_gpu_without_temperature_keeps_its_slot():
+    snapshot = host_snapshot(1.0, gpus=2)._replace(gpu_temps=(("GPU 1", 70.0),))
+    collector = FleetCollector()
+    collector.feed(FleetEncoder("mixed").encode(snapshot), ADDRESS, now=1.0)
+    host, = collector.publish(now=1.0)
+    assert host.snapshot.gpu_info == (("GPU 0", 10.0), ("GPU 1", 20.0))
+    assert host.snapshot.gpu_temps == (("GPU 1", 70.0),)
+
+
+def test_gpu_list_is_capped():
+    collector = FleetCollector()
+    collector.feed(FleetEncoder("big").encode(host_snapshot(1.0, gpus=MAX_GPUS + 5)), ADDRESS, now=1.0)
+    host, = collector.publish(now=1.0)
+    assert len(host.snapshot.gpu_info) == MAX_GPUS
+    assert host.snapshot.gpu_temps[-1] == (f"GPU {MAX_GPUS - 1}", 60.0 + MAX_GPUS - 1)
+
+
+def test_silent_hosts_expire():
+    collector = FleetCollector(timeout=5.0)
+    collector.feed(FleetEncoder("gone").encode(host_snapshot(1.0)), ADDRESS, now=1.0)
+    assert len(collector.publish(now=1.0)) == 1
+    assert collector.publish(now=7.0) == ()
+    assert collector.stats()["expired"] == 1
+
+
+def test_agent_reaches_collector_over_udp():
+    published = []
+    collector = FleetCollector(port=0, publish_interval=0.05, callback=published.append)
+    collector.start()
+    agent = FleetAgent(("127.0.0.1", collector.port), name="udp")
+    try:
+        deadline = time.monotonic() + 5.0
+        while not published and time.monotonic() < deadline:
+            agent.send(host_snapshot(time.time()))
+            time.sleep(0.02)
+    finally:
+        agent.close()
+        collector.stop()
+    assert published and published[-1][0].name == "udp"
+
+
+def test_parse_address():
+    assert parse_address("192.168.1.10:9000") == ("192.168.1.10", 9000)
+    assert parse_address("[::1]:9000") == ("::1", 9000)
+    assert parse_address("collector") == ("collector", 9465)
@@ -0,0 +1,56 @@
+import io
+import json
+from src.core.headless import CsvWriter, RotatingFile, csv_columns, main
+from src.core.session_recorder import SessionRecorder
+from tests.helpers import make_snapshot
+
+
+def test_header_comes_from_the_first_snapshot():
+    stream = io.StringIO()
+    writer = CsvWriter(stream, interfaces=["eth0"])
+    writer.write(make_snapshot(1.0, gpus=[("RTX", 5.0)]))
+    writer.write(make_snapshot(2.0, gpus=[("RTX", 6.0)]))
+    lines = stream.getvalue().splitlines()
+    assert lines[0] == ",".join(csv_columns(1, ["eth0"]))
+    assert len(lines) == 3
+    assert lines[2] == "2.0,,CPU,10.0,20.0,,RTX,6.0,,,"
+
+
+def test_new_header_when_gpu_count_changes():
+    stream = io.StringIO()
+    writer = CsvWriter(stream)
+    writer.write(make_snapshot(1.0))
+    writer.write(make_snapshot(2.0, gpus=[("RTX", 5.0)]))
+    writer.write(make_snapshot(3.0, gpus=[("RTX", 6.0)]))
+    lines = stream.getvalue().splitlines()
+    assert lines[0] == ",".join(csv_columns(0))
+    assert lines[2] == ",".join(csv_columns(1))
+    assert [line.split(",")[0] for line in lines].count("timestamp") == 2
+
+
+def test_header_is_repeated_after_rotation(tmp_path):
+    path = tmp_path / "out.csv"
+    stream = RotatingFile(str(path), max_bytes=100, backups=1)
+    writer = CsvWriter(stream)
+    stream.on_rotate = writer.reset
+    for i in range(4):
+        writer.write(make_snapshot(float(i)))
+    stream.close()
+    for name in (path, tmp_path / "out.csv.1"):
+        assert name.read_text().splitlines()[0].startswith("timestamp,")
+
+
+def test_stats_are_printed_on_exit(tmp_path, capsys):
+    path = str(tmp_path / "session.ovr")
+    recorder = SessionRecorder(path)
+    for i in range(3):
+        recorder.record(make_snapshot(float(i)))
+    recorder.close()
+    assert main(["--headless", "--replay", path, "--replay-loop", "--output", "none", "--count", "2",
+                 "--interval-ms", "50", "--config-dir", str(tmp_path / "config"), "--stats"]) == 0
+    stats = json.loads(capsys.readouterr().err.strip().splitlines()[-1])
+    assert stats["sampler"]["samples"] >= 2
+    assert stats["sampler"]["reads"]["cpu"] >= 2
+    assert "reads_saved" in stats["sampler"]
+    assert set(stats["sampler"]["throttled_s"]) == {"pause", "low"}
+    assert stats["startup"]["first_sample_ms"] == 0.0
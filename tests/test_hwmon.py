@@ -0,0 +1,94 @@
+import os
+from tests.helpers import write_fake_hwmon, write_fake_sysfs
+from src.core.hwmon import HwmonBackend
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_coretemp_package_and_cores(tmp_path):
+    write_fake_sysfs(str(tmp_path), amd=0, cpu_chip="coretemp", cores=4)
+    backend = HwmonBackend(str(tmp_path))
+    assert backend.cpu_temperature() == 61.0
+    assert backend.core_temperatures() == [("Core 0", 55.0), ("Core 1", 56.0), ("Core 2", 57.0), ("Core 3", 58.0)]
+    assert backend.gpu_temperatures() is None
+    backend.close()
+
+
+def test_k10temp_prefers_tctl(tmp_path):
+    write_fake_sysfs(str(tmp_path), amd=0, cpu_chip="k10temp", cores=16)
+    backend = HwmonBackend(str(tmp_path))
+    assert backend.cpu_temperature() == 63.0
+    assert backend.core_temperatures() == [("Tccd1", 58.0), ("Tccd2", 58.5)]
+    backend.close()
+
+
+def test_gpu_chips_are_labelled(tmp_path):
+    write_fake_hwmon(str(tmp_path), "radeon", [("temp1", 48000)])
+    write_fake_hwmon(str(tmp_path), "nouveau", [("temp1", 51500)])
+    backend = HwmonBackend(str(tmp_path))
+    assert backend.cpu_temperature() is None
+    assert backend.gpu_temperatures() == [("radeon", 48.0), ("nouveau", 51.5)]
+    backend.close()
+
+
+def test_thermal_zone_fallback(tmp_path):
+    zone = tmp_path / "sys/class/thermal/thermal_zone0"
+    zone.mkdir(parents=True)
+    (zone / "type").write_text("x86_pkg_temp\n")
+    (zone / "temp").write_text("47000\n")
+    backend = HwmonBackend(str(tmp_path))
+    assert backend.cpu_temperature() == 47.0
+    backend.close()
+
+
+def test_unknown_chip_fallback(tmp_path):
+    write_fake_sysfs(str(tmp_path), amd=1)
+    write_fake_hwmon(str(tmp_path), "nct6775", [("SYSTIN", 34000), ("CPUTIN", 45500)])
+    backend = HwmonBackend(str(tmp_path))
+    assert backend.cpu_temperature() == 34.0
+    assert backend.core_temperatures() == []
+    backend.close()
+
+
+def test_named_chip_wins_over_fallback(tmp_path):
+    write_fake_hwmon(str(tmp_path), "it87", [("temp1", 30000)])
+    write_fake_hwmon(str(tmp_path), "zenpower", [("Tdie", 52000)])
+    backend = HwmonBackend(str(tmp_path))
+    assert backend.cpu_temperature() == 52.0
+    backend.close()
+
+
+def test_descriptors_are_reused_until_a_rescan(tmp_path):
+    write_fake_sysfs(str(tmp_path), amd=0, cpu_chip="coretemp", cores=2)
+    clock = FakeClock()
+    backend = HwmonBackend(str(tmp_path), rescan_interval=10.0, clock=clock)
+    assert backend.cpu_temperature() == 61.0
+    assert backend.discoveries == 1
+    write_fake_hwmon(str(tmp_path), "nouveau", [("temp1", 40000)])
+    clock.now = 5.0
+    assert backend.gpu_temperatures() is None
+    assert backend.discoveries == 1
+    clock.now = 10.0
+    assert backend.gpu_temperatures() == [("nouveau", 40.0)]
+    assert backend.discoveries == 2
+    backend.close()
+
+
+def test_unreadable_sensor_triggers_rediscovery(tmp_path):
+    link = write_fake_hwmon(str(tmp_path), "coretemp", [("Package id 0", 70000), ("Core 0", 65000)])
+    backend = HwmonBackend(str(tmp_path))
+    assert backend.cpu_temperature() == 70.0
+    with open(os.path.join(link, "temp1_input"), "w") as f:
+        f.write("\n")
+    assert backend.cpu_temperature() is None
+    with open(os.path.join(link, "temp1_input"), "w") as f:
+        f.write("72000\n")
+    assert backend.cpu_temperature() == 72.0
+    assert backend.discoveries == 2
+    backend.close()
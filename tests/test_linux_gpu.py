@@ -0,0 +1,77 @@
+from tests.helpers import write_fake_sysfs
+from src.core.linux_gpu import SysfsGpuBackend
+from src.core.providers import SHARED_READ_WINDOW, SysfsGpuProvider
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingBackend(SysfsGpuBackend):
+    reads = 0
+
+    def read(self):
+        self.reads += 1
+        return super().read()
+
+
+def test_amd_gpu_is_read_from_sysfs(tmp_path):
+    write_fake_sysfs(str(tmp_path), amd=2)
+    backend = SysfsGpuBackend(str(tmp_path))
+    gpus = backend.read()
+    backend.close()
+    assert [gpu["name"] for gpu in gpus] == ["AMD Radeon (73bf)", "AMD Radeon (73bf)"]
+    assert [gpu["usage"] for gpu in gpus] == [37.0, 38.0]
+    assert [gpu["temperature"] for gpu in gpus] == [52.0, 53.0]
+    assert gpus[0]["type"] == "amd"
+    assert gpus[0]["memory_used"] == 2048.0
+    assert gpus[0]["memory_total"] == 16368.0
+
+
+def test_intel_gpu_reports_clock_without_usage(tmp_path):
+    write_fake_sysfs(str(tmp_path), amd=0, i915=1, xe=1)
+    backend = SysfsGpuBackend(str(tmp_path))
+    gpus = backend.read()
+    backend.close()
+    assert [gpu["type"] for gpu in gpus] == ["intel", "intel"]
+    assert [gpu["usage"] for gpu in gpus] == [None, None]
+    assert [gpu["clock_core"] for gpu in gpus] == [650.0, 2000.0]
+    assert gpus[1]["name"] == "Intel Graphics (e20b)"
+
+
+def test_provider_skips_gpus_without_usage(tmp_path):
+    write_fake_sysfs(str(tmp_path), amd=1, i915=1)
+    provider = SysfsGpuProvider(SysfsGpuBackend(str(tmp_path)))
+    assert provider.probe()
+    assert provider.read("gpu") == [("AMD Radeon (73bf)", 37.0)]
+    assert provider.read("gpu_temp") == [("AMD Radeon (73bf)", 52.0)]
+
+
+def test_usage_follows_file_changes(tmp_path):
+    write_fake_sysfs(str(tmp_path), amd=1)
+    backend = SysfsGpuBackend(str(tmp_path))
+    assert backend.read()[0]["usage"] == 37.0
+    with open(tmp_path / "sys/class/drm/card0/device/gpu_busy_percent", "w") as f:
+        f.write("91\n")
+    assert backend.read()[0]["usage"] == 91.0
+    backend.close()
+
+
+def test_usage_and_temperature_share_one_read_per_tick(tmp_path):
+    write_fake_sysfs(str(tmp_path), amd=1)
+    clock = FakeClock()
+    backend = CountingBackend(str(tmp_path))
+    provider = SysfsGpuProvider(backend, clock=clock)
+    assert provider.read("gpu") == [("AMD Radeon (73bf)", 37.0)]
+    assert provider.read("gpu_temp") == [("AMD Radeon (73bf)", 52.0)]
+    assert backend.reads == 1
+    with open(tmp_path / "sys/class/drm/card0/device/gpu_busy_percent", "w") as f:
+        f.write("91\n")
+    clock.now += SHARED_READ_WINDOW
+    assert provider.read("gpu") == [("AMD Radeon (73bf)", 91.0)]
+    assert backend.reads == 2
+    backend.close()
@@ -0,0 +1,90 @@
+import threading
+import pytest
+from src.core.metric_history import MAX_CAPACITY, MIN_CAPACITY, MetricHistory, RingBuffer
+from tests.helpers import make_snapshot
+
+
+def test_ring_buffer_keeps_the_newest_values_in_order():
+    buffer = RingBuffer(4)
+    assert buffer.last() is None
+    assert list(buffer.values()) == []
+    for value in range(1, 7):
+        buffer.append(value)
+    assert len(buffer) == 4
+    assert list(buffer.values()) == [3.0, 4.0, 5.0, 6.0]
+    assert list(buffer.values(2)) == [5.0, 6.0]
+    assert buffer.last() == 6.0
+
+
+def test_ring_buffer_statistics_follow_the_window():
+    buffer = RingBuffer(5)
+    for value in (9, 1, 7, 3, 5, 2):
+        buffer.append(value)
+    assert buffer.min() == 1.0
+    assert buffer.max() == 7.0
+    assert buffer.mean() == pytest.approx(18 / 5)
+    assert buffer.min(2) == 2.0
+    assert buffer.max(3) == 5.0
+    assert buffer.mean(2) == 3.5
+    assert buffer.percentile(50) == 3.0
+    assert buffer.percentile(100, window=3) == 5.0
+    for _ in range(5):
+        buffer.append(4)
+    assert (buffer.min(), buffer.max(), buffer.mean()) == (4.0, 4.0, 4.0)
+
+
+def test_set_capacity_truncates_to_the_newest_values():
+    history = MetricHistory(20)
+    for value in range(20):
+        history.append("cpu", value)
+    history.set_capacity(MIN_CAPACITY)
+    assert history.capacity == MIN_CAPACITY
+    assert list(history.values("cpu")) == [float(value) for value in range(10, 20)]
+    history.set_capacity(100)
+    assert list(history.values("cpu")) == [float(value) for value in range(10, 20)]
+    history.append("cpu", 20)
+    assert len(history.buffer("cpu")) == 11
+    history.set_capacity(10 ** 9)
+    assert history.capacity == MAX_CAPACITY
+
+
+def test_record_and_stats():
+    history = MetricHistory()
+    snapshot = make_snapshot(cpu=30.0, ram=40.0, gpus=[("RTX", 50.0)], gpu_temps=[("RTX", 60.0)])
+    history.record(snapshot)
+    history.record(snapshot._replace(cpu_usage=50.0))
+    assert sorted(history.metrics()) == ["cpu", "gpu0", "gpu_temp0", "ram"]
+    stats = history.stats("cpu")
+    assert stats["mean"] == 40.0
+    assert stats["samples"] == 2
+    assert history.stats("cpu_temp") is None
+    assert list(history.values("missing")) == []
+
+
+def test_set_capacity_while_appending():
+    history = MetricHistory(1000)
+    stop = threading.Event()
+    errors = []
+
+    def sample():
+        value = 0
+        try:
+            while not stop.is_set():
+                history.append("cpu", value)
+                value += 1
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=sample)
+    thread.start()
+    try:
+        for capacity in (10, 500, 20, 2000, 50) * 20:
+            history.set_capacity(capacity)
+            values = history.values("cpu")
+            assert list(values) == sorted(values)
+    finally:
+        stop.set()
+        thread.join()
+    assert not errors
+    values = list(history.values("cpu"))
+    assert values == [values[0] + i for i in range(len(values))]
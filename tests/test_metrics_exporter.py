@@ -0,0 +1,79 @@
+import urllib.error
+import urllib.request
+import pytest
+from src.core.metrics_exporter import CONTENT_TYPE, MetricsExporter
+from tests.helpers import make_snapshot
+
+
+def exporter_snapshot():
+    return make_snapshot(
+        1700000000.0,
+        cpu=12.5,
+        ram=float("nan"),
+        gpus=[("RTX 4090", 40.0), ("Arc A770", 7.0)],
+        gpu_temps=[("Arc A770", 55.0)],
+        cpu_name='Ryzen "X3D"'
+    )
+
+
+@pytest.fixture
+def exporter():
+    exporter = MetricsExporter(port=0)
+    exporter.start()
+    yield exporter
+    exporter.stop()
+
+
+def scrape(exporter, path="/metrics"):
+    with urllib.request.urlopen(f"http://127.0.0.1:{exporter.port}{path}", timeout=5) as response:
+        return response.headers["Content-Type"], response.read().decode("utf-8")
+
+
+def test_scrape_before_first_snapshot(exporter):
+    content_type, body = scrape(exporter)
+    assert content_type == CONTENT_TYPE
+    assert body.endswith("# EOF\n")
+    assert "overlay_cpu_usage_percent" not in body
+
+
+def test_scrape_serves_published_snapshot(exporter):
+    exporter.publish(exporter_snapshot())
+    content_type, body = scrape(exporter)
+    assert content_type == CONTENT_TYPE
+    lines = body.splitlines()
+    assert lines[-1] == "# EOF"
+    assert body.count("# EOF") == 1
+    assert 'overlay_cpu_info{name="Ryzen \\"X3D\\""} 1.0' in lines
+    assert "overlay_cpu_usage_percent 12.5" in lines
+    assert 'overlay_gpu_usage_percent{gpu="0",name="RTX 4090"} 40.0' in lines
+    assert 'overlay_gpu_usage_percent{gpu="1",name="Arc A770"} 7.0' in lines
+    assert 'overlay_gpu_temperature_celsius{gpu="1",name="Arc A770"} 55.0' in lines
+    assert 'overlay_gpu_temperature_celsius{gpu="0",name="RTX 4090"}' not in body
+    assert "nan" not in body.lower()
+    assert "overlay_ram_usage_percent" not in body
+    assert "overlay_cpu_temperature_celsius" not in body
+
+
+def test_latest_callback_takes_precedence():
+    snapshot = exporter_snapshot()._replace(cpu_usage=77.0)
+    exporter = MetricsExporter(latest=lambda: snapshot, port=0)
+    exporter.start()
+    try:
+        exporter.publish(exporter_snapshot())
+        _, body = scrape(exporter)
+    finally:
+        exporter.stop()
+    assert "overlay_cpu_usage_percent 77.0" in body.splitlines()
+
+
+def test_scrapes_are_counted(exporter):
+    exporter.publish(exporter_snapshot())
+    scrape(exporter)
+    _, body = scrape(exporter, "/")
+    assert "overlay_scrape_render_seconds_count 1" in body.splitlines()
+
+
+def test_unknown_path_is_404(exporter):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        scrape(exporter, "/other")
+    assert error.value.code == 404
@@ -0,0 +1,63 @@
+import functools
+from src.core.monitor_service import MonitorService
+from src.core.sampler import THROTTLE_LOW, THROTTLE_PAUSE
+from src.core.session_recorder import ReplayMonitor, SessionRecorder
+from tests.helpers import make_snapshot
+
+
+def make_service(tmp_path):
+    path = str(tmp_path / "session.ovr")
+    recorder = SessionRecorder(path)
+    for i in range(3):
+        recorder.record(make_snapshot(float(i), gpus=[("GPU 0", 5.0)]))
+    recorder.close()
+    return MonitorService(functools.partial(ReplayMonitor, path))
+
+
+def overlay(snapshot):
+    pass
+
+
+def dialog(snapshot):
+    pass
+
+
+def test_passive_subscriber_does_not_change_intervals(tmp_path):
+    service = make_service(tmp_path)
+    service.subscribe(overlay, 1000, intervals={"inventory": 0, "cpu_temp": 2000})
+    service.subscribe(dialog, 5000, passive=True, gpu=True)
+    sampler = service.sampler
+    assert sampler.metric_interval("inventory") is None
+    assert sampler.metric_interval("cpu_temp") == 2.0
+    assert sampler.stats()["interval_ms"] == 1000
+    service.subscribe(dialog, 100)
+    assert sampler.stats()["interval_ms"] == 1000
+    service.unsubscribe(dialog)
+    service.unsubscribe(overlay)
+    assert service.refcount == 0
+
+
+def test_passive_subscriber_does_not_prevent_throttling(tmp_path):
+    service = make_service(tmp_path)
+    service.subscribe(overlay, 1000)
+    service.subscribe(dialog, 5000, passive=True)
+    service.set_throttle(overlay, THROTTLE_PAUSE)
+    assert service.sampler.stats()["throttle"] == THROTTLE_PAUSE
+    service.set_throttle(overlay, THROTTLE_LOW, 5000)
+    assert service.sampler.stats()["throttle"] == THROTTLE_LOW
+    service.unsubscribe(overlay)
+    assert service.sampler.stats()["throttle"] is None
+    assert service.sampler.stats()["interval_ms"] == 5000
+    service.unsubscribe(dialog)
+    assert service.refcount == 0
+
+
+def test_active_subscribers_block_throttling(tmp_path):
+    service = make_service(tmp_path)
+    service.subscribe(overlay, 1000)
+    service.subscribe(dialog, 500)
+    service.set_throttle(overlay, THROTTLE_PAUSE)
+    assert service.sampler.stats()["throttle"] is None
+    assert service.sampler.stats()["interval_ms"] == 500
+    service.unsubscribe(dialog)
+    service.unsubscribe(overlay)
@@ -0,0 +1,76 @@
+import time
+from tests.helpers import write_fake_nvidia_smi
+from src.core.nvidia_smi import NvidiaSmiStream
+from src.core.nvml import Nvml
+from src.core.providers import NvidiaProvider, ProviderRegistry
+
+RESTART_DELAY = 0.5
+
+
+def wait_for(condition, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        value = condition()
+        if value:
+            return value
+        time.sleep(0.02)
+    return condition()
+
+
+def make_stream(tmp_path, gpus=2):
+    executable = write_fake_nvidia_smi(str(tmp_path), gpus)
+    return NvidiaSmiStream(100, executable=executable, restart_delay=RESTART_DELAY)
+
+
+def test_latest_returns_complete_frames(tmp_path):
+    stream = make_stream(tmp_path)
+    try:
+        assert stream.latest() is None
+        assert stream.wait_first_frame(5.0)
+        gpus = stream.latest()
+        assert [gpu["name"] for gpu in gpus] == ["NVIDIA GeForce RTX 4090", "NVIDIA GeForce RTX 4080"]
+        assert gpus[1]["temperature"] == 51.0
+        assert gpus[0]["memory_total"] == 24564.0
+    finally:
+        stream.stop()
+
+
+def test_killed_process_is_restarted_by_the_reader(tmp_path):
+    stream = make_stream(tmp_path)
+    try:
+        stream.start()
+        assert stream.wait_first_frame(5.0)
+        stream._process.kill()
+        assert wait_for(lambda: not stream.is_running(), 2.0)
+        assert wait_for(lambda: stream.restarts == 1 and stream.wait_first_frame(0), RESTART_DELAY + 5.0)
+        assert len(stream.latest()) == 2
+    finally:
+        stream.stop()
+
+
+def test_gpus_return_to_the_registry_after_a_restart(tmp_path):
+    stream = make_stream(tmp_path)
+    registry = ProviderRegistry([NvidiaProvider(Nvml(library=str(tmp_path / "missing.so")), stream)])
+    stream.on_restart = registry.invalidate
+    try:
+        stream.start()
+        assert stream.wait_first_frame(5.0)
+        assert len(registry.read("gpu")) == 2
+        stream._process.kill()
+        assert wait_for(lambda: registry.read("gpu") is None, 2.0)
+        killed = time.monotonic()
+        assert wait_for(lambda: registry.read("gpu"), RESTART_DELAY + 5.0)
+        assert time.monotonic() - killed < RESTART_DELAY + 2.0
+        assert registry.selected() == {"gpu": ["nvidia"]}
+    finally:
+        stream.stop()
+
+
+def test_stop_prevents_restart(tmp_path):
+    stream = make_stream(tmp_path)
+    stream.start()
+    assert stream.wait_first_frame(5.0)
+    stream.stop()
+    time.sleep(RESTART_DELAY + 0.2)
+    assert not stream.is_running()
+    assert stream.restarts == 0
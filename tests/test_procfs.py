@@ -0,0 +1,59 @@
+import pytest
+from tests.helpers import write_fake_procfs
+from src.core.procfs import ProcfsReader
+
+
+def test_cpu_percent_from_two_samples(tmp_path):
+    write_fake_procfs(str(tmp_path), cores=8, tick=0)
+    reader = ProcfsReader(str(tmp_path))
+    assert reader.available()
+    assert reader.cpu_percent() == 0.0
+    write_fake_procfs(str(tmp_path), cores=8, tick=1)
+    assert reader.cpu_percent() == pytest.approx(370 * 100.0 / 874)
+    cores = reader.core_percents()
+    assert len(cores) == 8
+    assert cores[0] == pytest.approx(46 * 100.0 / 109)
+    reader.close()
+
+
+def test_core_count_change_resets_percents(tmp_path):
+    write_fake_procfs(str(tmp_path), cores=4, tick=0)
+    reader = ProcfsReader(str(tmp_path))
+    reader.cpu_percent()
+    write_fake_procfs(str(tmp_path), cores=6, tick=1)
+    assert reader.cpu_percent() == 0.0
+    assert reader.core_percents() == [0.0] * 6
+    write_fake_procfs(str(tmp_path), cores=6, tick=2)
+    assert reader.cpu_percent() > 0.0
+    reader.close()
+
+
+def test_memory_from_meminfo(tmp_path):
+    write_fake_procfs(str(tmp_path))
+    reader = ProcfsReader(str(tmp_path))
+    memory = reader.memory()
+    assert memory["total"] == 32768000 * 1024
+    assert memory["available"] == 20123456 * 1024
+    assert memory["cached"] == (10240000 + 600000) * 1024
+    assert memory["swap_used"] == (8388604 - 8000000) * 1024
+    assert reader.memory_percent() == pytest.approx((32768000 - 20123456) * 100.0 / 32768000)
+    assert reader.last_memory()["percent"] == memory["percent"]
+    reader.close()
+
+
+def test_net_counters(tmp_path):
+    write_fake_procfs(str(tmp_path), tick=1)
+    reader = ProcfsReader(str(tmp_path))
+    counters = reader.net_counters()
+    assert sorted(counters) == ["docker0", "eth0", "lo", "wlan0"]
+    assert counters["eth0"] == (2 * 65536 * 2, 2 * 4096 * 2, 2 * 64 * 2, 2 * 8 * 2)
+    reader.close()
+
+
+def test_disk_counters_skip_partitions(tmp_path):
+    write_fake_procfs(str(tmp_path), tick=0)
+    reader = ProcfsReader(str(tmp_path))
+    counters = reader.disk_counters()
+    assert sorted(counters) == ["nvme0n1", "sda"]
+    assert counters["sda"] == (160 * 512, 80 * 512, 20, 10)
+    reader.close()
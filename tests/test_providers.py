@@ -0,0 +1,104 @@
+from src.core.providers import REPROBE_INTERVAL, FunctionProvider, ProviderRegistry, merge_devices
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class Flaky:
+    def __init__(self, value):
+        self.value = value
+        self.healthy = True
+
+    def __call__(self):
+        return self.value if self.healthy else None
+
+
+def test_priority_wins_over_read_time():
+    registry = ProviderRegistry([
+        FunctionProvider("slow", {"cpu_temp": lambda: 50.0}, priority=10),
+        FunctionProvider("fast", {"cpu_temp": lambda: 40.0}, priority=20)
+    ])
+    assert registry.read("cpu_temp") == 50.0
+    assert registry.selected() == {"cpu_temp": ["slow"]}
+
+
+def test_gpu_lists_are_merged_per_device():
+    registry = ProviderRegistry([
+        FunctionProvider("nvidia", {"gpu": lambda: [("RTX", 10.0)]}, priority=20),
+        FunctionProvider("sysfs", {"gpu": lambda: [("RTX", 11.0), ("iGPU", 5.0)]}, priority=30),
+        FunctionProvider("hwmon", {"gpu": lambda: [("iGPU", 6.0)]}, priority=40)
+    ])
+    assert registry.read("gpu") == [("RTX", 10.0), ("iGPU", 5.0)]
+    assert registry.selected() == {"gpu": ["nvidia", "sysfs"]}
+
+
+def test_merge_keeps_duplicate_names_within_a_provider():
+    assert merge_devices([[("RTX", 1.0), ("RTX", 2.0)], [("RTX", 3.0), ("RTX", 4.0), ("RTX", 5.0)]]) == [("RTX", 1.0), ("RTX", 2.0), ("RTX", 5.0)]
+
+
+def test_failed_provider_is_reprobed_after_the_interval():
+    clock = FakeClock()
+    nvidia = Flaky([("RTX", 10.0)])
+    registry = ProviderRegistry([
+        FunctionProvider("nvidia", {"gpu": nvidia}, priority=20),
+        FunctionProvider("sysfs", {"gpu": lambda: [("iGPU", 5.0)]}, priority=30)
+    ], clock=clock)
+    assert registry.read("gpu") == [("RTX", 10.0), ("iGPU", 5.0)]
+    nvidia.healthy = False
+    assert registry.read("gpu") == [("iGPU", 5.0)]
+    assert registry.selected()["gpu"] == ["nvidia", "sysfs"]
+    nvidia.healthy = True
+    assert registry.read("gpu") == [("RTX", 10.0), ("iGPU", 5.0)]
+
+
+def test_single_provider_recovers_after_failure():
+    clock = FakeClock()
+    primary = Flaky(70.0)
+    registry = ProviderRegistry([
+        FunctionProvider("primary", {"cpu_temp": primary}, priority=10),
+        FunctionProvider("fallback", {"cpu_temp": lambda: 60.0}, priority=20)
+    ], clock=clock)
+    assert registry.read("cpu_temp") == 70.0
+    primary.healthy = False
+    assert registry.read("cpu_temp") == 60.0
+    assert registry.selected() == {"cpu_temp": ["fallback"]}
+    primary.healthy = True
+    clock.now = REPROBE_INTERVAL - 1
+    assert registry.read("cpu_temp") == 60.0
+    clock.now = REPROBE_INTERVAL
+    assert registry.read("cpu_temp") == 70.0
+    assert registry.selected() == {"cpu_temp": ["primary"]}
+    clock.now = 1000.0
+    assert registry.read("cpu_temp") == 70.0
+
+
+def test_empty_selection_is_retried():
+    clock = FakeClock()
+    sensor = Flaky(55.0)
+    sensor.healthy = False
+    registry = ProviderRegistry([FunctionProvider("only", {"cpu_temp": sensor})], clock=clock)
+    assert registry.read("cpu_temp") is None
+    sensor.healthy = True
+    assert registry.read("cpu_temp") is None
+    clock.now = REPROBE_INTERVAL
+    assert registry.read("cpu_temp") == 55.0
+
+
+def test_provider_without_data_at_probe_time_joins_later():
+    clock = FakeClock()
+    nvidia = Flaky([("RTX", 10.0)])
+    nvidia.healthy = False
+    registry = ProviderRegistry([
+        FunctionProvider("nvidia", {"gpu": nvidia}, priority=20),
+        FunctionProvider("sysfs", {"gpu": lambda: [("iGPU", 5.0)]}, priority=30)
+    ], clock=clock)
+    assert registry.read("gpu") == [("iGPU", 5.0)]
+    nvidia.healthy = True
+    clock.now = REPROBE_INTERVAL
+    assert registry.read("gpu") == [("RTX", 10.0), ("iGPU", 5.0)]
+    assert registry.selected() == {"gpu": ["nvidia", "sysfs"]}
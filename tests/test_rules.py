@@ -0,0 +1,70 @@
+from src.core.rules import RulesEngine, compile_rules
+from tests.helpers import make_snapshot
+
+PALETTE = {"low": "#low", "medium": "#medium", "high": "#high"}
+
+
+def feed(engine, values, start=0.0, step=1.0):
+    events = []
+    for i, value in enumerate(values):
+        events += engine.evaluate(make_snapshot(start + i * step, cpu=value))
+    return events
+
+
+def test_default_rules_colour_usage_and_temperature():
+    engine = RulesEngine(palette=PALETTE)
+    engine.evaluate(make_snapshot(0.0, cpu=60.0, cpu_temp=80.0, gpus=[("GPU 0", 90.0)]))
+    assert engine.color("cpu") == "#medium"
+    assert engine.color("cpu_temp") == "#high"
+    assert engine.color("gpu0") == "#high"
+    assert engine.color("ram") == "#low"
+    assert engine.color_for("cpu_temp", 60.0) == "#medium"
+
+
+def test_hysteresis_delays_the_exit():
+    engine = RulesEngine([{"metric": "cpu", "above": 80, "hysteresis": 5, "color": "high"}], palette=PALETTE)
+    events = feed(engine, [85.0, 78.0, 76.0, 74.0])
+    assert [(entered, value) for _, _, entered, value, _ in events] == [(True, 85.0), (False, 74.0)]
+    assert engine.color("cpu") == "#low"
+    assert engine.transitions == 2
+
+
+def test_sustain_requires_the_value_to_stay_above():
+    engine = RulesEngine([{"metric": "cpu", "above": 80, "sustain_s": 3, "color": "high"}], palette=PALETTE)
+    assert feed(engine, [90.0, 90.0, 50.0, 90.0, 90.0, 90.0]) == []
+    events = feed(engine, [90.0], start=6.0)
+    assert len(events) == 1
+    assert events[0][2] is True
+    assert engine.color("cpu") == "#high"
+
+
+def test_jump_over_several_thresholds_enters_each_rule():
+    engine = RulesEngine(palette=PALETTE)
+    events = feed(engine, [95.0])
+    assert [rule.above for _, rule, entered, _, _ in events if entered] == [50.0, 80.0]
+    events = feed(engine, [10.0], start=1.0)
+    assert [rule.above for _, rule, entered, _, _ in events if not entered] == [80.0, 50.0]
+    assert engine.active() == {}
+
+
+def test_notify_and_log_actions(tmp_path):
+    log_path = tmp_path / "rules.log"
+    notes = []
+    rules = [{"metric": "cpu", "above": 80, "notify": "{metric} hit {value:.0f}", "log": True}]
+    engine = RulesEngine(rules, palette=PALETTE, notify=lambda title, message: notes.append((title, message)), log_path=str(log_path))
+    feed(engine, [90.0, 10.0])
+    assert notes == [("Overlay", "cpu hit 90")]
+    lines = log_path.read_text().splitlines()
+    assert len(lines) == 2
+    assert lines[1].endswith("cpu 10.0 back below 80")
+
+
+def test_invalid_rules_are_dropped():
+    rules = compile_rules([
+        {"metric": "cpu", "above": 50},
+        {"metric": "disk", "above": 50},
+        {"metric": "cpu", "above": "high"},
+        {"metric": "cpu", "above": True},
+        "cpu > 50"
+    ], PALETTE)
+    assert [(rule.metric, rule.above) for rule in rules] == [("cpu", 50.0)]
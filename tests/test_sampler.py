@@ -0,0 +1,48 @@
+import time
+from src.core.sampler import THROTTLE_PAUSE, Sampler, parse_metric_intervals
+from src.core.session_recorder import ReplayMonitor, SessionRecorder
+from tests.helpers import make_snapshot
+
+
+def make_monitor(tmp_path):
+    path = str(tmp_path / "session.ovr")
+    recorder = SessionRecorder(path)
+    for i in range(3):
+        recorder.record(make_snapshot(float(i), cpu_temp=50.0))
+    recorder.close()
+    return ReplayMonitor(path, loop=True)
+
+
+def test_parse_metric_intervals():
+    assert parse_metric_intervals({"cpu_temp": 2000, "inventory": 0, "gpu": 10, "bogus": 5, "ram": -1}) == {"cpu_temp": 2000, "inventory": 0, "gpu": 50}
+
+
+def test_slow_metrics_count_as_saved_reads(tmp_path):
+    monitor = make_monitor(tmp_path)
+    sampler = Sampler(monitor, 50, {"cpu_temp": 10000}, cpu_temp=True)
+    sampler.start()
+    time.sleep(0.4)
+    sampler.stop()
+    monitor.close()
+    stats = sampler.stats()
+    assert stats["reads"]["cpu"] >= 4
+    assert stats["reads"]["cpu_temp"] == 1
+    assert stats["reads_saved"] >= stats["reads"]["cpu"] - 2
+
+
+def test_throttled_time_is_accumulated(tmp_path):
+    monitor = make_monitor(tmp_path)
+    sampler = Sampler(monitor, 50)
+    sampler.start()
+    sampler.set_throttle(THROTTLE_PAUSE)
+    time.sleep(0.2)
+    samples = sampler.stats()["samples"]
+    time.sleep(0.1)
+    assert sampler.stats()["samples"] == samples
+    sampler.set_throttle(None)
+    sampler.stop()
+    monitor.close()
+    stats = sampler.stats()
+    assert stats["throttle"] is None
+    assert stats["throttled_s"]["pause"] >= 0.25
+    assert stats["throttled_s"]["low"] == 0.0
@@ -0,0 +1,91 @@
+import math
+import struct
+import time
+import pytest
+from src.core.session_recorder import MAGIC, PREAMBLE, ReplayMonitor, SessionReader, SessionRecorder
+from tests.helpers import make_snapshot
+
+
+def session_snapshot(timestamp, cpu=12.5, gpu_temps=(("GPU 0", 60.0), ("GPU 1", 61.0))):
+    return make_snapshot(timestamp, cpu=cpu, ram=40.0, gpus=[("GPU 0", 30.0), ("GPU 1", 70.0)], gpu_temps=gpu_temps, cpu_name="Intel Core i9")
+
+
+def record(path, snapshots, batch_records=600):
+    recorder = SessionRecorder(str(path), batch_records=batch_records)
+    for snapshot in snapshots:
+        recorder.record(snapshot)
+    recorder.close()
+    return recorder
+
+
+def test_file_layout(tmp_path):
+    path = tmp_path / "session.ovr"
+    record(path, [session_snapshot(1000.0), session_snapshot(1001.0)])
+    data = path.read_bytes()
+    magic, record_size, header_size = PREAMBLE.unpack_from(data, 0)
+    assert magic == MAGIC
+    assert record_size == struct.calcsize("<d7f")
+    assert len(data) == PREAMBLE.size + header_size + 2 * record_size
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "session.ovr"
+    recorder = record(path, [session_snapshot(1000.0 + i, cpu=float(i)) for i in range(5)])
+    assert recorder.records == 5
+    reader = SessionReader(str(path))
+    assert len(reader) == 5
+    assert reader.columns == ["cpu", "ram", "cpu_temp", "gpu0", "gpu1", "gpu_temp0", "gpu_temp1"]
+    assert reader.cpu_name == "Intel Core i9"
+    assert reader.gpu_names == ["GPU 0", "GPU 1"]
+    assert reader.column("cpu") == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert all(math.isnan(value) for value in reader.column("cpu_temp"))
+    snapshot = reader.snapshot(3)
+    assert snapshot.timestamp == 1003.0
+    assert snapshot.cpu_temp is None
+    assert snapshot.gpu_info == (("GPU 0", 30.0), ("GPU 1", 70.0))
+    assert snapshot.gpu_temps == (("GPU 0", 60.0), ("GPU 1", 61.0))
+    assert reader.index_at(1002.5) == 2
+    reader.close()
+
+
+def test_temperatures_stay_with_their_gpu(tmp_path):
+    path = tmp_path / "session.ovr"
+    record(path, [session_snapshot(1.0, gpu_temps=(("GPU 1", 66.0),))])
+    reader = SessionReader(str(path))
+    assert reader.snapshot(0).gpu_temps == (("GPU 1", 66.0),)
+    reader.close()
+
+
+def test_records_are_flushed_in_batches(tmp_path):
+    path = tmp_path / "session.ovr"
+    recorder = SessionRecorder(str(path), batch_records=3)
+    for i in range(4):
+        recorder.record(session_snapshot(float(i)))
+    reader = SessionReader(str(path))
+    assert len(reader) == 3
+    reader.close()
+    recorder.close()
+    recorder.record(session_snapshot(9.0))
+    reader = SessionReader(str(path))
+    assert len(reader) == 4
+    reader.close()
+
+
+def test_reader_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"x" * 64)
+    with pytest.raises(ValueError):
+        SessionReader(str(path))
+
+
+def test_replay_monitor_plays_the_recording(tmp_path):
+    path = tmp_path / "session.ovr"
+    record(path, [session_snapshot(100.0 + i, cpu=float(i)) for i in range(3)])
+    monitor = ReplayMonitor(str(path), speed=1000.0)
+    assert monitor.backend_ready is True
+    assert monitor.sample().cpu_usage == 0.0
+    assert monitor.get_gpu_info() == [("GPU 0", 30.0), ("GPU 1", 70.0)]
+    time.sleep(0.01)
+    assert monitor.finished()
+    assert monitor.sample().cpu_usage == 2.0
+    monitor.close()
@@ -0,0 +1,73 @@
+import math
+import pytest
+from src.core.throughput import NET_EXCLUDE, WRAP_32, WRAP_64, NetRate, RateMeter, counter_delta, format_rate
+
+
+def rates(meter, counters, now):
+    return {row.name: row for row in meter.update(counters, now)}
+
+
+def test_counter_delta():
+    assert counter_delta(150, 100) == 50
+    assert counter_delta(500, WRAP_32 - 1000) == 1500
+    assert counter_delta(100, WRAP_64 - 100) == 200
+    assert counter_delta(100, 10 ** 9) is None
+    assert counter_delta(5, WRAP_32 + 10 ** 6) is None
+
+
+def test_first_update_only_seeds_the_counters():
+    meter = RateMeter(NetRate, smoothing_ms=0)
+    assert meter.update({"eth0": (1000, 500, 10, 5)}, 0.0) == ()
+    row = rates(meter, {"eth0": (3000, 1500, 30, 15)}, 2.0)["eth0"]
+    assert row == NetRate("eth0", 1000.0, 500.0, 10.0, 5.0)
+
+
+def test_32_bit_wraparound_gives_the_real_rate():
+    meter = RateMeter(NetRate, smoothing_ms=0)
+    meter.update({"eth0": (WRAP_32 - 1000, 0, 0, 0)}, 0.0)
+    row = rates(meter, {"eth0": (1000, 0, 0, 0)}, 1.0)["eth0"]
+    assert row.rx_bytes == 2000.0
+
+
+def test_reset_counter_never_goes_negative():
+    meter = RateMeter(NetRate, smoothing_ms=0)
+    meter.update({"eth0": (10 ** 9, 10 ** 9, 1000, 1000)}, 0.0)
+    row = rates(meter, {"eth0": (10 ** 9 + 4000, 10 ** 9 + 2000, 1040, 1020)}, 1.0)["eth0"]
+    assert row.rx_bytes == 4000.0
+    row = rates(meter, {"eth0": (100, 50, 1, 1)}, 2.0)["eth0"]
+    assert row == NetRate("eth0", 4000.0, 2000.0, 40.0, 20.0)
+    row = rates(meter, {"eth0": (1100, 550, 11, 6)}, 3.0)["eth0"]
+    assert row == NetRate("eth0", 1000.0, 500.0, 10.0, 5.0)
+
+
+def test_reset_before_the_first_rate_reports_zero():
+    meter = RateMeter(NetRate, smoothing_ms=0)
+    meter.update({"eth0": (10 ** 9, 10 ** 9, 10, 10)}, 0.0)
+    row = rates(meter, {"eth0": (100, 100, 1, 1)}, 1.0)["eth0"]
+    assert all(value == 0.0 for value in row[1:])
+
+
+def test_ewma_is_seeded_with_the_first_rate_and_time_weighted():
+    meter = RateMeter(NetRate, smoothing_ms=1000)
+    meter.update({"eth0": (0, 0, 0, 0)}, 0.0)
+    assert rates(meter, {"eth0": (1000, 0, 0, 0)}, 1.0)["eth0"].rx_bytes == 1000.0
+    row = rates(meter, {"eth0": (1000 + 3000 * 2, 0, 0, 0)}, 3.0)["eth0"]
+    assert row.rx_bytes == pytest.approx(1000.0 + (1.0 - math.exp(-2.0)) * 2000.0)
+
+
+def test_filters_and_idle_devices():
+    meter = RateMeter(NetRate, smoothing_ms=0, exclude=NET_EXCLUDE)
+    counters = {"lo": (5, 5, 1, 1), "docker0": (5, 5, 1, 1), "eth0": (5, 5, 1, 1), "wlan0": (0, 0, 0, 0)}
+    assert meter.devices(counters) == ["eth0"]
+    meter.update(counters, 0.0)
+    assert sorted(rates(meter, counters, 1.0)) == ["eth0"]
+    meter.configure(0, include=["lo"])
+    meter.update(counters, 2.0)
+    assert sorted(rates(meter, counters, 3.0)) == ["lo"]
+
+
+def test_format_rate():
+    assert format_rate(512) == "512 B/s"
+    assert format_rate(2048) == "2 KB/s"
+    assert format_rate(3 * (1 << 20)) == "3.0 MB/s"
+    assert format_rate(1.5 * (1 << 30)) == "1.5 GB/s"
@@ -0,0 +1,37 @@
+import json
+from src.core.tick_profiler import STAGES, TickProfiler, bucket_for, bucket_label, format_duration
+
+
+def test_stage_statistics():
+    profiler = TickProfiler(window=4)
+    for us in (100, 200, 300, 400, 500):
+        profiler.record("sample", us * 1000)
+    stats = profiler.stats()["sample"]
+    assert stats["count"] == 5
+    assert stats["window"] == 4
+    assert stats["last_us"] == 500
+    assert stats["mean_us"] == 350
+    assert stats["max_us"] == 500
+    assert sum(stats["histogram"].values()) == 4
+    assert profiler.summary() == [("sample", 500)]
+
+
+def test_dump_includes_extra_diagnostics(tmp_path):
+    profiler = TickProfiler()
+    profiler.record("paint", 2000)
+    path = tmp_path / "tick_profile.json"
+    extra = {"render": {"ticks": 3, "over_budget": 1}, "sampler": {"reads_saved": 12, "throttled_s": {"pause": 1.5, "low": 0.0}}}
+    profiler.dump(str(path), extra)
+    data = json.loads(path.read_text())
+    assert set(STAGES) <= set(data["stages"])
+    assert data["stages"]["paint"]["count"] == 1
+    assert data["render"] == extra["render"]
+    assert data["sampler"]["throttled_s"]["pause"] == 1.5
+
+
+def test_buckets_and_formatting():
+    assert bucket_for(0) == 0
+    assert bucket_for(3000) == 1
+    assert bucket_label(1) == "<4us"
+    assert format_duration(None) == "-"
+    assert format_duration(12500) == "12.5 ms"